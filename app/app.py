@@ -1,27 +1,70 @@
 """entrypoint"""
 import os
+import asyncio
+import functools
 import shutil
+import time
+import uuid
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
 from typing import Any
 
 import anyio
-from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
-from app.environments.env import DEFAULT_TEMP_DIR
+from app.environments.env import (DEFAULT_TEMP_DIR, JOB_CLEANUP_INTERVAL, JOB_STALE_TIMEOUT, JOB_TTL,
+                                  MAX_UPLOAD_SIZE, UPLOAD_CHUNK_SIZE, UPLOAD_HASH_ALGORITHM)
 from app.hwpx import make_sps_hwpx
-from app.parser import parser, project_yaml_parser
-from app.schema.web_api import SpsProject
-from app.util import create_random_named_folder, extract_zip
-from app.util.util import create_template_zip
+from app.hwpx.package import load_template_package
+from app.job import (JobProgress, JobQueueFullError, cleanup_expired_jobs, job_executor,
+                     read_job_status, read_project_from_zip, record_job_failure, run_sps_job,
+                     run_sps_pipeline, write_job_status)
+from app.job.result_cache import make_result_key, result_cache
+from app.parser.analysis_cache import analysis_cache
+from app.schema.enums import JobStage
+from app.schema.web_api import JobStatus
+from app.util import create_random_named_folder
+from app.util.ollama import get_descriptor
+from app.util.upload import UploadSizeLimitMiddleware, UploadTooLargeError, save_upload_file
 
-api = FastAPI()
+
+async def _cleanup_jobs_periodically() -> None:
+    while True:
+        await asyncio.sleep(JOB_CLEANUP_INTERVAL)
+        try:
+            removed = await anyio.to_thread.run_sync(cleanup_expired_jobs, DEFAULT_TEMP_DIR, JOB_TTL,
+                                                     JOB_STALE_TIMEOUT)
+            for path in removed:
+                print(f"만료된 작업 '{path}'을 삭제했습니다.")
+        except OSError as e:
+            print(f"만료 작업 정리 중 오류 발생: {e}")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    make_sps_hwpx.load_section0_template()
+    load_template_package()
+    get_descriptor().warmup()
+    cleanup_task = asyncio.create_task(_cleanup_jobs_periodically())
+    yield
+    cleanup_task.cancel()
+    job_executor.shutdown(wait=False)
+
+
+api = FastAPI(lifespan=lifespan)
+
+# 결과 캐시 키별로 실행 중인 파이프라인 (같은 업로드가 동시에 들어오면 공유)
+_inflight_results: dict[str, asyncio.Future] = {}
 api.mount("/static", StaticFiles(directory="static"), name="static")
+api.add_middleware(UploadSizeLimitMiddleware, max_size=MAX_UPLOAD_SIZE)
 
 
 def get(a, default=None) -> Any | None:
     return a if a is not None else default
 
+
 @api.get("/")
 async def get_upload_page() -> HTMLResponse:
     """HTML 파일 업로드 페이지 제공 함수
@@ -37,56 +80,256 @@ async def get_upload_page() -> HTMLResponse:
 
 @api.post("/uploadfile")
 async def upload_file_hwpx(
+    request: Request,
     file: UploadFile = File(...),
-) -> FileResponse:
+) -> Response:
+    """SPS 생성 함수
+    업로드된 아카이브로 hwpx를 생성하여 반환합니다.
+    같은 아카이브와 project.yaml로 만든 결과가 캐시에 있으면 파이프라인을 실행하지 않고 바로 반환하며,
+    캐시에 있는 결과는 ETag를 붙여 반환하고, If-None-Match가 일치하면 304를 반환합니다.
+    캐시에 저장하지 않은 결과(헤더 주석으로 대신한 설명이 있는 경우 등)에는 결과 키 ETag를 붙이지 않습니다.
+    """
     if file.filename is None:
         return FileResponse(path="", filename="default_filename")
 
-    os.makedirs(DEFAULT_TEMP_DIR, exist_ok=True)
-    os.makedirs("uploads", exist_ok=True)
+    target, file_location, archive_digest = await _save_upload(file)
+    save_as_location = f"{os.path.splitext(file.filename)[0]}.hwpx"
+
+    background_tasks = BackgroundTasks()
+    background_tasks.add_task(_delete_file, target)
+
+    headers = {"Content-Disposition": f"attachment; filename={save_as_location}"}
+    if archive_digest is not None:
+        headers["X-Archive-Digest"] = f"{UPLOAD_HASH_ALGORITHM}:{archive_digest}"
+
+    result_key = None
+    if archive_digest is not None and result_cache.enabled:
+        result_key = await anyio.to_thread.run_sync(_get_result_key, file_location,
+                                                    f"{UPLOAD_HASH_ALGORITHM}:{archive_digest}")
+    if (result_key is not None and _etag_matches(request.headers.get("if-none-match"), result_key)
+            and result_cache.get(result_key) is not None):
+        return Response(status_code=304, headers={"ETag": f'"{result_key}"'},
+                        background=background_tasks)
 
     try:
-        target = create_random_named_folder(DEFAULT_TEMP_DIR)
-    except OSError as e:
-        raise HTTPException(status_code=500, detail=f"{e}") from e
+        if result_key is None:
+            result = await job_executor.run(run_sps_pipeline, file_location, target, file.filename)
+            output_path = result.output_path
+        else:
+            output_path, cached = await _run_pipeline_shared(result_key, file_location, target, file.filename)
+            if cached:
+                headers["ETag"] = f'"{result_key}"'
+    except JobQueueFullError as e:
+        await anyio.to_thread.run_sync(_delete_file, target)
+        raise HTTPException(status_code=503, detail=f"{e}") from e
+    except Exception:
+        await anyio.to_thread.run_sync(_delete_file, target)
+        raise
 
-    file_location = f"{target}/{file.filename}"
-    directory_path = f"{target}/{os.path.splitext(file.filename)[0]}"
-    save_as_location = f"{os.path.splitext(file.filename)[0]}.hwpx"
+    return FileResponse(path=output_path,
+                        media_type="application/octet-stream",  # 또는 적절한 MIME 타입
+                        filename=f"{save_as_location}",
+                        headers=headers,
+                        background=background_tasks)
 
-    async with await anyio.open_file(file_location, "wb") as buffer:
-        await buffer.write(await file.read())
 
-    if file.filename.endswith(".zip"):
-        extract_zip(file_location, directory_path)
+def _get_result_key(file_location: str, archive_digest: str) -> str | None:
+    """업로드된 zip의 project.yaml을 읽어 결과 캐시 키를 만듭니다. project 파일이 없으면 None을 반환합니다."""
+    project = read_project_from_zip(file_location)
+    if project is None:
+        return None
+    return make_result_key(archive_digest, project)
 
-    # Create SpsRequest from form data
-    if os.path.exists(directory_path + "/project.yaml"):
-        project_filename = directory_path + "/project.yaml"
-    elif os.path.exists(directory_path + "/project.yml"):
-        project_filename = directory_path + "/project.yml"
+
+def _etag_matches(if_none_match: str | None, result_key: str) -> bool:
+    if if_none_match is None:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.removeprefix("W/").strip('"') == result_key:
+            return True
+    return False
+
+
+async def _run_pipeline_shared(result_key: str, file_location: str, target: str,
+                               filename: str) -> tuple[str, bool]:
+    """결과 캐시를 사용하는 파이프라인 실행 함수
+    캐시에 결과가 있으면 바로 반환하고, 같은 키의 요청이 이미 실행 중이면 그 결과를 기다려 함께 사용합니다.
+    직접 실행한 경우에는 결과를 캐시에 저장합니다. 단, LLM 설명 대신 헤더 주석을 사용한 파일이 있으면
+    (부하 조절, 서킷 브레이커, jobTimeout 등) 일시적인 결과이므로 저장하지 않습니다.
+
+    Returns:
+        tuple[str, bool]: hwpx 파일 경로와 캐시에 있는 결과인지 여부. 캐시에 있으면 캐시 경로를 반환합니다.
+    """
+    cached_path = result_cache.get(result_key)
+    if cached_path is not None:
+        return cached_path, True
+
+    inflight = _inflight_results.get(result_key)
+    if inflight is not None:
+        try:
+            cached_path = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # 먼저 실행한 요청이 취소된 경우에만 직접 실행
+            if not inflight.cancelled():
+                raise
+        if cached_path is not None:
+            return cached_path, True
+        return (await job_executor.run(run_sps_pipeline, file_location, target, filename)).output_path, False
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_results[result_key] = future
+    try:
+        result = await job_executor.run(run_sps_pipeline, file_location, target, filename)
+        output_path = result.output_path
+        cached_path = None
+        if result.fallback_descriptions == 0:
+            cached_path = await anyio.to_thread.run_sync(result_cache.put, result_key, output_path)
+        else:
+            print(f"헤더 주석으로 대신한 설명 {result.fallback_descriptions}개, 결과를 캐시에 저장하지 않음")
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # 기다리는 요청이 없어도 경고가 나지 않도록 확인 처리
+        raise
     else:
-        project_filename = None
+        # 캐시에 저장하지 못했으면 None을 전달하여 기다린 요청이 직접 실행하도록 함
+        future.set_result(cached_path)
+    finally:
+        _inflight_results.pop(result_key, None)
+    if cached_path is not None:
+        return cached_path, True
+    return output_path, False
+
+
+@api.post("/jobs", status_code=202)
+async def submit_job(
+    file: UploadFile = File(...),
+    draft: bool = False,
+) -> JobStatus:
+    """비동기 SPS 작업 제출 함수
+    업로드 파일을 저장하고 작업을 실행기에 제출한 뒤 바로 작업 상태를 반환합니다.
+    작업 결과는 GET /jobs/{job_id}로 진행 상황을 확인한 후 GET /jobs/{job_id}/result로 받습니다.
+    draft=true이면 헤더 주석 설명으로 만든 초안 hwpx를 먼저 기록하며(draft_result),
+    GET /jobs/{job_id}/result?draft=true로 받을 수 있습니다. 최종 hwpx는 설명 보강 후 기록됩니다.
+    """
+    if file.filename is None:
+        raise HTTPException(status_code=400, detail="파일 이름이 없습니다.")
 
-    if project_filename:
-        sps_project: SpsProject = project_yaml_parser.parse_sps_project(project_filename)
-        retval = parser.get_sps_data_csc(sps_project, directory_path)
+    target, file_location, _ = await _save_upload(file)
+
+    now = time.time()
+    status = JobStatus(job_id=os.path.basename(target), stage=JobStage.QUEUED,
+                       created_at=now, updated_at=now)
+    write_job_status(target, status)
+
+    try:
+        future = job_executor.submit(run_sps_job, file_location, target, file.filename,
+                                     JobProgress(target, status.model_copy()), draft)
+    except JobQueueFullError as e:
+        await anyio.to_thread.run_sync(_delete_file, target)
+        raise HTTPException(status_code=503, detail=f"{e}") from e
+    future.add_done_callback(functools.partial(_record_job_crash, target))
+    return status
+
+
+def _record_job_crash(target: str, future: Future) -> None:
+    """run_sps_job은 오류를 직접 기록하므로, 작업자 프로세스가 죽거나 작업이 취소된 경우만 실패로 기록합니다."""
+    if future.cancelled():
+        error = "작업이 취소되었습니다."
+    elif future.exception() is not None:
+        error = f"작업자가 비정상 종료되었습니다: {future.exception()!r}"
     else:
-        raise FileNotFoundError("project.yaml not found.")
-    
+        return
+    try:
+        record_job_failure(target, error)
+    except OSError as e:
+        print(f"'{target}' 작업 실패 기록 중 오류 발생: {e}")
 
-    make_sps_hwpx.make(retval, target)
-    create_template_zip(target, save_as_location)
 
-    background_tasks = BackgroundTasks()
-    background_tasks.add_task(_delete_file, target)
+@api.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> JobStatus:
+    """비동기 SPS 작업 상태 조회 함수"""
+    return _get_job_status(job_id)
 
-    return FileResponse(path=f"{target}/{save_as_location}",
-                        media_type="application/octet-stream",  # 또는 적절한 MIME 타입
-                        filename=f"{save_as_location}",
-                        headers={
-                            "Content-Disposition": f"attachment; filename={save_as_location}"},
-                        background=background_tasks)
+
+@api.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str, draft: bool = False) -> FileResponse:
+    """비동기 SPS 작업 결과(hwpx) 다운로드 함수
+    draft=true이면 초안 hwpx를 반환합니다. 초안은 설명 보강 중이거나 보강이 실패해도 받을 수 있습니다.
+    """
+    status = _get_job_status(job_id)
+    if draft:
+        if status.draft_result is None:
+            raise HTTPException(status_code=409, detail=f"초안이 아직 없습니다: {status.stage.value}")
+        return FileResponse(path=f"{DEFAULT_TEMP_DIR}/{job_id}/{status.draft_result}",
+                            media_type="application/octet-stream",
+                            filename=status.draft_result)
+    if status.stage is JobStage.FAILED:
+        raise HTTPException(status_code=409, detail=f"작업이 실패했습니다: {status.error}")
+    if status.stage is not JobStage.DONE or status.result is None:
+        raise HTTPException(status_code=409, detail=f"작업이 아직 완료되지 않았습니다: {status.stage.value}")
+
+    return FileResponse(path=f"{DEFAULT_TEMP_DIR}/{job_id}/{status.result}",
+                        media_type="application/octet-stream",
+                        filename=status.result)
+
+
+@api.get("/cache/stats")
+async def get_cache_stats() -> dict[str, int]:
+    """파일 분석 결과 캐시의 적중/실패 횟수와 항목 수 조회 함수"""
+    return await anyio.to_thread.run_sync(analysis_cache.stats)
+
+
+@api.get("/ollama/backends")
+async def get_ollama_backends() -> list[dict]:
+    """Ollama 백엔드별 상태와 요청 수 조회 함수 (진단용)
+    작업 실행기가 프로세스 풀이면 이 프로세스에서 보낸 요청만 집계됩니다.
+    """
+    return get_descriptor().backend_stats()
+
+
+@api.get("/ollama/metrics")
+async def get_ollama_metrics() -> dict:
+    """최근 Ollama 요청의 첫 토큰 시간(ttft)과 전체 생성 시간 조회 함수 (진단용)
+    작업 실행기가 프로세스 풀이면 이 프로세스에서 보낸 요청만 집계됩니다.
+    """
+    return get_descriptor().generation_metrics()
+
+
+def _get_job_status(job_id: str) -> JobStatus:
+    try:
+        uuid.UUID(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.") from e
+
+    status = read_job_status(f"{DEFAULT_TEMP_DIR}/{job_id}")
+    if status is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return status
+
+
+async def _save_upload(file: UploadFile) -> tuple[str, str, str | None]:
+    """업로드 파일을 새 작업 폴더에 저장하고 (작업 폴더, 파일 경로, 해시)를 반환합니다."""
+    os.makedirs(DEFAULT_TEMP_DIR, exist_ok=True)
+    os.makedirs("uploads", exist_ok=True)
+
+    try:
+        target = create_random_named_folder(DEFAULT_TEMP_DIR)
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"{e}") from e
+
+    file_location = f"{target}/{file.filename}"
+    try:
+        _, archive_digest = await save_upload_file(file, file_location,
+                                                   UPLOAD_CHUNK_SIZE, MAX_UPLOAD_SIZE,
+                                                   UPLOAD_HASH_ALGORITHM)
+    except UploadTooLargeError as e:
+        await anyio.to_thread.run_sync(_delete_file, target)
+        raise HTTPException(status_code=413, detail=f"{e}") from e
+    return target, file_location, archive_digest
 
 
 def _delete_file(path: str) -> None:
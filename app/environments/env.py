@@ -1,3 +1,48 @@
 '''environments'''
+import os
 
 DEFAULT_TEMP_DIR = 'temp'
+
+# 업로드 설정
+UPLOAD_CHUNK_SIZE = int(os.environ.get('SPS_UPLOAD_CHUNK_SIZE', 1024 * 1024))       # 1MB
+MAX_UPLOAD_SIZE = int(os.environ.get('SPS_MAX_UPLOAD_SIZE', 2 * 1024 ** 3))         # 2GB
+UPLOAD_HASH_ALGORITHM = os.environ.get('SPS_UPLOAD_HASH_ALGORITHM', 'sha256')       # 빈 문자열이면 계산하지 않음
+
+# 작업 실행기 설정
+JOB_EXECUTOR = os.environ.get('SPS_JOB_EXECUTOR', 'thread')                          # thread 또는 process
+JOB_WORKERS = int(os.environ.get('SPS_JOB_WORKERS', 2))                             # 동시에 실행할 작업 수
+JOB_QUEUE_SIZE = int(os.environ.get('SPS_JOB_QUEUE_SIZE', 8))                       # 대기 가능한 작업 수
+
+# 비동기 작업 설정
+JOB_TTL = int(os.environ.get('SPS_JOB_TTL', 60 * 60))                               # 완료된 작업 보관 시간 (초)
+JOB_CLEANUP_INTERVAL = int(os.environ.get('SPS_JOB_CLEANUP_INTERVAL', 60))          # 만료 작업 정리 주기 (초)
+JOB_STALE_TIMEOUT = int(os.environ.get('SPS_JOB_STALE_TIMEOUT', 60 * 60))           # 상태가 갱신되지 않으면 실패로 볼 시간 (초, 0이면 끔)
+
+# 파일 분석 병렬 처리 설정
+PARSER_WORKERS = int(os.environ.get('SPS_PARSER_WORKERS', 1))                       # 1 이하이면 순차 처리
+PARSER_EXECUTOR = os.environ.get('SPS_PARSER_EXECUTOR', 'process')                  # thread 또는 process
+PARSER_BATCHES_PER_WORKER = int(os.environ.get('SPS_PARSER_BATCHES_PER_WORKER', 4)) # 작업자당 batch 수
+
+# 파일 분석 설정
+FILE_MMAP_THRESHOLD = int(os.environ.get('SPS_FILE_MMAP_THRESHOLD', 8 * 1024 * 1024))  # 이 크기 이상은 mmap 사용
+HASH_BUFFER_SIZE = int(os.environ.get('SPS_HASH_BUFFER_SIZE', 1024 * 1024))          # 해시 계산 읽기 버퍼 크기
+HEADER_COMMENT_MAX_BYTES = int(os.environ.get('SPS_HEADER_COMMENT_MAX_BYTES', 64 * 1024))  # 헤더 주석을 찾을 파일 앞부분 크기
+
+# 파일 분석 결과 캐시 설정
+ANALYSIS_CACHE_DIR = os.environ.get('SPS_ANALYSIS_CACHE_DIR', 'cache')               # 빈 문자열이면 캐시를 사용하지 않음
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get('SPS_ANALYSIS_CACHE_MAX_ENTRIES', 100000))  # 최대 보관 항목 수 (LRU)
+
+# SPS 결과(hwpx) 캐시 설정
+RESULT_CACHE_DIR = os.environ.get('SPS_RESULT_CACHE_DIR', 'cache/results')           # 빈 문자열이면 캐시를 사용하지 않음
+RESULT_CACHE_MAX_SIZE = int(os.environ.get('SPS_RESULT_CACHE_MAX_SIZE', 1024 ** 3))  # 최대 보관 크기 (LRU, 1GB)
+
+# 설명 생성 설정
+DESCRIPTION_RULES = int(os.environ.get('SPS_DESCRIPTION_RULES', 1))                   # 0이면 규칙 기반 설명을 사용하지 않음
+SIMILARITY_MAX_DISTANCE = int(os.environ.get('SPS_SIMILARITY_MAX_DISTANCE', 3))         # 비슷한 파일로 볼 SimHash 해밍 거리 (음수이면 같은 파일만)
+
+# 설명 생성 부하 조절 설정 (0이면 해당 기준을 사용하지 않음)
+SHED_QUEUE_REDUCE = int(os.environ.get('SPS_SHED_QUEUE_REDUCE', 4))                 # 이 작업 수 이상이면 헤더 주석이 없는 파일만 LLM 요청
+SHED_QUEUE_SHED = int(os.environ.get('SPS_SHED_QUEUE_SHED', 8))                     # 이 작업 수 이상이면 LLM 요청 중단
+SHED_LATENCY_REDUCE = float(os.environ.get('SPS_SHED_LATENCY_REDUCE', 10))          # Ollama 평균 응답 시간(초) 기준
+SHED_LATENCY_SHED = float(os.environ.get('SPS_SHED_LATENCY_SHED', 20))
+SHED_RECOVER_RATIO = float(os.environ.get('SPS_SHED_RECOVER_RATIO', 0.8))           # 기준의 이 비율 아래로 내려가면 단계를 낮춤
\ No newline at end of file
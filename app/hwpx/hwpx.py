@@ -1,3 +1,4 @@
+import copy
 import xml.etree.ElementTree as ET
 from typing import List
 
@@ -5,13 +6,17 @@ from typing import List
 class HWPXMLBuilder:
     """HWP XML 문서 빌더 라이브러리"""
 
-    def __init__(self, base_xml_path: str):
+    def __init__(self, base_xml_path: str = "", template: ET.Element | None = None):
         """
         초기화
         Args:
             base_xml_path: 기본 XML 파일 경로 (section0.xml과 같은)
+            template: 미리 파싱해 둔 기본 XML 루트 요소. 지정하면 복제해서 사용하며 원본은 변경하지 않습니다.
         """
-        if base_xml_path:
+        if template is not None:
+            self.root = copy.deepcopy(template)
+            self.tree = ET.ElementTree(self.root)
+        elif base_xml_path:
             self.tree = ET.parse(base_xml_path)
             self.root = self.tree.getroot()
         else:
@@ -816,13 +821,23 @@ class HWPXMLBuilder:
 
         self.root.append(p_elem)
 
-    def save(self, output_path: str):
-        """XML 파일로 저장"""
-        # XML 선언과 네임스페이스 처리
+    def _register_namespaces(self) -> None:
+        """XML 직렬화에 사용할 네임스페이스 접두사 등록"""
         ET.register_namespace(
             'hs', 'http://www.hancom.co.kr/hwpml/2011/section')
         ET.register_namespace(
             'hp', 'http://www.hancom.co.kr/hwpml/2011/paragraph')
         ET.register_namespace('hc', 'http://www.hancom.co.kr/hwpml/2011/core')
 
+    def save(self, output_path: str):
+        """XML 파일로 저장"""
+        # XML 선언과 네임스페이스 처리
+        self._register_namespaces()
+
         self.tree.write(output_path, encoding='UTF-8', xml_declaration=True)
+
+    def to_bytes(self) -> bytes:
+        """XML 문서를 bytes로 반환 (save()와 같은 내용)"""
+        self._register_namespaces()
+
+        return ET.tostring(self.root, encoding='UTF-8', xml_declaration=True)
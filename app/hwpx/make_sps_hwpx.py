@@ -1,10 +1,25 @@
+import xml.etree.ElementTree as ET
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List
 from app.hwpx import HWPXMLBuilder
 from app.schema.filedata import FileData, FileType
 
 
-builder = HWPXMLBuilder("./resources/section0.xml")
+SECTION0_TEMPLATE_PATH = "./resources/section0.xml"
+
+
+@lru_cache(maxsize=1)
+def load_section0_template() -> ET.Element:
+    """section0.xml 템플릿을 한 번만 파싱하여 루트 요소를 반환합니다.
+    반환된 요소는 여러 작업이 공유하므로 직접 수정하지 말고 new_builder()로 복제해서 사용합니다.
+    """
+    return ET.parse(SECTION0_TEMPLATE_PATH).getroot()
+
+
+def new_builder() -> HWPXMLBuilder:
+    """캐시된 section0.xml 템플릿을 복제한 작업 전용 빌더를 생성합니다."""
+    return HWPXMLBuilder(template=load_section0_template())
 
 
 def _get_exe_list(files: list[FileData]) -> List[List[str]]:
@@ -71,7 +86,9 @@ def group_by_csu(file_data_list: List[FileData]) -> Dict[str, List[FileData]]:
     return dict(grouped)
 
 
-def make(file_data_list: List[FileData], path: str) -> None:
+def make(file_data_list: List[FileData]) -> bytes:
+    """파일 목록으로 section0.xml 문서를 생성하여 bytes로 반환합니다."""
+    builder = new_builder()
     device = file_data_list[0].device
 
     exe_files = sorted(
@@ -147,4 +164,4 @@ def make(file_data_list: List[FileData], path: str) -> None:
 
     builder.add_empty_paragraph()
     builder.add_empty_paragraph()
-    builder.save(f'{path}/section0.xml')
+    return builder.to_bytes()
@@ -0,0 +1,52 @@
+"""hwpx 패키지 생성 모듈
+resources/template의 정적 항목은 프로세스당 한 번만 압축해 두고,
+작업마다 생성된 Contents/section0.xml만 새로 압축하여 추가합니다.
+"""
+import os
+import zipfile
+from functools import lru_cache
+from io import BytesIO
+
+TEMPLATE_DIR = "./resources/template"
+MIMETYPE_ARCNAME = "mimetype"
+SECTION0_ARCNAME = "Contents/section0.xml"
+
+
+@lru_cache(maxsize=1)
+def load_template_package() -> bytes:
+    """템플릿 폴더를 압축한 zip 데이터를 반환합니다.
+    hwpx(OCF) 규칙에 따라 mimetype을 첫 항목으로 압축하지 않고 저장하며,
+    section0.xml은 작업마다 추가하므로 제외합니다.
+
+    Returns:
+        bytes: 정적 템플릿 항목만 담긴 zip 데이터.
+    """
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        zipf.write(os.path.join(TEMPLATE_DIR, MIMETYPE_ARCNAME), MIMETYPE_ARCNAME,
+                   compress_type=zipfile.ZIP_STORED)
+        for root, dirs, files in os.walk(TEMPLATE_DIR):
+            dirs.sort()
+            for file in sorted(files):
+                file_path = os.path.join(root, file)
+                arcname = os.path.relpath(file_path, TEMPLATE_DIR).replace(os.sep, "/")
+                if arcname in (MIMETYPE_ARCNAME, SECTION0_ARCNAME):
+                    continue
+                zipf.write(file_path, arcname)
+    return buffer.getvalue()
+
+
+def write_hwpx_package(section0_xml: bytes, output_path: str) -> None:
+    """hwpx 파일 생성 함수
+    미리 압축해 둔 템플릿 zip을 그대로 기록한 뒤 section0.xml 항목만 추가합니다.
+    기존 항목은 다시 압축하지 않습니다.
+
+    Args:
+        section0_xml (bytes): 생성된 section0.xml 내용.
+        output_path (str): 생성할 hwpx 파일 경로.
+    """
+    with open(output_path, 'w+b') as f:
+        f.write(load_template_package())
+        f.seek(0)
+        with zipfile.ZipFile(f, 'a', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr(SECTION0_ARCNAME, section0_xml)
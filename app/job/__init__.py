@@ -0,0 +1,3 @@
+from .executor import JobExecutor, JobQueueFullError, job_executor
+from .pipeline import PipelineResult, read_project_from_zip, run_sps_job, run_sps_pipeline
+from .status import JobProgress, cleanup_expired_jobs, read_job_status, record_job_failure, write_job_status
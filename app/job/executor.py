@@ -0,0 +1,111 @@
+"""작업 실행기 모듈"""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.environments.env import JOB_EXECUTOR, JOB_QUEUE_SIZE, JOB_WORKERS
+from app.util.load_shedding import load_shedder
+
+# 프로세스 풀 작업자에서 본 실행 중/대기 중 작업 수 (부모 프로세스와 공유)
+_worker_pending = None
+
+
+def _init_worker(shared_pending) -> None:
+    """프로세스 풀 작업자 초기화 함수. 부모의 작업 수 카운터를 연결합니다."""
+    global _worker_pending
+    _worker_pending = shared_pending
+
+
+class JobQueueFullError(Exception):
+    """작업 대기열이 가득 찬 경우 발생하는 예외"""
+
+
+class JobExecutor:
+    """SPS 작업 실행기
+    CPU/IO 작업을 스레드 또는 프로세스 풀에서 실행하여 이벤트 루프가 막히지 않도록 합니다.
+    실행 중인 작업과 대기 중인 작업의 합이 max_workers + max_queue를 넘으면
+    JobQueueFullError를 발생시킵니다.
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_queue: int) -> None:
+        """
+        초기화
+        Args:
+            kind: 풀 종류 ("thread" 또는 "process")
+            max_workers: 동시에 실행할 작업 수
+            max_queue: 실행을 기다릴 수 있는 작업 수
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._shared_pending = multiprocessing.Value("i", 0) if kind == "process" else None
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 대기 중인 작업 수
+        프로세스 풀 작업자 안에서 호출하면 부모 프로세스의 작업 수를 반환합니다.
+        """
+        if _worker_pending is not None:
+            return _worker_pending.value
+        return self._pending
+
+    def _set_pending(self, delta: int) -> None:
+        self._pending += delta
+        if self._shared_pending is not None:
+            self._shared_pending.value = self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     initializer=_init_worker,
+                                                     initargs=(self._shared_pending,))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="sps-job")
+        return self._executor
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._set_pending(-1)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """작업을 풀에 제출합니다.
+
+        Raises:
+            JobQueueFullError: 대기열이 가득 찬 경우
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                raise JobQueueFullError("작업 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+            executor = self._get_executor()
+            self._set_pending(1)
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """작업을 풀에서 실행하고 결과를 기다립니다."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀을 종료합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+job_executor = JobExecutor(JOB_EXECUTOR, JOB_WORKERS, JOB_QUEUE_SIZE)
+load_shedder.queue_depth = lambda: job_executor.pending
@@ -0,0 +1,163 @@
+"""SPS 생성 파이프라인 모듈"""
+import os
+import zipfile
+from collections import Counter
+from typing import NamedTuple
+
+from app.hwpx import make_sps_hwpx
+from app.hwpx.package import write_hwpx_package
+from app.job.status import JobProgress
+from app.parser import parser, project_yaml_parser
+from app.schema.enums import JobStage
+from app.schema.web_api import SpsProject
+from app.util import extract_zip
+
+# LLM 설명 대신 헤더 주석을 사용한 설명 출처 (오류, 제한 시간 초과, 서킷 브레이커, 부하 조절, 보강 실패)
+FALLBACK_SOURCES = ("header", "reduced", "shed", "draft")
+
+
+class PipelineResult(NamedTuple):
+    """파이프라인 실행 결과"""
+    output_path: str
+    # LLM 설명을 받지 못해 헤더 주석을 사용한 파일 수 (0이 아니면 결과를 캐시에 저장하지 않음)
+    fallback_descriptions: int
+
+
+def find_project_file(directory_path: str) -> str | None:
+    """압축 해제된 디렉토리에서 project.yaml(.yml) 파일 경로를 찾습니다.
+
+    Args:
+        directory_path (str): 압축 해제된 디렉토리 경로.
+
+    Returns:
+        str | None: project 파일 경로. 없으면 None을 반환합니다.
+    """
+    for name in ("project.yaml", "project.yml"):
+        project_filename = f"{directory_path}/{name}"
+        if os.path.exists(project_filename):
+            return project_filename
+    return None
+
+
+def read_project_from_zip(zip_path: str) -> SpsProject | None:
+    """압축을 풀지 않고 zip 최상위의 project.yaml(.yml)을 읽어 SpsProject로 반환합니다.
+
+    Args:
+        zip_path (str): 업로드된 zip 파일 경로.
+
+    Returns:
+        SpsProject | None: 프로젝트 정보. zip이 아니거나 project 파일이 없거나 잘못된 경우 None을 반환합니다.
+    """
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            names = set(zip_ref.namelist())
+            for name in ("project.yaml", "project.yml"):
+                if name in names:
+                    return project_yaml_parser.parse_sps_project_text(zip_ref.read(name))
+    except Exception as e:
+        print(f"'{zip_path}' project 파일 읽기 중 오류 발생: {e}")
+        return None
+    return None
+
+
+def run_sps_pipeline(file_location: str,
+                     target: str,
+                     filename: str,
+                     progress: JobProgress | None = None,
+                     draft: bool = False) -> PipelineResult:
+    """SPS 생성 파이프라인 실행 함수
+    업로드된 파일의 압축 해제, 파일 분석, section0.xml 생성, hwpx 압축까지 수행합니다.
+    CPU/IO 작업이 많으므로 이벤트 루프가 아닌 작업 실행기(JobExecutor)에서 호출해야 합니다.
+
+    draft가 True이면 LLM 설명을 기다리지 않고 헤더 주석 설명으로 초안 hwpx를 먼저 만들어
+    진행 상황에 기록한 뒤, 설명만 LLM 설명으로 보강하여 최종 hwpx를 다시 만듭니다.
+    보강 단계에서는 체크섬과 LOC를 다시 계산하지 않습니다.
+
+    Args:
+        file_location (str): 업로드된 파일 경로.
+        target (str): 작업 폴더 경로.
+        filename (str): 업로드된 파일 이름.
+        progress (JobProgress | None): 진행 상황 기록기. 비동기 작업(/jobs)에서만 사용합니다.
+        draft (bool): 초안 hwpx를 먼저 만드는 두 단계 생성 여부.
+
+    Returns:
+        PipelineResult: 생성된 hwpx 파일 경로와 헤더 주석으로 대신한 설명 수.
+            Ollama를 사용할 수 없었던 경우에도 헤더 주석을 사용하므로 0이 아닙니다.
+
+    Raises:
+        FileNotFoundError: project.yaml 파일이 없는 경우
+    """
+    directory_path = f"{target}/{os.path.splitext(filename)[0]}"
+    save_as_location = f"{os.path.splitext(filename)[0]}.hwpx"
+
+    if progress is not None:
+        progress.stage(JobStage.EXTRACTING)
+    if filename.endswith(".zip"):
+        extract_zip(file_location, directory_path)
+
+    project_filename = find_project_file(directory_path)
+    if project_filename is None:
+        raise FileNotFoundError("project.yaml not found.")
+
+    sps_project: SpsProject = project_yaml_parser.parse_sps_project(project_filename)
+    if progress is not None:
+        progress.stage(JobStage.ANALYZING)
+    saved_calls: Counter = Counter()
+    drafts: list[parser.DraftDescription] | None = [] if draft else None
+    retval = parser.get_sps_data_csc(sps_project, directory_path, progress,
+                                     saved_calls=saved_calls, drafts=drafts)
+
+    if progress is not None:
+        _record_saved_calls(progress, saved_calls, retval)
+
+    if drafts is not None:
+        draft_location = f"{os.path.splitext(filename)[0]}.draft.hwpx"
+        if progress is not None:
+            progress.stage(JobStage.BUILDING)
+        _build_hwpx(retval, f"{target}/{draft_location}")
+        if progress is not None:
+            progress.draft_done(draft_location)
+
+        enriched = parser.enrich_descriptions(drafts, progress, saved_calls)
+        if progress is not None:
+            _record_saved_calls(progress, saved_calls, retval)
+            progress.status.enriched_descriptions = enriched
+
+    if progress is not None:
+        progress.stage(JobStage.BUILDING)
+    _build_hwpx(retval, f"{target}/{save_as_location}")
+    fallbacks = sum(1 for data in retval if data.descriptionSource in FALLBACK_SOURCES)
+    return PipelineResult(f"{target}/{save_as_location}", fallbacks)
+
+
+def _record_saved_calls(progress: JobProgress, saved_calls: Counter, files: list) -> None:
+    """LLM 호출 없이 설명을 정한 파일 수, 적용된 부하 조절 단계, 설명 출처별 파일 수를 작업 상태에 기록합니다."""
+    progress.status.description_sources = dict(Counter(data.descriptionSource for data in files))
+    progress.status.reused_descriptions = saved_calls["exact"] + saved_calls["near"]
+    progress.status.rule_descriptions = saved_calls["rule"]
+    progress.status.shed_descriptions = saved_calls["reduced"] + saved_calls["shed"]
+    for level in ("shed", "reduced"):
+        if saved_calls[level]:
+            progress.status.degradation = level
+            break
+
+
+def _build_hwpx(files: list, output_path: str) -> None:
+    """파일 목록으로 section0.xml을 만들고 hwpx로 압축합니다."""
+    section0_xml = make_sps_hwpx.make(files)
+    write_hwpx_package(section0_xml, output_path)
+
+
+def run_sps_job(file_location: str, target: str, filename: str, progress: JobProgress,
+                draft: bool = False) -> None:
+    """비동기 작업(/jobs) 실행 함수
+    파이프라인을 실행하고 결과 또는 오류를 작업 상태 파일에 기록합니다.
+    draft가 True이면 초안 hwpx를 먼저 기록한 뒤 설명을 보강한 최종 hwpx를 기록합니다.
+    """
+    try:
+        output_path = run_sps_pipeline(file_location, target, filename, progress, draft).output_path
+    except Exception as e:
+        print(f"'{target}' 작업 처리 중 오류 발생: {e}")
+        progress.failed(f"{e}")
+        return
+    progress.done(os.path.basename(output_path))
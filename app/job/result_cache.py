@@ -0,0 +1,127 @@
+"""SPS 결과 캐시 모듈
+업로드 파일 해시와 project.yaml 내용을 키로 생성된 hwpx 파일을 디스크에 보관합니다.
+같은 아카이브가 다시 올라오면 파이프라인을 실행하지 않고 저장된 hwpx를 바로 반환합니다.
+
+- 파일의 수정 시간을 마지막 사용 시간으로 사용하며,
+  전체 크기가 max_size를 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다(LRU).
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from app.environments.env import RESULT_CACHE_DIR, RESULT_CACHE_MAX_SIZE
+from app.parser.parser import ANALYZER_VERSION
+from app.schema.web_api import SpsProject
+from app.util.ollama import get_descriptor
+
+RESULT_SUFFIX = ".hwpx"
+
+
+def make_result_key(archive_digest: str, project: SpsProject) -> str:
+    """결과 캐시 키(ETag로도 사용)를 만듭니다.
+    아카이브 해시, 정규화된 프로젝트 정보, 분석기 버전, 설명 생성 모델을 포함합니다.
+
+    Args:
+        archive_digest (str): 업로드하면서 계산한 아카이브 해시 ("알고리즘:16진수").
+        project (SpsProject): 아카이브의 project.yaml 내용.
+
+    Returns:
+        str: 16진수 캐시 키.
+    """
+    descriptor = get_descriptor()
+    model = descriptor.model if descriptor.is_connectable else ""
+    payload = json.dumps({
+        "archive": archive_digest,
+        "project": project.model_dump(mode="json"),
+        "analyzer": ANALYZER_VERSION,
+        "model": model,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """SPS 결과(hwpx) 캐시
+    directory가 빈 문자열이면 캐시를 사용하지 않습니다.
+    """
+
+    def __init__(self, directory: str = RESULT_CACHE_DIR, max_size: int = RESULT_CACHE_MAX_SIZE) -> None:
+        """
+        초기화
+        Args:
+            directory: hwpx 파일을 보관할 디렉토리. 빈 문자열이면 캐시를 끕니다.
+            max_size: 보관할 전체 파일 크기 (바이트 단위).
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory) and self.max_size > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + RESULT_SUFFIX)
+
+    def get(self, key: str) -> str | None:
+        """캐시된 hwpx 파일 경로를 반환하고 마지막 사용 시간을 갱신합니다. 없으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, source_path: str) -> str | None:
+        """생성된 hwpx 파일을 캐시에 복사하고 캐시 경로를 반환합니다.
+        파일 하나가 max_size보다 크면 저장하지 않고 None을 반환합니다.
+        """
+        if not self.enabled or os.path.getsize(source_path) > self.max_size:
+            return None
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"결과 캐시 저장 중 오류 발생: {e}")
+            return None
+        self.evict()
+        return path
+
+    def evict(self) -> list[str]:
+        """전체 크기가 max_size 이하가 될 때까지 오래 사용하지 않은 파일부터 삭제합니다.
+
+        Returns:
+            list[str]: 삭제된 파일 경로 목록.
+        """
+        removed = []
+        with self._lock:
+            entries = []
+            try:
+                with os.scandir(self.directory) as scandir_it:
+                    for entry in scandir_it:
+                        if entry.is_file() and entry.name.endswith(RESULT_SUFFIX):
+                            st = entry.stat()
+                            entries.append((st.st_mtime, st.st_size, entry.path))
+            except FileNotFoundError:
+                return removed
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed.append(path)
+        return removed
+
+
+result_cache = ResultCache()
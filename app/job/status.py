@@ -0,0 +1,140 @@
+"""비동기 작업 상태 관리 모듈
+작업 상태는 작업 폴더(target)의 job.json 파일에 기록하므로
+스레드 풀과 프로세스 풀 어느 쪽에서 실행해도 같은 방식으로 조회할 수 있습니다.
+"""
+import os
+import shutil
+import time
+
+from app.schema.enums import JobStage
+from app.schema.web_api import JobStatus
+
+STATUS_FILENAME = "job.json"
+
+
+def read_job_status(target: str) -> JobStatus | None:
+    """작업 폴더의 상태 파일을 읽습니다.
+
+    Args:
+        target (str): 작업 폴더 경로.
+
+    Returns:
+        JobStatus | None: 작업 상태. 상태 파일이 없으면 None을 반환합니다.
+    """
+    try:
+        with open(os.path.join(target, STATUS_FILENAME), "r", encoding="utf-8") as f:
+            return JobStatus.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def write_job_status(target: str, status: JobStatus) -> None:
+    """작업 상태를 작업 폴더에 기록합니다.
+    읽는 쪽에서 중간 상태를 보지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    """
+    status.updated_at = time.time()
+    status_path = os.path.join(target, STATUS_FILENAME)
+    temp_path = status_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(status.model_dump_json())
+    os.replace(temp_path, status_path)
+
+
+class JobProgress:
+    """작업 진행 상황 기록기
+    파이프라인이 단계와 파일 처리 개수를 알려주면 상태 파일을 갱신합니다.
+    파일 단위 갱신은 min_interval 초에 한 번만 기록합니다.
+    """
+
+    def __init__(self, target: str, status: JobStatus, min_interval: float = 0.5) -> None:
+        self.target = target
+        self.status = status
+        self.min_interval = min_interval
+        self._last_write = 0.0
+
+    def stage(self, stage: JobStage) -> None:
+        """작업 단계를 변경합니다."""
+        self.status.stage = stage
+        write_job_status(self.target, self.status)
+        self._last_write = time.monotonic()
+
+    def __call__(self, processed: int, total: int) -> None:
+        """파일 처리 개수를 갱신합니다."""
+        self.status.processed_files = processed
+        self.status.total_files = total
+        now = time.monotonic()
+        if processed == total or now - self._last_write >= self.min_interval:
+            write_job_status(self.target, self.status)
+            self._last_write = now
+
+    def draft_done(self, draft_result: str) -> None:
+        """초안 hwpx 생성 완료를 기록합니다. 이후 설명 보강 단계로 넘어갑니다."""
+        self.status.draft_result = draft_result
+        self.stage(JobStage.ENRICHING)
+
+    def done(self, result: str) -> None:
+        """작업 완료를 기록합니다."""
+        self.status.result = result
+        self.status.finished_at = time.time()
+        self.stage(JobStage.DONE)
+
+    def failed(self, error: str) -> None:
+        """작업 실패를 기록합니다."""
+        self.status.error = error
+        self.status.finished_at = time.time()
+        self.stage(JobStage.FAILED)
+
+
+def record_job_failure(target: str, error: str) -> bool:
+    """끝나지 않은 작업을 실패로 기록합니다. 작업자가 죽거나 취소되어 작업이 스스로 기록하지 못한 경우에 사용합니다.
+
+    Args:
+        target (str): 작업 폴더 경로.
+        error (str): 오류 내용.
+
+    Returns:
+        bool: 실패로 기록했으면 True. 상태 파일이 없거나 이미 끝난 작업이면 False.
+    """
+    status = read_job_status(target)
+    if status is None or status.finished_at is not None:
+        return False
+    status.error = error
+    status.finished_at = time.time()
+    status.stage = JobStage.FAILED
+    write_job_status(target, status)
+    return True
+
+
+def cleanup_expired_jobs(base_path: str, ttl: float, stale_timeout: float = 0) -> list[str]:
+    """완료 또는 실패 후 ttl 초가 지난 작업 폴더를 삭제합니다.
+    상태 파일이 없는 폴더(/uploadfile 요청 처리 중인 폴더)는 건드리지 않습니다.
+    끝나지 않은 작업의 상태가 stale_timeout 초 동안 갱신되지 않으면 (서버 재시작 등으로 작업이 사라진 경우)
+    실패로 기록하며, 이후 ttl이 지나면 삭제됩니다.
+
+    Args:
+        base_path (str): 작업 폴더들의 기준 경로.
+        ttl (float): 작업 결과 보관 시간 (초 단위).
+        stale_timeout (float): 끝나지 않은 작업을 실패로 볼 상태 미갱신 시간 (초 단위, 0이면 사용하지 않음).
+
+    Returns:
+        list[str]: 삭제된 작업 폴더 경로 목록.
+    """
+    removed = []
+    if not os.path.isdir(base_path):
+        return removed
+
+    now = time.time()
+    for entry in os.scandir(base_path):
+        if not entry.is_dir():
+            continue
+        status = read_job_status(entry.path)
+        if status is None:
+            continue
+        if status.finished_at is None:
+            if stale_timeout > 0 and now - status.updated_at >= stale_timeout:
+                record_job_failure(entry.path, f"작업 상태가 {stale_timeout:g}초 동안 갱신되지 않아 중단되었습니다.")
+            continue
+        if now - status.finished_at >= ttl:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed.append(entry.path)
+    return removed
@@ -0,0 +1,182 @@
+"""파일 분석 결과 캐시 모듈
+파일 내용 해시를 키로 LOC(이미지는 해상도)와 설명을 SQLite 파일에 저장하여
+같은 파일이 다시 올라오면 분석(특히 Ollama 설명 생성)을 건너뜁니다.
+
+- max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다(LRU).
+  항목 수는 트리거로 세어 두고, 넘었을 때만 max_entries의 1%를 더해 한 번에 삭제합니다.
+- 조회는 쓰기 트랜잭션 없이 읽고, 사용 시각(last_used)과 적중/실패 횟수는 모아 두었다가
+  FLUSH_BATCH건 또는 FLUSH_INTERVAL초마다 한 번에 기록합니다. (put, stats, close 때도 기록)
+- 적중/실패 횟수는 DB에 함께 기록하므로 프로세스 풀 작업자의 통계도 합산됩니다.
+- 연결은 스레드(및 프로세스)마다 따로 엽니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+from app.environments.env import ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_MAX_ENTRIES
+
+ANALYSIS_CACHE_FILENAME = "analysis.sqlite3"
+
+# 조회 기록(last_used, 적중/실패 횟수)을 모아 두는 최대 건수와 시간 (초)
+FLUSH_BATCH = 256
+FLUSH_INTERVAL = 1.0
+# 항목 수가 max_entries를 넘으면 max_entries의 이 비율만큼 더 삭제하여 삭제 횟수를 줄임
+EVICT_SLACK = 0.01
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    key TEXT PRIMARY KEY,
+    loc TEXT NOT NULL,
+    description TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS analysis_last_used ON analysis (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters (name, value) VALUES ('hits', 0), ('misses', 0);
+INSERT OR IGNORE INTO counters (name, value) VALUES ('entries', (SELECT COUNT(*) FROM analysis));
+CREATE TRIGGER IF NOT EXISTS analysis_insert AFTER INSERT ON analysis BEGIN
+    UPDATE counters SET value = value + 1 WHERE name = 'entries';
+END;
+CREATE TRIGGER IF NOT EXISTS analysis_delete AFTER DELETE ON analysis BEGIN
+    UPDATE counters SET value = value - 1 WHERE name = 'entries';
+END;
+"""
+
+
+class AnalysisCache:
+    """파일 분석 결과 캐시
+    directory가 빈 문자열이면 캐시를 사용하지 않습니다(get은 항상 None, put은 무시).
+    """
+
+    def __init__(self, directory: str = ANALYSIS_CACHE_DIR,
+                 max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES) -> None:
+        """
+        초기화
+        Args:
+            directory: 캐시 DB를 저장할 디렉토리. 빈 문자열이면 캐시를 끕니다.
+            max_entries: 보관할 최대 항목 수.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.path = os.path.join(directory, ANALYSIS_CACHE_FILENAME) if directory else ""
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.max_entries > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결을 반환합니다. fork된 작업자에서는 새로 엽니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        os.makedirs(self.directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        self._reset_pending()
+        return conn
+
+    def _reset_pending(self) -> None:
+        self._local.touched = {}
+        self._local.hits = 0
+        self._local.misses = 0
+        self._local.flushed_at = time.monotonic()
+
+    def _write_pending(self, conn: sqlite3.Connection) -> None:
+        """모아 둔 조회 기록을 씁니다. 쓰기 트랜잭션 안에서 호출합니다."""
+        local = self._local
+        if local.touched:
+            conn.executemany("UPDATE analysis SET last_used = ? WHERE key = ?",
+                             [(used, key) for key, used in local.touched.items()])
+        if local.hits or local.misses:
+            conn.executemany("UPDATE counters SET value = value + ? WHERE name = ?",
+                             [(local.hits, "hits"), (local.misses, "misses")])
+        self._reset_pending()
+
+    def flush(self) -> None:
+        """현재 스레드가 모아 둔 조회 기록을 DB에 씁니다."""
+        if not self.enabled or getattr(self._local, "conn", None) is None:
+            return
+        local = self._local
+        if not (local.touched or local.hits or local.misses):
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._write_pending(conn)
+        except sqlite3.Error as e:
+            print(f"분석 캐시 기록 중 오류 발생: {e}")
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """캐시된 (loc, description)을 반환합니다. 없으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT loc, description FROM analysis WHERE key = ?",
+                               (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"분석 캐시 조회 중 오류 발생: {e}")
+            return None
+        local = self._local
+        if row is not None:
+            local.touched[key] = time.time()
+            local.hits += 1
+        else:
+            local.misses += 1
+        if (len(local.touched) + local.hits + local.misses >= FLUSH_BATCH
+                or time.monotonic() - local.flushed_at >= FLUSH_INTERVAL):
+            self.flush()
+        return (row[0], row[1]) if row is not None else None
+
+    def put(self, key: str, loc: str, description: str) -> None:
+        """분석 결과를 저장하고, max_entries를 넘으면 오래된 항목을 삭제합니다."""
+        if not self.enabled:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._write_pending(conn)
+                conn.execute("INSERT INTO analysis (key, loc, description, last_used) VALUES (?, ?, ?, ?) "
+                             "ON CONFLICT (key) DO UPDATE SET loc = excluded.loc, "
+                             "description = excluded.description, last_used = excluded.last_used",
+                             (key, loc, description, time.time()))
+                entries = conn.execute("SELECT value FROM counters WHERE name = 'entries'").fetchone()[0]
+                if entries > self.max_entries:
+                    excess = entries - self.max_entries + int(self.max_entries * EVICT_SLACK)
+                    conn.execute("DELETE FROM analysis WHERE key IN ("
+                                 "SELECT key FROM analysis ORDER BY last_used LIMIT ?)", (excess,))
+        except sqlite3.Error as e:
+            print(f"분석 캐시 저장 중 오류 발생: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """적중/실패 횟수와 저장된 항목 수를 반환합니다."""
+        if not self.enabled:
+            return {"hits": 0, "misses": 0, "entries": 0}
+        self.flush()
+        conn = self._connect()
+        counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        return {"hits": counters.get("hits", 0), "misses": counters.get("misses", 0),
+                "entries": counters.get("entries", 0)}
+
+    def close(self) -> None:
+        """현재 스레드의 연결을 닫습니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self.flush()
+            conn.close()
+            self._local.conn = None
+
+
+analysis_cache = AnalysisCache()
@@ -1,10 +1,12 @@
 """LOC 측정 모듈 - 수정된 버전"""
+import re
 
 
 def count_code_lines(filepath) -> int:
     """주어진 파일에서 코드 라인의 수를 세는 함수입니다.
     이 함수는 파일을 열고, 각 줄을 분석하여 코드 라인, 한 줄 주석, 여러 줄 주석을 구분합니다.
     코드 라인은 실질적으로 실행되는 소스 코드 라인을 의미하며, 주석과 빈 줄은 제외됩니다.
+    파일을 디코딩하지 않고 바이트로 세므로 CP949(EUC-KR) 파일도 셀 수 있습니다.
 
     Args:
         filepath (str): 코드 라인을 세고자 하는 파일의 경로.
@@ -13,8 +15,8 @@ def count_code_lines(filepath) -> int:
         int: 파일에서 세어진 코드 라인의 수. 오류가 발생하면 -1을 반환합니다.
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        with open(filepath, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
         print(f"오류: 파일을 찾을 수 없습니다 - {filepath}")
         return -1
@@ -22,6 +24,20 @@ def count_code_lines(filepath) -> int:
         print(f"오류: 파일을 읽는 중 문제가 발생했습니다 - {e}")
         return -1
 
+    return count_code_lines_in_bytes(data)
+
+
+def count_code_lines_in_lines(lines: list[str]) -> int:
+    """이미 읽어 둔 줄 목록에서 코드 라인의 수를 세는 함수입니다.
+    count_code_lines()와 같은 규칙을 사용하며, 파일 분석 컨텍스트처럼
+    파일을 다시 읽지 않고 버퍼를 공유할 때 사용합니다.
+
+    Args:
+        lines (list[str]): readlines() 형식의 줄 목록.
+
+    Returns:
+        int: 코드 라인의 수.
+    """
     code_lines_count = 0
     in_multiline_comment = False
     current_ml_end_pattern = None
@@ -117,6 +133,121 @@ def count_code_lines(filepath) -> int:
     return code_lines_count
 
 
+# str.strip()이 제거하는 공백 중 ASCII 문자
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+# str.strip()이 제거하는 ASCII가 아닌 공백의 UTF-8 인코딩.
+# 3바이트 공백은 CP949(EUC-KR)에 나올 수 없는 바이트 조합이지만,
+# U+0085, U+00A0(C2 85, C2 A0)은 CP949 한글 한 글자와 같아 UTF-8 파일에서만 공백으로 봅니다.
+_UTF8_WHITESPACE_3 = tuple(chr(c).encode("utf-8") for c in
+                           [0x1680, *range(0x2000, 0x200B), 0x2028, 0x2029, 0x202F, 0x205F, 0x3000])
+_UTF8_WHITESPACE_2 = (b"\xc2\x85", b"\xc2\xa0")
+# 주석 패턴 중 하나라도 있는지 확인하는 정규식 (없으면 코드 라인)
+_COMMENT_MARKERS = re.compile(rb"/[*/]|#|\"\"\"|'''")
+_ML_COMMENT_PATTERNS = ((b"/*", b"*/"), (b'"""', b'"""'), (b"'''", b"'''"))
+
+
+def count_code_lines_in_bytes(data, utf8: bool | None = None) -> int:
+    """파일 내용(bytes, memoryview, mmap)에서 디코딩하지 않고 코드 라인의 수를 세는 함수입니다.
+    주석 패턴이 모두 ASCII이므로 UTF-8뿐 아니라 CP949(EUC-KR) 파일도 셀 수 있으며,
+    UTF-8 파일은 count_code_lines_in_lines()와 같은 결과를 반환합니다.
+    (줄바꿈은 텍스트 모드와 같이 \\n, \\r\\n, \\r을 인식하고, 공백은 str.strip()과 같이 제거)
+
+    Args:
+        data: 파일 원본 바이트.
+        utf8 (bool | None): UTF-8 파일 여부. None이면 UTF-8과 CP949에서 뜻이 다른 공백을
+            만났을 때만 확인합니다.
+
+    Returns:
+        int: 코드 라인의 수.
+    """
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    def is_utf8() -> bool:
+        nonlocal utf8
+        if utf8 is None:
+            try:
+                data.decode("utf-8")
+                utf8 = True
+            except UnicodeDecodeError:
+                utf8 = False
+        return utf8
+
+    def strip(segment: bytes) -> bytes:
+        segment = segment.strip(_ASCII_WHITESPACE)
+        while segment and segment[0] >= 0x80:
+            if segment.startswith(_UTF8_WHITESPACE_3):
+                segment = segment[3:].lstrip(_ASCII_WHITESPACE)
+            elif segment.startswith(_UTF8_WHITESPACE_2) and is_utf8():
+                segment = segment[2:].lstrip(_ASCII_WHITESPACE)
+            else:
+                break
+        while segment and segment[-1] >= 0x80:
+            if segment.endswith(_UTF8_WHITESPACE_3):
+                segment = segment[:-3].rstrip(_ASCII_WHITESPACE)
+            elif segment.endswith(_UTF8_WHITESPACE_2) and is_utf8():
+                segment = segment[:-2].rstrip(_ASCII_WHITESPACE)
+            else:
+                break
+        return segment
+
+    def is_code(segment: bytes) -> bool:
+        """주석 종료 전후의 남은 부분이 코드인지 확인합니다. (한 줄 주석으로 시작하지 않는 내용)"""
+        segment = strip(segment)
+        return bool(segment) and not segment.startswith((b"//", b"#"))
+
+    code_lines_count = 0
+    ml_end = None
+    search_markers = _COMMENT_MARKERS.search
+    for line in data.split(b"\n"):
+        stripped_line = line.strip(_ASCII_WHITESPACE)
+        if not stripped_line:
+            continue
+        if stripped_line[0] >= 0x80 or stripped_line[-1] >= 0x80:
+            stripped_line = strip(stripped_line)
+            if not stripped_line:
+                continue
+
+        # 여러 줄 주석 내부에 있는 경우
+        if ml_end is not None:
+            end_pos = stripped_line.find(ml_end)
+            if end_pos != -1:
+                remaining = stripped_line[end_pos + len(ml_end):]
+                ml_end = None
+                if is_code(remaining):
+                    code_lines_count += 1
+            continue
+
+        # 주석 패턴이 없으면 코드 라인
+        if search_markers(stripped_line) is None:
+            code_lines_count += 1
+            continue
+        if stripped_line.startswith((b"//", b"#")):
+            continue
+
+        # count_code_lines_in_lines()와 같이 패턴 순서대로 처음 찾은 여러 줄 주석만 처리
+        for start_pattern, end_pattern in _ML_COMMENT_PATTERNS:
+            start_pos = stripped_line.find(start_pattern)
+            if start_pos == -1:
+                continue
+            has_code = bool(strip(stripped_line[:start_pos]))
+            end_pos = stripped_line.find(end_pattern, start_pos + len(start_pattern))
+            if end_pos != -1:
+                has_code = has_code or is_code(stripped_line[end_pos + len(end_pattern):])
+            else:
+                ml_end = end_pattern
+            if has_code:
+                code_lines_count += 1
+            break
+        else:
+            # 여러 줄 주석이 없으면 중간의 한 줄 주석 앞은 항상 코드
+            code_lines_count += 1
+
+    return code_lines_count
+
+
 def _is_comment_line(line, comment_patterns):
     """주어진 라인이 주석으로 시작하는지 확인합니다."""
     for pattern in comment_patterns:
@@ -0,0 +1,228 @@
+"""규칙 기반 파일 설명 모듈
+이미지, 바이너리, 프로젝트 파일, lock 파일처럼 종류만으로 설명이 정해지는 파일은
+LLM을 호출하지 않고 규칙으로 설명을 만듭니다. 규칙으로 정하지 못한 파일만 Ollama에 보냅니다.
+
+규칙은 RuleContext를 받아 설명(str) 또는 None을 반환하는 함수이며, 등록된 순서대로 실행해
+처음으로 설명을 반환한 규칙의 결과를 사용합니다. 새 규칙은 @description_rule로 등록합니다.
+"""
+import fnmatch
+import re
+from typing import Callable, List, NamedTuple
+
+from app.schema.filedata import FileType
+
+
+class RuleContext(NamedTuple):
+    """규칙에 넘기는 파일 정보"""
+    filename: str
+    extension: str              # 소문자로 바꾼 확장자 (예: ".png")
+    filetype: FileType
+    size: int
+    lines: List[str] | None     # 파일 앞부분(HEADER_COMMENT_MAX_BYTES)의 줄 목록. UTF-8 텍스트가 아니면 None
+    binary: bool                # 앞부분에 NUL 바이트가 있는 파일
+    header_comment: str         # 파일 맨 앞의 주석 내용 (없으면 "")
+
+
+DescriptionRule = Callable[[RuleContext], str | None]
+
+DESCRIPTION_RULES: List[DescriptionRule] = []
+
+
+def description_rule(rule: DescriptionRule) -> DescriptionRule:
+    """규칙 함수를 DESCRIPTION_RULES에 등록하는 데코레이터"""
+    DESCRIPTION_RULES.append(rule)
+    return rule
+
+
+def describe_by_rules(context: RuleContext, rules: List[DescriptionRule] | None = None) -> str | None:
+    """규칙을 차례로 적용해 설명을 반환합니다. 정하지 못하면 None을 반환합니다.
+
+    Args:
+        context (RuleContext): 파일 정보.
+        rules (List[DescriptionRule] | None): 적용할 규칙 목록. None이면 DESCRIPTION_RULES를 사용합니다.
+
+    Returns:
+        str | None: 설명. 어떤 규칙에도 해당하지 않으면 None.
+    """
+    for rule in DESCRIPTION_RULES if rules is None else rules:
+        desc = rule(context)
+        if desc:
+            return desc
+    return None
+
+
+# 파일 이름(소문자)으로 정해지는 설명
+FILENAME_DESCRIPTIONS = {
+    "project.yaml": "SPS 프로젝트 정의 파일",
+    "project.yml": "SPS 프로젝트 정의 파일",
+    "package-lock.json": "npm 의존성 잠금 파일",
+    "yarn.lock": "yarn 의존성 잠금 파일",
+    "pnpm-lock.yaml": "pnpm 의존성 잠금 파일",
+    "poetry.lock": "Poetry 의존성 잠금 파일",
+    "pipfile.lock": "Pipenv 의존성 잠금 파일",
+    "cargo.lock": "Cargo 의존성 잠금 파일",
+    "composer.lock": "Composer 의존성 잠금 파일",
+    "gemfile.lock": "Bundler 의존성 잠금 파일",
+    "go.sum": "Go 모듈 체크섬 목록",
+    "package.json": "npm 패키지 정의 파일",
+    "requirements.txt": "Python 의존성 목록",
+    "pyproject.toml": "Python 프로젝트 설정",
+    "go.mod": "Go 모듈 정의 파일",
+    "cargo.toml": "Cargo 패키지 정의 파일",
+    "pom.xml": "Maven 빌드 설정",
+    "build.gradle": "Gradle 빌드 스크립트",
+    "settings.gradle": "Gradle 프로젝트 설정",
+    "cmakelists.txt": "CMake 빌드 스크립트",
+    "makefile": "Make 빌드 스크립트",
+    "dockerfile": "Docker 이미지 빌드 파일",
+    "docker-compose.yml": "Docker Compose 설정",
+    "docker-compose.yaml": "Docker Compose 설정",
+    ".gitignore": "Git 제외 파일 목록",
+    ".gitattributes": "Git 속성 설정",
+    ".dockerignore": "Docker 제외 파일 목록",
+    ".editorconfig": "편집기 설정",
+    "license": "라이선스 문서",
+    "license.txt": "라이선스 문서",
+    "license.md": "라이선스 문서",
+    "readme.md": "프로젝트 설명 문서",
+    "readme.txt": "프로젝트 설명 문서",
+    "changelog.md": "변경 이력 문서",
+    "assemblyinfo.cs": "어셈블리 정보 정의",
+}
+
+# 파일 이름 패턴(소문자, fnmatch)으로 정해지는 설명
+FILENAME_PATTERN_DESCRIPTIONS = [
+    ("*.min.js", "압축된 JavaScript 라이브러리"),
+    ("*.min.css", "압축된 스타일시트"),
+    ("*.d.ts", "TypeScript 타입 선언"),
+    ("*.designer.cs", "폼 디자이너 생성 코드"),
+    ("*.lock", "의존성 잠금 파일"),
+]
+
+# 확장자(소문자)로 정해지는 설명
+EXTENSION_DESCRIPTIONS = {
+    ".exe": "실행 파일",
+    ".dll": "동적 링크 라이브러리",
+    ".so": "공유 라이브러리",
+    ".o": "컴파일된 목적 파일",
+    ".elf": "ELF 실행 파일",
+    ".bin": "바이너리 이미지",
+    ".jar": "Java 아카이브",
+    ".msi": "Windows 설치 패키지",
+    ".dmg": "macOS 디스크 이미지",
+    ".sln": "Visual Studio 솔루션",
+    ".csproj": "C# 프로젝트 파일",
+    ".vbproj": "VB.NET 프로젝트 파일",
+    ".vcxproj": "C++ 프로젝트 파일",
+    ".fsproj": "F# 프로젝트 파일",
+    ".project": "Eclipse 프로젝트 파일",
+    ".classpath": "Eclipse 클래스패스 설정",
+    ".uproject": "Unreal 프로젝트 파일",
+    ".sublime-project": "Sublime 프로젝트 파일",
+    ".sublime-workspace": "Sublime 작업 공간 파일",
+    ".db": "데이터베이스 파일",
+    ".sqlite": "SQLite 데이터베이스",
+    ".sqlite3": "SQLite 데이터베이스",
+    ".mdb": "Access 데이터베이스",
+    ".accdb": "Access 데이터베이스",
+    ".mdf": "SQL Server 데이터 파일",
+    ".ldf": "SQL Server 로그 파일",
+    ".kdbx": "KeePass 데이터베이스",
+    ".csv": "CSV 데이터 파일",
+}
+
+# 앞부분에 NUL 바이트가 있으면 바이너리 파일로 봄
+BINARY_SNIFF_SIZE = 8192
+
+# 헤더 주석을 설명으로 쓸 최대 길이 (LLM 설명과 비슷한 길이만 사용)
+HEADER_DESCRIPTION_MAX_CHARS = 40
+
+# 헤더 주석에서 건너뛰는 줄 (shebang, 인코딩, 작성자, 날짜 등)
+_HEADER_SKIP_PATTERN = re.compile(
+    r"^(!|-\*-|[@\\](author|file|date|version)\b|(author|date|version)\s*[:=]|"
+    r"(created|written|modified|generated|maintained|updated)\s+(by|on|at)\b|"
+    r"coding[:=]|vim:|eslint|pylint|type:|noqa|todo\b)", re.IGNORECASE)
+# '#'으로 시작하는 전처리기 지시문 (#include, #pragma once 등). 주석 표시를 뗀 뒤의 내용과 비교하며,
+# 이런 줄이 있으면 주석이 아니므로 헤더 주석 규칙을 쓰지 않고 LLM에 맡김
+_HEADER_DIRECTIVE_PATTERN = re.compile(
+    r"^(include|import|pragma|define|undef|ifn?def|if|elif|else|endif|error|warning|line|"
+    r"region|endregion|using)\b")
+# 코드나 파일 이름처럼 보이는 줄은 설명으로 쓰지 않음
+_HEADER_CODE_PATTERN = re.compile(r"[<>;{}()\[\]=]|^[\w.-]+\.\w+$")
+# 라이선스 헤더는 파일 설명이 아니므로 사용하지 않음
+_HEADER_LICENSE_PATTERN = re.compile(r"^(copyright\b|\(c\)|©|licen[sc]e[ds]?\b|spdx-)", re.IGNORECASE)
+_HEADER_BRIEF_PATTERN = re.compile(r"^[@\\]brief\s+(.+)$")
+
+
+def is_binary(data: bytes) -> bool:
+    """파일 앞부분에 NUL 바이트가 있으면 바이너리로 판단합니다."""
+    return b"\0" in data[:BINARY_SNIFF_SIZE]
+
+
+@description_rule
+def empty_file_rule(context: RuleContext) -> str | None:
+    """내용이 없는 파일"""
+    return "빈 파일" if context.size == 0 else None
+
+
+@description_rule
+def filename_rule(context: RuleContext) -> str | None:
+    """잘 알려진 파일 이름과 이름 패턴"""
+    name = context.filename.lower()
+    desc = FILENAME_DESCRIPTIONS.get(name)
+    if desc is not None:
+        return desc
+    for pattern, desc in FILENAME_PATTERN_DESCRIPTIONS:
+        if fnmatch.fnmatchcase(name, pattern):
+            return desc
+    return None
+
+
+@description_rule
+def extension_rule(context: RuleContext) -> str | None:
+    """실행 파일, 라이브러리, 프로젝트 파일, 데이터베이스 등 확장자로 정해지는 파일"""
+    return EXTENSION_DESCRIPTIONS.get(context.extension)
+
+
+@description_rule
+def image_rule(context: RuleContext) -> str | None:
+    """이미지 파일"""
+    if context.filetype == FileType.IMAGE:
+        return f"{context.extension[1:].upper()} 이미지"
+    return None
+
+
+@description_rule
+def binary_rule(context: RuleContext) -> str | None:
+    """바이너리 파일 (LLM에는 메타데이터만 보내게 되므로 규칙으로 대신함)"""
+    if context.binary:
+        if context.extension:
+            return f"{context.extension[1:].upper()} 바이너리 데이터"
+        return "바이너리 데이터"
+    return None
+
+
+@description_rule
+def header_comment_rule(context: RuleContext) -> str | None:
+    """헤더 주석이 명시적인 @brief이거나 첫 줄이 짧은 설명 문장인 소스 파일
+    전처리기 지시문, 코드, 파일 이름처럼 보이는 줄은 설명으로 쓰지 않고 LLM에 맡깁니다.
+    """
+    lines = context.header_comment.splitlines()
+    for line in lines:
+        line = line.strip(" \t*#/-=")
+        brief = _HEADER_BRIEF_PATTERN.match(line)
+        if brief and not _HEADER_CODE_PATTERN.search(brief.group(1)):
+            line = brief.group(1).strip()
+            return line if len(line) <= HEADER_DESCRIPTION_MAX_CHARS else None
+    for line in lines:
+        line = line.strip(" \t*#/-=")
+        if not line:
+            continue
+        if _HEADER_DIRECTIVE_PATTERN.match(line) or _HEADER_LICENSE_PATTERN.match(line):
+            return None
+        if _HEADER_SKIP_PATTERN.match(line):
+            continue
+        if len(line) <= HEADER_DESCRIPTION_MAX_CHARS and not _HEADER_CODE_PATTERN.search(line):
+            return line
+        return None
+    return None
@@ -0,0 +1,108 @@
+"""파일 분석 컨텍스트 모듈
+파일 하나를 한 번만 읽어 체크섬, LOC, 설명, 헤더 주석 단계가 같은 버퍼를 공유하도록 합니다.
+"""
+import codecs
+import io
+import mmap
+import os
+
+from app.environments.env import FILE_MMAP_THRESHOLD, HEADER_COMMENT_MAX_BYTES
+
+
+class FileContext:
+    """파일 분석 컨텍스트
+    파일 내용을 처음 사용할 때 한 번만 읽고, 이후 단계에서는 같은 버퍼를 사용합니다.
+    mmap_threshold 이상의 큰 파일은 읽는 대신 mmap으로 매핑합니다.
+
+    with 문과 함께 사용하여 mmap과 파일을 닫아야 합니다.
+    """
+
+    def __init__(self, file_path: str, size: int | None = None,
+                 mmap_threshold: int = FILE_MMAP_THRESHOLD,
+                 head_size: int = HEADER_COMMENT_MAX_BYTES) -> None:
+        """
+        초기화
+        Args:
+            file_path: 분석할 파일 경로
+            size: 파일 크기. 이미 알고 있는 경우 지정하면 stat을 생략합니다.
+            mmap_threshold: 이 크기 이상이면 mmap을 사용합니다.
+            head_size: head_lines가 디코딩할 파일 앞부분 크기 (바이트 단위)
+        """
+        self.file_path = file_path
+        self.size = size if size is not None else os.path.getsize(file_path)
+        self.mmap_threshold = mmap_threshold
+        self.head_size = head_size
+        self._data: bytes | mmap.mmap | None = None
+        self._text: str | None = None
+        self._lines: list[str] | None = None
+        self._head_lines: list[str] | None = None
+        self._decoded = False
+
+    def __enter__(self) -> "FileContext":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def data(self) -> bytes | mmap.mmap:
+        """파일의 원본 바이트 (작은 파일은 bytes, 큰 파일은 읽기 전용 mmap)"""
+        if self._data is None:
+            with open(self.file_path, 'rb') as f:
+                if self.size and self.size >= self.mmap_threshold:
+                    self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self._data = f.read()
+        return self._data
+
+    @property
+    def text(self) -> str | None:
+        """UTF-8로 디코딩한 내용. 텍스트 모드로 읽은 것과 같이 줄바꿈을 '\\n'으로 통일합니다.
+        UTF-8 파일이 아니면 None을 반환합니다.
+        """
+        if not self._decoded:
+            self._decoded = True
+            try:
+                text = str(self.data, 'utf-8')
+            except UnicodeDecodeError:
+                text = None
+            if text is not None and '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            self._text = text
+        return self._text
+
+    @property
+    def lines(self) -> list[str] | None:
+        """readlines()와 같은 형식의 줄 목록. UTF-8 파일이 아니면 None을 반환합니다."""
+        if self._lines is None and self.text is not None:
+            self._lines = io.StringIO(self.text).readlines()
+        return self._lines
+
+    @property
+    def head_lines(self) -> list[str] | None:
+        """파일 앞부분 head_size 바이트만 디코딩한 줄 목록 (헤더 주석, 규칙용)
+        파일 전체를 디코딩하지 않으며, 앞부분에서 잘린 마지막 줄은 포함하지 않습니다.
+        파일이 head_size 이하이거나 이미 lines를 만들었으면 lines와 같습니다.
+        앞부분이 UTF-8이 아니면 None을 반환합니다.
+        """
+        if self._lines is not None or self.size <= self.head_size:
+            return self.lines
+        if self._head_lines is None:
+            try:
+                # 앞부분 끝에서 잘린 멀티바이트 문자는 다음 바이트가 없으므로 디코딩하지 않음
+                text = codecs.getincrementaldecoder('utf-8')().decode(self.data[:self.head_size])
+            except UnicodeDecodeError:
+                return None
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+            self._head_lines = io.StringIO(text).readlines()[:-1]
+        return self._head_lines
+
+    def close(self) -> None:
+        """mmap을 닫고 버퍼를 해제합니다."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+        self._text = None
+        self._lines = None
+        self._head_lines = None
+        self._decoded = False
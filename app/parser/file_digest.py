@@ -0,0 +1,80 @@
+"""파일 요약(digest) 모듈
+큰 소스 파일 전체 대신 설명 생성에 필요한 부분만 뽑아 토큰 예산 안의 짧은 요약을 만듭니다.
+헤더 주석, 처음 몇 줄, import 문, 클래스/함수 선언을 우선순위대로 담습니다.
+"""
+import re
+
+from app.parser.get_file_description import leading_multiline_comments_in_lines
+
+DIGEST_FIRST_LINES = 15
+# 한 줄로 압축된 파일 등에서 정규식 검사가 느려지지 않도록 긴 줄은 선언으로 보지 않음
+SIGNATURE_MAX_LINE = 200
+
+_IMPORT_PATTERN = re.compile(
+    r"^\s*(import\s|from\s+\S+\s+import\s|#\s*include\b|using\s|package\s|require\b|"
+    r"(const|let|var)\s+\w+\s*=\s*require\()")
+_SIGNATURE_PATTERN = re.compile(
+    r"^\s*((export\s+)?(default\s+)?(public\s+|private\s+|protected\s+|internal\s+|static\s+|"
+    r"abstract\s+|final\s+|async\s+|virtual\s+|override\s+)*"
+    r"(def|class|struct|interface|enum|function|func|fn|trait|impl|module|namespace|record)\s+\w+|"
+    r"(?!(if|else|for|while|switch|return|case|do|catch|new|throw|raise|yield|await|assert|delete)\b)"
+    r"[A-Za-z_][\w:<>,\*&\s]*\s[\*&]*[A-Za-z_][\w:]*\s*\([^;]*\)\s*(const\s*)?\{?\s*$)")
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 대략 계산합니다. (UTF-8 4바이트당 1토큰)"""
+    return len(text.encode("utf-8")) // 4 + 1
+
+
+def _take_lines(lines: list[str], budget: int) -> tuple[list[str], int]:
+    """budget 토큰 안에 들어가는 만큼 줄을 담고 (담은 줄, 남은 예산)을 반환합니다."""
+    taken = []
+    for line in lines:
+        cost = estimate_tokens(line)
+        if cost > budget:
+            break
+        taken.append(line)
+        budget -= cost
+    return taken, budget
+
+
+def build_file_digest(text: str, max_tokens: int) -> str:
+    """파일 내용의 요약을 만듭니다.
+    내용이 max_tokens 이하이면 그대로 반환하고, 넘으면 헤더 주석, 처음 몇 줄,
+    import 문, 클래스/함수 선언 순으로 예산 안에서 담은 요약을 반환합니다.
+
+    Args:
+        text (str): 파일 내용.
+        max_tokens (int): 토큰 예산. 0 이하이면 요약하지 않습니다.
+
+    Returns:
+        str: 프롬프트에 넣을 파일 내용 또는 요약.
+    """
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+
+    lines = text.splitlines()
+    sections = [
+        ("헤더 주석", leading_multiline_comments_in_lines(text.splitlines(keepends=True)).splitlines()),
+        ("처음 부분", lines[:DIGEST_FIRST_LINES]),
+        ("import", [line.strip() for line in lines if _IMPORT_PATTERN.match(line)]),
+        ("선언", [line.rstrip(" {\t") for line in lines[DIGEST_FIRST_LINES:]
+                 if len(line) <= SIGNATURE_MAX_LINE and _SIGNATURE_PATTERN.match(line)]),
+    ]
+
+    budget = max_tokens
+    parts = [f"(파일이 커서 요약만 전송, 전체 {len(lines)}줄)"]
+    budget -= estimate_tokens(parts[0])
+    seen = set()
+    for title, section_lines in sections:
+        # 앞 섹션에 이미 담은 줄은 다시 담지 않음
+        section_lines = [line for line in dict.fromkeys(section_lines)
+                         if line.strip() and line.strip() not in seen]
+        seen.update(line.strip() for line in section_lines)
+        if not section_lines or budget <= 0:
+            continue
+        header = f"[{title}]"
+        taken, budget = _take_lines(section_lines, budget - estimate_tokens(header))
+        if taken:
+            parts.append("\n".join([header, *taken]))
+    return "\n\n".join(parts)
@@ -19,6 +19,19 @@ def leading_multiline_comments(file_path: str) -> str:
         return ""
     except Exception:
         return ""
+    return leading_multiline_comments_in_lines(lines)
+
+
+def leading_multiline_comments_in_lines(lines: list[str]) -> str:
+    """이미 읽어 둔 줄 목록에서 맨 첫 줄부터 시작하는 주석 내용을 반환합니다.
+    leading_multiline_comments()와 같은 규칙을 사용합니다.
+
+    Args:
+        lines (list[str]): readlines() 형식의 줄 목록.
+
+    Returns:
+        str: 주석 마크가 제거된 주석 내용입니다.
+    """
     if not lines:
         return ""
 
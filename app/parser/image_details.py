@@ -1,38 +1,289 @@
-"""이미지 해상도 모듈"""
-from PIL import Image
-
-
-def get_image_details(file_path) -> tuple[tuple[int, int], int]:
-    """이미지 파일의 해상도와 색상 비트를 반환합니다.
-    이 함수는 주어진 파일 경로를 통해 이미지의 해상도와 색상 비트를 가져옵니다.
-    PIL(Pillow) 라이브러리를 사용하여 이미지를 열고, 이미지의 크기(size)를 통해
-    해상도를 추출합니다. 이미지의 모드(mode)를 확인하여 해당 모드에 맞는
-    비트 수(bits per pixel)를 매핑한 후 반환합니다.
-
-    Args:
-        file_path (str): 이미지 파일 경로
-
-    Returns:
-        tuple: (해상도, 색상 비트) 형식의 튜플.
-               이미지 파일이 아니거나 오류 발생 시 None을 반환합니다.
-    """
-    with Image.open(file_path) as img:
-        width, height = img.size
-        resolution = (width, height)
-
-        # 색상 비트 확인
-        mode_to_bpp = {
-            '1': 1,
-            'L': 8,
-            'P': 8,
-            'RGB': 24,
-            'RGBA': 32,
-            'CMYK': 32,
-            'YCbCr': 24,
-            'I': 32,
-            'F': 32
-        }
-        color_bits = mode_to_bpp.get(img.mode, None)
-        color_bits = color_bits if color_bits is not None else 0
-
-        return resolution, color_bits
+"""이미지 해상도 모듈
+이미지를 디코딩하지 않고 파일 헤더만 읽어 해상도와 색상 비트를 구합니다.
+
+- PNG, GIF, BMP, WebP, ICO, TIFF: 앞부분 수백 바이트의 헤더를 읽습니다.
+- JPEG: 세그먼트 길이를 따라 건너뛰며 SOF 세그먼트를 찾습니다.
+- SVG: 루트 <svg> 요소의 width, height 속성 또는 viewBox를 읽습니다.
+- 그 외 형식(PSD, JPEG 2000 등)은 Pillow를 사용할 수 있을 때만 Pillow로 엽니다. (필요할 때 import)
+"""
+import mmap
+import re
+import struct
+from typing import Callable
+
+# SVG 루트 요소를 찾을 때 읽는 최대 바이트 수 (XML 선언, 주석, DOCTYPE 포함)
+SVG_PROBE_BYTES = 64 * 1024
+
+ImageDetails = tuple[tuple[int, int], int]
+
+# SVG 길이 단위별 px 배율 (CSS 기준 96dpi)
+_SVG_UNITS = {"": 1.0, "px": 1.0, "pt": 96 / 72, "pc": 16.0, "mm": 96 / 25.4, "cm": 96 / 2.54, "in": 96.0}
+_XML_COMMENT = re.compile(rb"<!--.*?-->", re.S)
+_SVG_ROOT = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?svg\b([^>]*)>")
+_SVG_LENGTH = re.compile(r"^\s*([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)\s*([a-z]*)\s*$")
+
+# Pillow 이미지 모드별 색상 비트
+_MODE_TO_BPP = {
+    '1': 1,
+    'L': 8,
+    'P': 8,
+    'RGB': 24,
+    'RGBA': 32,
+    'CMYK': 32,
+    'YCbCr': 24,
+    'I': 32,
+    'F': 32
+}
+
+
+def _png(data) -> ImageDetails | None:
+    if data[:8] != b"\x89PNG\r\n\x1a\n" or data[12:16] != b"IHDR":
+        return None
+    width, height, depth, color_type = struct.unpack(">IIBB", data[16:26])
+    # Pillow가 여는 모드로 바꾸어 색상 비트를 구함 (16비트 채널도 RGB/RGBA는 24/32, I;16과 LA는 0)
+    if color_type == 0:
+        mode = {1: "1", 16: "I;16"}.get(depth, "L")
+    elif color_type == 4:
+        mode = "LA" if depth == 8 else "RGBA"
+    else:
+        mode = {2: "RGB", 3: "P", 6: "RGBA"}.get(color_type, "")
+    return (width, height), _MODE_TO_BPP.get(mode, 0)
+
+
+def _gif(data) -> ImageDetails | None:
+    if data[:6] not in (b"GIF87a", b"GIF89a"):
+        return None
+    width, height = struct.unpack("<HH", data[6:10])
+    return (width, height), 8
+
+
+def _bmp(data) -> ImageDetails | None:
+    if data[:2] != b"BM" or len(data) < 26:
+        return None
+    header_size = struct.unpack("<I", data[14:18])[0]
+    if header_size == 12:           # OS/2 BITMAPCOREHEADER
+        width, height, _, bits = struct.unpack("<HHHH", data[18:26])
+    elif len(data) >= 30:
+        width, height, _, bits = struct.unpack("<iiHH", data[18:30])
+    else:
+        return None
+    # Pillow가 여는 모드로 바꾸어 색상 비트를 구함
+    # (16/32비트는 RGB로 열고, 32비트는 알파 마스크가 있는 BITFIELDS인 경우만 RGBA)
+    if bits == 1 and _bmp_gray_palette(data, header_size):
+        mode = "1"
+    elif bits <= 8:
+        mode = "P"
+    elif bits == 32 and _bmp_alpha(data, header_size):
+        mode = "RGBA"
+    else:
+        mode = "RGB"
+    return (abs(width), abs(height)), _MODE_TO_BPP[mode]
+
+
+def _bmp_gray_palette(data, header_size: int) -> bool:
+    """1비트 BMP의 팔레트가 검정/흰색인지 확인합니다. (Pillow는 이 경우만 '1' 모드, 그 외에는 'P' 모드로 엽니다)"""
+    entry = 3 if header_size == 12 else 4
+    offset = 14 + header_size
+    return (data[offset:offset + 3] == b"\x00\x00\x00"
+            and data[offset + entry:offset + entry + 3] == b"\xff\xff\xff")
+
+
+def _bmp_alpha(data, header_size: int) -> bool:
+    """32비트 BMP가 알파 채널을 가진 BITFIELDS 형식인지 확인합니다."""
+    if header_size < 40 or len(data) < 66 or struct.unpack("<I", data[30:34])[0] != 3:
+        return False
+    masks = struct.unpack("<III", data[54:66])
+    alpha = struct.unpack("<I", data[66:70])[0] if header_size >= 56 and len(data) >= 70 else 0
+    return alpha != 0 or masks == (0, 0, 0)
+
+
+def _jpeg(data) -> ImageDetails | None:
+    if data[:2] != b"\xff\xd8":
+        return None
+    offset, size = 2, len(data)
+    while offset + 4 <= size:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:          # 채움 바이트
+            offset += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            offset += 2             # 길이가 없는 마커
+            continue
+        if marker == 0xDA:          # 영상 데이터 시작 (SOF 없음)
+            return None
+        length = struct.unpack(">H", data[offset + 2:offset + 4])[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if offset + 10 > size:
+                return None
+            precision, height, width, components = struct.unpack(">BHHB", data[offset + 4:offset + 10])
+            return (width, height), precision * components
+        offset += 2 + length
+    return None
+
+
+def _webp(data) -> ImageDetails | None:
+    if data[:4] != b"RIFF" or data[8:12] != b"WEBP" or len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", data[26:30])
+        return (width & 0x3FFF, height & 0x3FFF), 24
+    if chunk == b"VP8L":
+        bits = struct.unpack("<I", data[21:25])[0]
+        alpha = (bits >> 28) & 1
+        return ((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1), 32 if alpha else 24
+    if chunk == b"VP8X":
+        alpha = data[20] & 0x10
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return (width, height), 32 if alpha else 24
+    return None
+
+
+def _ico(data) -> ImageDetails | None:
+    if data[:4] != b"\x00\x00\x01\x00" or len(data) < 6:
+        return None
+    count = struct.unpack("<H", data[4:6])[0]
+    best = None
+    for index in range(count):
+        entry = data[6 + index * 16:22 + index * 16]
+        if len(entry) < 16:
+            break
+        width, height = entry[0] or 256, entry[1] or 256
+        bits, _, offset = struct.unpack("<HII", entry[6:16])
+        if not bits:                # PNG로 저장된 아이콘은 PNG 헤더에서 읽음
+            embedded = _png(data[offset:offset + 26])
+            bits = embedded[1] if embedded else 0
+        # Pillow와 같이 가장 큰 아이콘을 사용
+        if best is None or (width * height, bits) > (best[0][0] * best[0][1], best[1]):
+            best = (width, height), bits
+    return best
+
+
+def _tiff(data) -> ImageDetails | None:
+    if data[:4] == b"II*\x00":
+        order = "<"
+    elif data[:4] == b"MM\x00*":
+        order = ">"
+    else:
+        return None
+    ifd = struct.unpack(order + "I", data[4:8])[0]
+    if ifd + 2 > len(data):
+        return None
+    count = struct.unpack(order + "H", data[ifd:ifd + 2])[0]
+    tags: dict[int, list[int]] = {}
+    for index in range(count):
+        entry = data[ifd + 2 + index * 12:ifd + 14 + index * 12]
+        if len(entry) < 12:
+            break
+        tag, kind, values = struct.unpack(order + "HHI", entry[:8])
+        if tag not in (256, 257, 258, 277) or kind not in (3, 4):
+            continue
+        item = "H" if kind == 3 else "I"
+        width = 2 if kind == 3 else 4
+        raw = entry[8:12]
+        if values * width > 4:
+            offset = struct.unpack(order + "I", raw)[0]
+            raw = data[offset:offset + values * width]
+        if len(raw) < values * width:
+            continue
+        tags[tag] = list(struct.unpack(order + item * values, raw[:values * width]))
+    if 256 not in tags or 257 not in tags:
+        return None
+    samples = tags.get(277, [1])[0]
+    bits_per_sample = tags.get(258, [1])
+    bits = sum(bits_per_sample) if len(bits_per_sample) > 1 else bits_per_sample[0] * samples
+    return (tags[256][0], tags[257][0]), bits
+
+
+def _svg_attribute(attributes: str, name: str) -> str | None:
+    match = re.search(r"(?:^|\s)" + name + r"\s*=\s*([\"'])(.*?)\1", attributes)
+    return match.group(2) if match else None
+
+
+def _svg_length(value: str | None) -> float | None:
+    """SVG 길이를 px로 바꿉니다. 백분율 등 절대 길이가 아니면 None을 반환합니다."""
+    match = _SVG_LENGTH.match(value or "")
+    if match is None or match.group(2) not in _SVG_UNITS:
+        return None
+    return float(match.group(1)) * _SVG_UNITS[match.group(2)]
+
+
+def _svg(data) -> ImageDetails | None:
+    head = _XML_COMMENT.sub(b"", bytes(data[:SVG_PROBE_BYTES]))
+    match = _SVG_ROOT.search(head)
+    if match is None:
+        return None
+    attributes = match.group(1).decode("utf-8", "replace")
+    width = _svg_length(_svg_attribute(attributes, "width"))
+    height = _svg_length(_svg_attribute(attributes, "height"))
+    if width is None or height is None:
+        view_box = (_svg_attribute(attributes, "viewBox") or "").replace(",", " ").split()
+        if len(view_box) != 4:
+            return None
+        try:
+            width, height = float(view_box[2]), float(view_box[3])
+        except ValueError:
+            return None
+    # 벡터 이미지는 색상 비트가 없음
+    return (round(width), round(height)), 0
+
+
+# 파일 앞부분으로 형식을 판단하는 순서대로 나열
+_HEADER_PROBES: list[Callable] = [_png, _jpeg, _gif, _bmp, _webp, _ico, _tiff]
+
+
+def probe_image(data) -> ImageDetails | None:
+    """이미지 파일 내용(bytes, mmap 등)의 헤더에서 (해상도, 색상 비트)를 읽습니다.
+    지원하지 않는 형식이거나 헤더가 잘못되었으면 None을 반환합니다.
+    """
+    try:
+        for probe in _HEADER_PROBES:
+            details = probe(data)
+            if details is not None:
+                return details
+        return _svg(data)
+    except (struct.error, IndexError, ValueError):
+        return None
+
+
+def _pillow_image_details(file_path) -> ImageDetails | None:
+    """Pillow로 이미지를 열어 (해상도, 색상 비트)를 반환합니다. Pillow가 없거나 열 수 없으면 None"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(file_path) as img:
+            return img.size, _MODE_TO_BPP.get(img.mode, 0)
+    except Exception:
+        return None
+
+
+def get_image_details(file_path, data=None) -> ImageDetails | None:
+    """이미지 파일의 해상도와 색상 비트를 반환합니다.
+    헤더만 읽어 해상도를 구하며, 헤더로 읽을 수 없는 형식만 Pillow로 엽니다.
+    색상 비트는 Pillow로 열었을 때의 모드 기준입니다. (팔레트와 8비트 이하 회색조는 8, 16비트 채널의 RGB/RGBA는 24/32,
+    모드 표에 없는 LA와 16비트 회색조는 0, 16/32비트 BMP는 알파 채널이 없으면 24)
+
+    Args:
+        file_path (str): 이미지 파일 경로
+        data (bytes | mmap.mmap | None): 이미 읽어 둔 파일 내용. 없으면 파일을 매핑하여 읽습니다.
+
+    Returns:
+        tuple: (해상도, 색상 비트) 형식의 튜플.
+               이미지 파일이 아니거나 해상도를 읽을 수 없으면 None을 반환합니다.
+    """
+    if data is not None:
+        details = probe_image(data)
+    else:
+        try:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                details = probe_image(mapped)
+        except (OSError, ValueError):       # 빈 파일은 매핑할 수 없음
+            details = None
+    if details is not None:
+        return details
+    return _pillow_image_details(file_path)
@@ -1,20 +1,41 @@
 """기본 file parser"""
 import datetime
+import heapq
+import multiprocessing
 import os
+import stat
+import time
+from collections import Counter, deque
+from concurrent.futures import (Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed,
+                                TimeoutError as FutureTimeoutError)
 from pathlib import Path
-from typing import List
-from app.environments.env import DEFAULT_TEMP_DIR
+from typing import Callable, List, NamedTuple, Sequence
+from app.environments.env import (DEFAULT_TEMP_DIR, DESCRIPTION_RULES, PARSER_BATCHES_PER_WORKER,
+                                  PARSER_EXECUTOR, PARSER_WORKERS, SIMILARITY_MAX_DISTANCE)
 from app.schema.enums import CHECKSUM
 from app.schema.filedata import FileType, FileData
 from app.schema.constants import (EXECUTION_EXTENSIONS, PROJECT_EXTENSIONS,
                                   SOURCE_EXTENSIONS, CONFIGURATION_EXTENSIONS,
                                   DATABSE_EXTENSIONS, IMAGE_EXTENSIONS)
 from app.schema.web_api import SpsProject, SpsRequest
-from app.util import get_md5_checksum, get_sha256_checksum
-from app.parser.code_counter import count_code_lines
+from app.util.hashing import hash_data, hash_file
+from app.parser.analysis_cache import analysis_cache
+from app.parser.code_counter import count_code_lines_in_bytes
+from app.parser.description_rules import RuleContext, describe_by_rules, is_binary
+from app.parser.file_context import FileContext
 from app.parser.image_details import get_image_details
-from app.parser.get_file_description import leading_multiline_comments
-from app.util.ollama import descriptor
+from app.parser.similarity import DescriptionIndex, simhash
+from app.parser.walker import walk_files
+from app.parser.get_file_description import leading_multiline_comments_in_lines
+from app.util.load_shedding import DegradationLevel, load_shedder
+from app.util.ollama import get_descriptor
+
+# 파일 분석과 겹쳐서 기다릴 수 있는 설명 생성 요청 수 (요청 풀 처리량 대비 배수)
+DESCRIPTION_PENDING_PER_SLOT = 2
+
+# LOC 계산이나 설명 생성 방식이 바뀌면 올려서 이전 분석 결과 캐시를 무효화합니다.
+ANALYZER_VERSION = 7
+CACHE_KEY_ALGORITHM = "sha256"
 
 
 def _get_file_type(extension: str) -> FileType:
@@ -43,29 +64,63 @@ def _get_file_type(extension: str) -> FileType:
         return FileType.UNKNOWN
 
 
-def _get_checksum(file_path: str, checksum_type: CHECKSUM) -> str:
+def _checksum_algorithms(checksum_type: CHECKSUM | Sequence[CHECKSUM]) -> List[str] | None:
+    """체크섬 유형을 hashlib 알고리즘 이름 목록으로 바꿉니다. 지원하지 않는 유형이 있으면 None을 반환합니다."""
+    checksum_types = [checksum_type] if isinstance(checksum_type, CHECKSUM) else list(checksum_type)
+    algorithms = [item.value for item in checksum_types if isinstance(item, CHECKSUM)]
+    if not algorithms or len(algorithms) != len(checksum_types):
+        return None
+    return algorithms
+
+
+def _get_checksum(file_path: str,
+                  checksum_type: CHECKSUM | Sequence[CHECKSUM],
+                  data: bytes | None = None,
+                  digests: dict[str, str] | None = None) -> str:
     """체크섬 계산
     주어진 파일 경로와 체크섬 유형을 사용하여 파일의 체크섬을 계산하여 반환합니다.
-    지원되는 체크섬 유형은 MD5와 SHA256입니다.
+    지원되는 체크섬 유형은 MD5와 SHA256이며, 여러 유형을 지정하면 파일을 한 번만 읽어 함께 계산합니다.
 
     Args:
         file_path (str): 체크섬을 계산할 파일 경로를 나타내는 문자열.
-        checksum_type (CHECKSUM): 체크섬 유형 열거체.
+        checksum_type (CHECKSUM | Sequence[CHECKSUM]): 체크섬 유형 열거체 또는 그 목록.
                                   현재 지원하는 유형은 CHECKSUM.MD5와 CHECKSUM.SHA256입니다.
+        data (bytes | None): 이미 읽어 둔 파일 내용. 지정하면 파일을 다시 읽지 않습니다.
+        digests (dict[str, str] | None): 이미 계산한 digest. 지정하면 다시 계산하지 않습니다.
 
     Returns:
         str: 주어진 체크섬 유형에 따라 계산된 체크섬 값을 문자열로 반환합니다.
+             여러 유형을 지정한 경우 "MD5:<값> SHA256:<값>" 형식으로 반환합니다.
              만약 파일 경로가 잘못되었거나, 지정된 체크섬 유형을 지원하지 않는 경우 "Error"를 반환합니다.
     """
-    checksum = None
-    if checksum_type is CHECKSUM.MD5:
-        checksum = get_md5_checksum(file_path)
-    elif checksum_type is CHECKSUM.SHA256:
-        checksum = get_sha256_checksum(file_path)
-    return checksum if checksum is not None else "Error"
+    algorithms = _checksum_algorithms(checksum_type)
+    if algorithms is None:
+        return "Error"
+
+    if digests is None:
+        try:
+            if data is not None:
+                digests = hash_data(data, algorithms)
+            else:
+                digests = hash_file(file_path, algorithms)
+        except OSError as e:
+            print(f"'{file_path}' 체크섬 계산 중 오류 발생: {e}")
+            return "Error"
+
+    if len(algorithms) == 1:
+        return digests[algorithms[0].lower()]
+    return " ".join(f"{name}:{digests[name.lower()]}" for name in dict.fromkeys(algorithms))
 
 
-def _get_date(file_type: FileType, path: Path) -> str:
+def _get_cache_key(digests: dict[str, str], extension: str, model: str) -> str:
+    """분석 결과 캐시 키를 만듭니다.
+    파일 내용 해시, 분석기 버전, 확장자(파일 타입 결정), 설명을 만든 모델을 포함합니다.
+    Ollama를 사용할 수 없을 때 만든 주석 기반 설명은 모델 이름 없이(model="") 따로 저장합니다.
+    """
+    return f"{ANALYZER_VERSION}:{digests[CACHE_KEY_ALGORITHM]}:{extension.lower()}:{model}"
+
+
+def _get_date(file_type: FileType, stat_result: os.stat_result) -> str:
     """
     주어진 FileType enum 인스턴스에 따라 생성시간 또는 수정날짜를 반환합니다.
     FileType.EXECUTION, FileType.CONF, FileType.DB인 경우 생성일을 반환하고,
@@ -73,14 +128,15 @@ def _get_date(file_type: FileType, path: Path) -> str:
 
     Args:
         file_type_instance (FileType): FileType enum의 인스턴스.
+        stat_result (os.stat_result): 파일의 stat 결과.
 
     Returns:
         int: 분류된 그룹 번호 (1 또는 2).
     """
     if file_type in [FileType.EXECUTION, FileType.CONF, FileType.DB]:
-        date = path.stat().st_ctime
+        date = stat_result.st_ctime
     else:
-        date = path.stat().st_mtime
+        date = stat_result.st_mtime
     return datetime.datetime.fromtimestamp(date).strftime('%Y-%m-%d')
 
 
@@ -89,9 +145,11 @@ def get_file_data(index: int,
                   csu: str,
                   version: str,
                   partnumber: str,
-                  checksum_type: CHECKSUM,
+                  checksum_type: CHECKSUM | Sequence[CHECKSUM],
                   file_path: str,
-                  root_path: str) -> FileData:
+                  root_path: str,
+                  stat_result: os.stat_result | None = None,
+                  deadline: float | None = None) -> FileData:
     """지정된 파일 경로에서 파일에 대한 데이터를 수집하고 처리하여 FileData 객체를 반환합니다.
     주어진 파일 경로가 유효한 파일인지 확인합니다. 파일 경로가 유효하지 않거나 파일이 존재하지 않으면 None을 반환합니다.
     파일의 이름, 확장자, 크기를 가져옵니다.
@@ -105,38 +163,167 @@ def get_file_data(index: int,
         csu (str): CSU(Component Software Unit) 정보.
         version (str): 파일 버전 정보.
         partnumber (str): 파트 넘버.
-        checksum_type (CHECKSUM): 체크섬 타입.
+        checksum_type (CHECKSUM | Sequence[CHECKSUM]): 체크섬 타입 또는 그 목록.
         file_path (str): 파일의 경로.
         root_path (str): 루트 디렉토리 경로.
+        stat_result (os.stat_result | None): 디렉토리 탐색 중 얻은 stat 결과.
+                                             지정하면 파일을 다시 stat하지 않습니다.
+        deadline (float | None): 설명 생성 마감 시각(time.time() 기준). 지나면 주석 기반 설명을 사용합니다.
 
     Returns:
         FileData: FileData 객체 또는 파일이 존재하지 않을 경우 None을 반환합니다.
 
 
     """
-    path: Path = Path(file_path)
-    if not path.exists() or not path.is_file():
+    data, pending = _analyze_file(index, device, csu, version, partnumber, checksum_type,
+                                  file_path, root_path, stat_result, deadline)
+    if pending is not None:
+        _resolve_description(data, pending, deadline)
+    return data
+
+
+class _PendingDescription(NamedTuple):
+    """설명 생성을 기다리는 파일 정보"""
+    future: Future
+    fallback: str       # 설명을 받지 못했을 때 사용할 헤더 주석
+    cache_key: str
+    model: str          # 캐시 키를 만들 때 사용한 모델 ("": Ollama 사용 불가)
+    loc: str
+    source: str = ""    # LLM을 호출하지 않은 경우 "exact", "near" (다른 파일 설명 재사용), "rule", "draft",
+                        # 또는 부하 조절로 요청을 생략한 단계 ("reduced", "shed")
+
+
+class DraftDescription(NamedTuple):
+    """초안 단계에서 LLM 대신 헤더 주석을 설명으로 사용한 파일
+    enrich_descriptions()로 설명만 LLM 설명으로 보강합니다.
+    """
+    data: FileData
+    file_path: str
+    cache_key: str
+    loc: str
+
+
+def _submit_description(file_path: str,
+                        ctx: FileContext,
+                        stat_result: os.stat_result,
+                        checksum: str,
+                        deadline: float | None,
+                        description_index: DescriptionIndex | None,
+                        has_fallback: bool) -> tuple[Future, str]:
+    """설명 생성 요청을 제출하고 (Future, source)를 반환합니다.
+    description_index에 같거나 비슷한 파일의 요청이 있으면 제출하지 않고 그 요청을 재사용합니다.
+    부하 조절 단계가 SHED이거나, REDUCED이고 대체 설명(has_fallback)이 있으면
+    요청하지 않고 빈 설명과 단계 이름("reduced", "shed")을 반환합니다.
+    """
+    level = load_shedder.level()
+    if level is DegradationLevel.SHED or (level is DegradationLevel.REDUCED and has_fallback):
+        future: Future = Future()
+        future.set_result("")
+        return future, level.name.lower()
+
+    descriptor = get_descriptor()
+    # fileSize보다 큰 파일은 메타데이터만 보내므로 전체를 디코딩하지 않음
+    text = ctx.text if stat_result.st_size <= descriptor.size else None
+    if description_index is None:
+        return descriptor.submit_description(file_path, text, stat_result, deadline), ""
+
+    # 내용을 보내는 파일만 유사도를 비교 (메타데이터만 보내는 파일은 같은 파일만 재사용)
+    # 지문은 전체 텍스트 대신 LLM에 보낼 내용(promptTokens 이하로 줄인 요약)으로 계산하여 큰 파일도 비용이 일정함
+    extension = Path(file_path).suffix
+    content = descriptor.file_content(file_path, text, stat_result)
+    fingerprint = simhash(content) if text is not None else None
+    found = description_index.find(checksum, extension, fingerprint)
+    if found is not None:
+        return found
+    future = descriptor.submit_description(file_path, text, stat_result, deadline, content)
+    description_index.add(checksum, extension, fingerprint, future)
+    return future, ""
+
+
+def _analyze_file(index: int,
+                  device: str,
+                  csu: str,
+                  version: str,
+                  partnumber: str,
+                  checksum_type: CHECKSUM | Sequence[CHECKSUM],
+                  file_path: str,
+                  root_path: str,
+                  stat_result: os.stat_result | None = None,
+                  deadline: float | None = None,
+                  description_index: DescriptionIndex | None = None,
+                  draft: bool = False) -> tuple[FileData, _PendingDescription | None]:
+    """get_file_data()에서 설명 생성을 기다리지 않는 부분입니다.
+    설명 생성은 descriptor의 요청 풀에 제출만 하고, 설명이 빈 FileData와 함께 반환합니다.
+    분석 결과가 캐시에 있으면 설명까지 채워서 반환하며 이때 pending은 None입니다.
+    규칙으로 설명을 정할 수 있는 파일은 LLM에 요청하지 않고 완료된 Future를 사용하며,
+    description_index가 있으면 같거나 비슷한 파일에 이미 제출한 설명 요청을 재사용합니다.
+    draft가 True이면 LLM에 요청하지 않고 source가 "draft"인 빈 설명을 사용합니다. (헤더 주석으로 대체)
+    """
+    if stat_result is None:
+        try:
+            stat_result = os.stat(file_path)
+        except OSError as e:
+            raise ValueError("File not found.") from e
+    if not stat.S_ISREG(stat_result.st_mode):
         raise ValueError("File not found.")
 
+    path: Path = Path(file_path)
     filename = path.name
     extension = path.suffix
-    size = path.stat().st_size
+    size = stat_result.st_size
 
     filetype = _get_file_type(extension)
 
-    date = _get_date(filetype, path)
-    checksum = _get_checksum(file_path, checksum_type)
-    loc = ''
-    if filetype in [FileType.SOURCE, FileType.CONF, FileType.PROJECT]:
-        loc = str(count_code_lines(file_path))
-    elif filetype is FileType.IMAGE:
-        (width, height), bits = get_image_details(file_path)
-        loc = f'{width}x{height} {bits}bits'
+    date = _get_date(filetype, stat_result)
+
+    # 파일은 한 번만 읽고 체크섬, LOC, 설명, 헤더 주석 단계가 같은 버퍼를 사용
+    # 분석 결과가 캐시에 있으면 해시 계산 외의 분석은 건너뜀
+    with FileContext(file_path, size) as ctx:
+        algorithms = _checksum_algorithms(checksum_type) or []
+        digests = hash_data(ctx.data, algorithms + [CACHE_KEY_ALGORITHM])
+        checksum = _get_checksum(file_path, checksum_type, digests=digests)
+
+        descriptor = get_descriptor()
+        model = descriptor.model if descriptor.is_connectable else ""
+        cache_key = _get_cache_key(digests, extension, model)
+        cached = analysis_cache.get(cache_key)
+        pending = None
+        source = ""
+        if cached is not None:
+            loc, desc = cached
+            source = "cache"
+        else:
+            loc = ''
+            if filetype in [FileType.SOURCE, FileType.CONF, FileType.PROJECT]:
+                # 디코딩하지 않고 바이트로 세므로 CP949 등 UTF-8이 아닌 소스도 LOC를 계산
+                loc = str(count_code_lines_in_bytes(ctx.data))
+            elif filetype is FileType.IMAGE:
+                # 해상도를 읽을 수 없는 이미지도 목록에는 포함 (LOC 비움)
+                details = get_image_details(file_path, ctx.data)
+                if details is not None:
+                    (width, height), bits = details
+                    loc = f'{width}x{height} {bits}bits' if bits else f'{width}x{height}'
+
+            desc = ''
+            # 헤더 주석은 파일 앞부분만 디코딩하여 찾음 (큰 파일 전체를 디코딩하지 않음)
+            header_comment = leading_multiline_comments_in_lines(ctx.head_lines or [])
+            future, source = None, ""
+            if DESCRIPTION_RULES:
+                rule_desc = describe_by_rules(RuleContext(filename, extension.lower(), filetype, size,
+                                                          ctx.head_lines, is_binary(ctx.data), header_comment))
+                if rule_desc:
+                    future, source = Future(), "rule"
+                    future.set_result(rule_desc)
+            if future is None and draft:
+                future, source = Future(), "draft"
+                future.set_result("")
+            if future is None:
+                future, source = _submit_description(file_path, ctx, stat_result,
+                                                     digests[CACHE_KEY_ALGORITHM], deadline,
+                                                     description_index if model else None,
+                                                     header_comment != "")
+            pending = _PendingDescription(future, header_comment, cache_key, model, loc, source)
 
-    desc = descriptor.describe_file_with_requests(file_path)
-    if desc == "":
-        desc = leading_multiline_comments(file_path)
-    
     directory_name = os.path.dirname(os.path.relpath(file_path, root_path))
     if not directory_name.startswith("/"):
         directory_name = "/" + directory_name
@@ -154,59 +341,312 @@ def get_file_data(index: int,
         date=date,
         partNumber=partnumber,
         loc=loc,
-        description=desc
-    )
+        description=desc,
+        descriptionSource=source
+    ), pending
+
+
+def _resolve_description(data: FileData, pending: _PendingDescription, deadline: float | None) -> None:
+    """제출한 설명 생성 결과를 기다려 data.description을 채우고 분석 결과 캐시에 저장합니다.
+    deadline까지 결과가 없거나 설명을 받지 못하면 헤더 주석을 사용합니다.
+    설명 출처(LLM이면 응답한 백엔드)를 data.descriptionSource에 기록합니다.
+    """
+    timeout = None if deadline is None else max(0.0, deadline - time.time())
+    try:
+        desc = pending.future.result(timeout)
+    except FutureTimeoutError:
+        # 재사용한 요청은 다른 파일도 기다리고 있으므로 취소하지 않음 (어차피 같은 deadline)
+        if not pending.source:
+            pending.future.cancel()
+        desc = ""
+    except Exception as e:
+        print(f"파일 설명 생성 중 오류 발생: {e}")
+        desc = ""
+    # 모델 키로 요청했는데 설명을 받지 못한 경우는 일시적인 오류일 수 있으므로 저장하지 않음
+    cacheable = desc != "" or pending.model == ""
+    if desc == "":
+        desc = pending.fallback
+        # 재사용한 요청이 실패한 경우도 헤더 주석으로 대신한 것으로 기록 (부하 조절, 초안은 그대로)
+        source = pending.source if pending.source in ("reduced", "shed", "draft") else "header"
+    else:
+        source = pending.source or f"ollama:{getattr(pending.future, 'backend', '')}"
+    if cacheable:
+        analysis_cache.put(pending.cache_key, pending.loc, desc)
+    data.description = desc
+    data.descriptionSource = source
 
 
 def get_sps_data(device_request: SpsRequest, zip_extract_path: str) -> List[FileData]:
     retval: List[FileData] = []
 
-    path_obj = Path(zip_extract_path)
-    for file_path in path_obj.rglob('*'):
-        if file_path.is_file():
-            filepath = str(file_path)
-            
-            index = 1
-            prefix = f"E{index:03d}"
-            
-            try:
-                data = get_file_data(index,
-                                    device_request.device,
-                                    device_request.csu,
-                                    device_request.version,
-                                    device_request.partnumber+prefix,
-                                    CHECKSUM.SHA256, filepath, zip_extract_path)
-                retval.append(data)
-                index += 1
-            except Exception as e:
-                print(f"'{filepath}' 파일 파싱 중 오류 발생: {e}")
+    for entry in walk_files(zip_extract_path):
+        filepath = entry.path
+
+        index = 1
+        prefix = f"E{index:03d}"
+
+        try:
+            data = get_file_data(index,
+                                 device_request.device,
+                                 device_request.csu,
+                                 device_request.version,
+                                 device_request.partnumber+prefix,
+                                 CHECKSUM.SHA256, filepath, zip_extract_path,
+                                 entry.stat())
+            retval.append(data)
+            index += 1
+        except Exception as e:
+            print(f"'{filepath}' 파일 파싱 중 오류 발생: {e}")
     return retval
 
 
-def get_sps_data_csc(device_request: SpsProject, zip_extract_path: str) -> List[FileData]:
-    retval: List[FileData] = []
+def _get_file_data_pipelined(jobs: List[tuple],
+                             progress: Callable[[int, int], None] | None = None,
+                             saved_calls: Counter | None = None,
+                             draft: bool = False,
+                             drafts: List[tuple[int, str, str, str]] | None = None) -> List[FileData | None]:
+    """파일 분석과 설명 생성을 겹쳐서 실행하고 입력 순서대로 결과를 반환합니다.
+    jobs의 각 항목은 get_file_data()의 인자(deadline 포함)입니다.
+    설명 생성 요청을 제출한 뒤 결과를 기다리지 않고 다음 파일의 해시, LOC 계산을 진행합니다.
+    기다리는 요청은 descriptor.capacity * DESCRIPTION_PENDING_PER_SLOT개까지만 유지합니다.
+    같거나 비슷한 파일은 먼저 제출한 설명 요청을 재사용합니다.
+    LLM 호출 없이 설명을 정한 파일 수는 종류별(_PendingDescription.source)로 saved_calls에 더합니다.
+    draft가 True이면 LLM에 요청하지 않으며, 헤더 주석을 설명으로 사용한 파일을
+    (jobs 순서, 파일 경로, 캐시 키, LOC)로 drafts에 추가합니다.
+    """
+    results: List[FileData | None] = [None] * len(jobs)
+    window: deque = deque()
+    max_pending = get_descriptor().capacity * DESCRIPTION_PENDING_PER_SLOT
+    description_index = DescriptionIndex(SIMILARITY_MAX_DISTANCE)
+    processed = 0
+
+    def finish(order: int, pending: _PendingDescription | None) -> None:
+        nonlocal processed
+        data = results[order]
+        if data is not None and pending is not None:
+            _resolve_description(data, pending, jobs[order][9])
+            if pending.source == "draft":
+                if drafts is not None:
+                    drafts.append((order, jobs[order][6], pending.cache_key, pending.loc))
+            elif pending.source and saved_calls is not None:
+                saved_calls[pending.source] += 1
+        processed += 1
+        if progress is not None:
+            progress(processed, len(jobs))
+
+    for order, args in enumerate(jobs):
+        try:
+            results[order], pending = _analyze_file(*args, description_index=description_index, draft=draft)
+        except Exception as e:
+            print(f"'{args[6]}' 파일 파싱 중 오류 발생: {e}")
+            pending = None
+        window.append((order, pending))
+        while len(window) > max_pending or (window and window[0][1] is None):
+            finish(*window.popleft())
+
+    while window:
+        finish(*window.popleft())
+    return results
+
+
+def _get_file_data_batch(batch: List[tuple[int, tuple]], draft: bool = False
+                         ) -> tuple[List[tuple[int, FileData | None]], Counter, List[tuple[int, str, str, str]]]:
+    """병렬 처리 단위(batch)의 파일들을 분석합니다. 작업 풀에서 실행됩니다.
+    설명 재사용은 batch 안의 파일끼리만 합니다. drafts의 순서는 전체 jobs 기준으로 바꿔 반환합니다.
+    """
+    saved_calls: Counter = Counter()
+    drafts: List[tuple[int, str, str, str]] = []
+    results = _get_file_data_pipelined([args for _, args in batch], saved_calls=saved_calls,
+                                       draft=draft, drafts=drafts)
+    drafts = [(batch[order][0], *rest) for order, *rest in drafts]
+    return [(order, data) for (order, _), data in zip(batch, results)], saved_calls, drafts
+
+
+def _make_size_balanced_batches(jobs: List[tuple], sizes: List[int],
+                                batch_count: int) -> List[List[tuple[int, tuple]]]:
+    """파일 크기 합이 비슷하도록 작업을 batch_count개로 나눕니다.
+    큰 파일부터 현재 크기 합이 가장 작은 batch에 배정하고(LPT),
+    각 batch 안에서는 원래 순서를 유지합니다.
+    """
+    batch_count = max(1, min(batch_count, len(jobs)))
+    heap = [(0, n) for n in range(batch_count)]
+    batches: List[List[tuple[int, tuple]]] = [[] for _ in range(batch_count)]
 
+    for order in sorted(range(len(jobs)), key=lambda k: sizes[k], reverse=True):
+        total, n = heapq.heappop(heap)
+        batches[n].append((order, jobs[order]))
+        heapq.heappush(heap, (total + sizes[order], n))
+
+    for batch in batches:
+        batch.sort(key=lambda item: item[0])
+    return [batch for batch in batches if batch]
+
+
+def _get_file_data_parallel(jobs: List[tuple],
+                            workers: int,
+                            progress: Callable[[int, int], None] | None,
+                            saved_calls: Counter | None = None,
+                            draft: bool = False,
+                            drafts: List[tuple[int, str, str, str]] | None = None) -> List[FileData | None]:
+    """작업 풀에서 파일들을 병렬로 분석하고 입력 순서대로 결과를 반환합니다."""
+    sizes = [args[8].st_size for args in jobs]
+    batches = _make_size_balanced_batches(jobs, sizes, workers * PARSER_BATCHES_PER_WORKER)
+
+    results: List[FileData | None] = [None] * len(jobs)
+    if PARSER_EXECUTOR == "process":
+        # 요청 스레드, Ollama 요청 풀 등이 실행 중인 프로세스에서 fork하면
+        # 다른 스레드가 잡고 있던 잠금이 그대로 복사되어 작업자가 멈출 수 있으므로 spawn으로 시작
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        futures = [executor.submit(_get_file_data_batch, batch, draft) for batch in batches]
+        processed = 0
+        for future in as_completed(futures):
+            batch_results, batch_stats, batch_drafts = future.result()
+            for order, data in batch_results:
+                results[order] = data
+                processed += 1
+            if saved_calls is not None:
+                saved_calls.update(batch_stats)
+            if drafts is not None:
+                drafts.extend(batch_drafts)
+            if progress is not None:
+                progress(processed, len(jobs))
+    return results
+
+
+def get_sps_data_csc(device_request: SpsProject,
+                     zip_extract_path: str,
+                     progress: Callable[[int, int], None] | None = None,
+                     workers: int = PARSER_WORKERS,
+                     saved_calls: Counter | None = None,
+                     drafts: List[DraftDescription] | None = None) -> List[FileData]:
+    """프로젝트의 CSU 디렉토리들을 탐색하여 모든 파일의 FileData 목록을 반환합니다.
+    workers가 1보다 크면 파일 분석을 작업 풀에서 병렬로 수행하며, 결과 순서는 순차 처리와 같습니다.
+    단, 설명 재사용(체크섬, SimHash)은 batch 안의 파일끼리만 하므로 서로 다른 batch에 들어간
+    비슷한 파일은 각자 설명을 요청하며, 설명 내용이 순차 처리와 다를 수 있습니다.
+    파일을 탐색하는 동안 백그라운드에서 Ollama 모델을 미리 올려 첫 설명 요청의 모델 로딩 시간을 줄입니다.
+    Ollama 설명 생성은 요청 풀에서 동시에 실행되어 해시, LOC 계산과 겹쳐 진행되며,
+    ollama.toml의 jobTimeout이 지나면 남은 파일은 헤더 주석을 설명으로 사용합니다.
+    이미지, 바이너리, 프로젝트 파일 등 규칙으로 설명이 정해지는 파일은 LLM을 호출하지 않으며,
+    체크섬이 같거나 내용이 비슷한(SimHash) 파일은 먼저 요청한 설명을 재사용합니다.
+
+    Args:
+        device_request (SpsProject): 프로젝트 정보.
+        zip_extract_path (str): 압축 해제된 프로젝트 경로.
+        progress (Callable[[int, int], None] | None): (처리한 파일 수, 전체 파일 수)를 받는 콜백.
+        workers (int): 병렬 처리 작업자 수. 1 이하이면 순차 처리합니다.
+        saved_calls (Counter | None): LLM 호출 없이 설명을 정한 파일 수를 종류별로 더할 Counter.
+            ("exact", "near", "rule", 부하 조절로 생략한 경우 "reduced", "shed")
+        drafts (List[DraftDescription] | None): 지정하면 초안 모드로 실행합니다. LLM에 요청하지 않고
+            헤더 주석을 설명으로 사용하며, 그런 파일을 추가합니다. enrich_descriptions()로 보강합니다.
+
+    Returns:
+        List[FileData]: 분석된 파일 목록. 분석 중 오류가 난 파일은 제외됩니다.
+    """
+    descriptor = get_descriptor()
+    deadline = descriptor.job_deadline()
+    descriptor.warmup()
+    jobs: List[tuple] = []
     for item in device_request.csu:
-        csu_name = item.csu
         directory = zip_extract_path + "/" + item.dir
 
-        path_obj = Path(directory)
-        for file_path in path_obj.rglob('*'):
-            if file_path.is_file():
-                filepath = str(file_path)
-                
-                index = 1
-                prefix = f"E{index:03d}"
-                
-                try:
-                    data = get_file_data(index,
-                                        device_request.device,
-                                        csu_name,
-                                        device_request.version,
-                                        device_request.partnumber+prefix,
-                                        CHECKSUM.SHA256, filepath, zip_extract_path)
-                    retval.append(data)
-                    index += 1
-                except Exception as e:
-                    print(f"'{filepath}' 파일 파싱 중 오류 발생: {e}")
-    return retval
+        for entry in walk_files(directory):
+            try:
+                stat_result = entry.stat()
+            except OSError as e:
+                print(f"'{entry.path}' 파일 파싱 중 오류 발생: {e}")
+                continue
+
+            index = 1
+            prefix = f"E{index:03d}"
+            jobs.append((index,
+                         device_request.device,
+                         item.csu,
+                         device_request.version,
+                         device_request.partnumber+prefix,
+                         device_request.checksum_type, entry.path, zip_extract_path, stat_result,
+                         deadline))
+
+    if saved_calls is None:
+        saved_calls = Counter()
+    draft = drafts is not None
+    draft_orders: List[tuple[int, str, str, str]] = []
+    if workers > 1 and len(jobs) > 1:
+        results = _get_file_data_parallel(jobs, workers, progress, saved_calls, draft, draft_orders)
+    else:
+        results = _get_file_data_pipelined(jobs, progress, saved_calls, draft, draft_orders)
+    if saved_calls.total():
+        print(f"LLM 호출 {saved_calls.total()}회 절약: 규칙 {saved_calls['rule']}개, "
+              f"같은 파일 {saved_calls['exact']}개, 비슷한 파일 {saved_calls['near']}개, "
+              f"부하 조절 {saved_calls['reduced'] + saved_calls['shed']}개")
+
+    if drafts is not None:
+        for order, file_path, cache_key, loc in sorted(draft_orders):
+            if results[order] is not None:
+                drafts.append(DraftDescription(results[order], file_path, cache_key, loc))
+
+    return [data for data in results if data is not None]
+
+
+def enrich_descriptions(drafts: List[DraftDescription],
+                        progress: Callable[[int, int], None] | None = None,
+                        saved_calls: Counter | None = None) -> int:
+    """초안 단계에서 헤더 주석을 사용한 설명을 LLM 설명으로 바꿉니다.
+    설명을 만들기 위해 파일 내용은 다시 읽지만 체크섬과 LOC는 다시 계산하지 않으며,
+    DraftDescription.data의 description만 바꿉니다. 같거나 비슷한 파일은 설명 요청을 재사용합니다.
+
+    Args:
+        drafts (List[DraftDescription]): get_sps_data_csc()가 초안 모드에서 채운 목록.
+        progress (Callable[[int, int], None] | None): (처리한 파일 수, 전체 파일 수)를 받는 콜백.
+        saved_calls (Counter | None): 설명을 재사용해 줄인 LLM 호출 수를 종류별로 더할 Counter.
+
+    Returns:
+        int: LLM 설명으로 바뀐 파일 수. Ollama를 사용할 수 없으면 0을 반환합니다.
+    """
+    descriptor = get_descriptor()
+    if not drafts or not descriptor.is_connectable:
+        return 0
+
+    deadline = descriptor.job_deadline()
+    model = descriptor.model
+    description_index = DescriptionIndex(SIMILARITY_MAX_DISTANCE)
+    window: deque = deque()
+    max_pending = descriptor.capacity * DESCRIPTION_PENDING_PER_SLOT
+    processed = 0
+    enriched = 0
+
+    def finish(draft: DraftDescription, pending: _PendingDescription | None) -> None:
+        nonlocal processed, enriched
+        if pending is not None:
+            fallback = draft.data.description
+            _resolve_description(draft.data, pending, deadline)
+            if draft.data.description != fallback:
+                enriched += 1
+            if pending.source and saved_calls is not None:
+                saved_calls[pending.source] += 1
+        processed += 1
+        if progress is not None:
+            progress(processed, len(drafts))
+
+    for draft in drafts:
+        pending = None
+        try:
+            stat_result = os.stat(draft.file_path)
+            with FileContext(draft.file_path, stat_result.st_size) as ctx:
+                # 캐시 키는 내용 해시를 포함하므로 같은 파일을 찾는 키로 사용
+                future, source = _submit_description(draft.file_path, ctx, stat_result, draft.cache_key,
+                                                     deadline, description_index,
+                                                     draft.data.description != "")
+            pending = _PendingDescription(future, draft.data.description, draft.cache_key, model,
+                                          draft.loc, source)
+        except Exception as e:
+            print(f"'{draft.file_path}' 파일 설명 보강 중 오류 발생: {e}")
+        window.append((draft, pending))
+        while len(window) > max_pending:
+            finish(*window.popleft())
+
+    while window:
+        finish(*window.popleft())
+    return enriched
@@ -1,9 +1,14 @@
-import yaml
 from app.schema.web_api import SpsProject, Csu
 
 def parse_sps_project(file_path: str) -> SpsProject:
     with open(file_path, 'r') as file:
-        data = yaml.safe_load(file)
+        return parse_sps_project_text(file.read())
+
+
+def parse_sps_project_text(text: str | bytes) -> SpsProject:
+    import yaml  # 앱 시작 시간을 줄이기 위해 프로젝트 파일을 처음 읽을 때 import
+
+    data = yaml.safe_load(text)
     project_data = data.get('project', {})
     csu_list = [Csu(csu=item['csu'], dir=item['dir']) for item in project_data.get('csu', [])]
     return SpsProject(
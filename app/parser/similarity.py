@@ -0,0 +1,77 @@
+"""유사 파일 색인 모듈
+같은 작업 안에서 내용이 같거나 거의 같은 파일은 이미 요청한 설명을 함께 사용하도록
+파일 내용의 SimHash 지문을 색인합니다.
+
+- 내용이 같은 파일은 체크섬으로 찾습니다.
+- 거의 같은 파일은 64비트 SimHash의 해밍 거리가 max_distance 이하인 파일입니다.
+  지문을 max_distance + 1개 구간으로 나누어 색인하면 거리가 max_distance 이하인 두 지문은
+  적어도 한 구간이 같으므로(비둘기집 원리) 전체를 비교하지 않고 후보만 확인합니다.
+"""
+import hashlib
+import re
+from collections import Counter
+from concurrent.futures import Future
+
+SIMHASH_BITS = 64
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """단어 빈도를 가중치로 한 64비트 SimHash 지문을 계산합니다."""
+    weights = [0] * SIMHASH_BITS
+    for token, count in Counter(_TOKEN_PATTERN.findall(text)).items():
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class DescriptionIndex:
+    """설명 요청 색인
+    파일마다 설명 요청(Future)을 등록하고, 같은 그룹(확장자)에서 같거나 비슷한 파일을 찾습니다.
+    """
+
+    def __init__(self, max_distance: int) -> None:
+        """
+        초기화
+        Args:
+            max_distance: 비슷한 파일로 볼 최대 해밍 거리. 0보다 작으면 같은 파일만 찾습니다.
+        """
+        self.max_distance = max_distance
+        self.bands = max_distance + 1 if max_distance >= 0 else 0
+        self._exact: dict[str, Future] = {}
+        self._band_index: dict[tuple[str, int, int], list[tuple[int, Future]]] = {}
+
+    def _band_keys(self, group: str, fingerprint: int) -> list[tuple[str, int, int]]:
+        width = SIMHASH_BITS // self.bands
+        mask = (1 << width) - 1
+        return [(group, n, fingerprint >> (n * width) & mask) for n in range(self.bands)]
+
+    def find(self, checksum: str, group: str, fingerprint: int | None) -> tuple[Future, str] | None:
+        """같거나 비슷한 파일의 설명 요청을 찾습니다.
+
+        Returns:
+            tuple[Future, str] | None: (설명 요청, "exact" 또는 "near"). 없으면 None.
+        """
+        future = self._exact.get(checksum)
+        if future is not None:
+            return future, "exact"
+        if fingerprint is None or not self.bands:
+            return None
+        for key in self._band_keys(group, fingerprint):
+            for other, future in self._band_index.get(key, []):
+                if (fingerprint ^ other).bit_count() <= self.max_distance:
+                    return future, "near"
+        return None
+
+    def add(self, checksum: str, group: str, fingerprint: int | None, future: Future) -> None:
+        """파일의 설명 요청을 등록합니다."""
+        self._exact.setdefault(checksum, future)
+        if fingerprint is None or not self.bands:
+            return
+        for key in self._band_keys(group, fingerprint):
+            self._band_index.setdefault(key, []).append((fingerprint, future))
@@ -0,0 +1,33 @@
+"""디렉토리 탐색 모듈"""
+import os
+from typing import Iterator
+
+
+def walk_files(directory: str) -> Iterator[os.DirEntry]:
+    """os.scandir 기반으로 디렉토리 아래의 모든 파일을 찾습니다.
+    Path(directory).rglob('*')에서 is_file()인 항목과 같은 순서로 반환하며,
+    반환된 DirEntry의 stat() 결과는 캐시되므로 파일당 stat 호출은 한 번뿐입니다.
+
+    - 각 디렉토리의 파일을 먼저 반환한 뒤 하위 디렉토리를 깊이 우선으로 탐색합니다.
+    - 디렉토리 심볼릭 링크는 따라가지 않고, 파일 심볼릭 링크는 파일로 취급합니다.
+    - 존재하지 않거나 권한이 없는 디렉토리는 건너뜁니다.
+
+    Args:
+        directory (str): 탐색할 디렉토리 경로.
+
+    Yields:
+        os.DirEntry: 파일 항목.
+    """
+    try:
+        with os.scandir(os.path.normpath(directory)) as scandir_it:
+            entries = list(scandir_it)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+
+    for entry in entries:
+        if entry.is_file():
+            yield entry
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_files(entry.path)
@@ -7,3 +7,16 @@ class CHECKSUM(str, Enum):
     """
     MD5 = "MD5"
     SHA256 = "SHA256"
+
+
+class JobStage(str, Enum):
+    """작업 단계
+    비동기 SPS 작업의 진행 단계
+    """
+    QUEUED = "queued"
+    EXTRACTING = "extracting"
+    ANALYZING = "analyzing"
+    BUILDING = "building"
+    ENRICHING = "enriching"     # 초안 hwpx 생성 후 LLM 설명 보강 중 (draft 작업)
+    DONE = "done"
+    FAILED = "failed"
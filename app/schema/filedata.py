@@ -37,5 +37,7 @@ class FileData(BaseModel):
     loc: str          # 소스코드 만, 이미지일 경우 해상도
 
     description: str  # 가능한 경우.
+    descriptionSource: str = ""  # 설명 출처 (진단용, hwpx에는 기록하지 않음)
+                                 # ollama:<백엔드>, cache, rule, exact, near, header, draft, reduced, shed
 
 
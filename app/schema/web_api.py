@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from app.schema.enums import CHECKSUM
+from pydantic import BaseModel, field_validator
+from app.schema.enums import CHECKSUM, JobStage
 from typing import List
 
 
@@ -23,5 +23,33 @@ class SpsProject(BaseModel):
     device: str
     version: str
     partnumber: str
-    checksum_type: str
+    checksum_type: List[CHECKSUM]
     csu: List[Csu]
+
+    @field_validator("checksum_type", mode="before")
+    @classmethod
+    def _split_checksum_type(cls, value):
+        """체크섬 타입을 "MD5, SHA256" 같은 쉼표 구분 문자열로도 받습니다."""
+        if isinstance(value, str):
+            return [item.strip().upper() for item in value.split(",") if item.strip()]
+        return value
+
+
+class JobStatus(BaseModel):
+    """비동기 작업 상태 스키마"""
+    job_id: str
+    stage: JobStage
+    total_files: int = 0
+    processed_files: int = 0
+    created_at: float
+    updated_at: float
+    finished_at: float | None = None
+    result: str | None = None       # 생성된 hwpx 파일 이름
+    draft_result: str | None = None # 헤더 주석 설명으로 먼저 생성한 초안 hwpx 파일 이름 (draft 작업)
+    error: str | None = None
+    reused_descriptions: int = 0    # 같거나 비슷한 파일의 설명을 재사용해 줄인 LLM 호출 수
+    rule_descriptions: int = 0      # 규칙으로 설명을 정해 줄인 LLM 호출 수
+    enriched_descriptions: int = 0  # 보강 단계에서 LLM 설명으로 바뀐 파일 수 (draft 작업)
+    degradation: str = "normal"     # 부하 조절로 적용된 가장 높은 설명 생성 단계 (normal, reduced, shed)
+    shed_descriptions: int = 0      # 부하 조절로 LLM 대신 헤더 주석을 사용한 파일 수
+    description_sources: dict[str, int] = {}  # 설명 출처별 파일 수 (ollama:<백엔드>, cache, rule, header 등)
@@ -0,0 +1,89 @@
+"""서킷 브레이커 모듈
+외부 서버 호출이 연속으로 실패하면 일정 시간 동안 호출을 막아
+남은 요청이 제한 시간을 모두 기다리지 않고 바로 대체 동작을 하도록 합니다.
+
+- CLOSED: 정상 상태. 연속 실패가 failure_threshold번이 되면 OPEN으로 바뀝니다.
+- OPEN: 호출을 막습니다. probe_interval이 지나면 상태 확인(probe)을 할 수 있습니다.
+- 상태 확인이나 호출이 한 번 성공하면 다시 CLOSED로 바뀝니다.
+- 첫 상태 확인이 진행 중인 동안(UNKNOWN) 다른 호출자는 wait_known()으로 결과를 기다립니다.
+"""
+import threading
+import time
+from enum import Enum
+
+
+class BreakerState(str, Enum):
+    """서킷 브레이커 상태"""
+    UNKNOWN = "unknown"     # 아직 상태를 확인하지 않음
+    CLOSED = "closed"
+    OPEN = "open"
+
+
+class CircuitBreaker:
+    """서킷 브레이커"""
+
+    def __init__(self, failure_threshold: int, probe_interval: float) -> None:
+        """
+        초기화
+        Args:
+            failure_threshold: OPEN으로 바뀌는 연속 실패 횟수
+            probe_interval: OPEN 상태에서 상태 확인을 다시 시도할 간격 (초)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self._lock = threading.Lock()
+        self._state = BreakerState.UNKNOWN
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        # 첫 상태 확인이 끝나 UNKNOWN을 벗어나면 설정됨
+        self._known = threading.Event()
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    def allow(self) -> bool:
+        """호출해도 되는지 반환합니다. CLOSED 상태에서만 True입니다."""
+        return self._state is BreakerState.CLOSED
+
+    def try_acquire_probe(self) -> bool:
+        """상태 확인을 해야 하면 True를 반환합니다. 동시에 하나의 상태 확인만 허용합니다.
+        UNKNOWN 상태이거나, OPEN 상태에서 probe_interval이 지난 경우입니다.
+        True를 받은 쪽은 결과를 record_success()/record_failure(probe=True)로 알려야 합니다.
+        """
+        with self._lock:
+            if self._probing:
+                return False
+            if self._state is BreakerState.UNKNOWN or (
+                    self._state is BreakerState.OPEN
+                    and time.monotonic() - self._opened_at >= self.probe_interval):
+                self._probing = True
+                return True
+            return False
+
+    def wait_known(self, timeout: float | None = None) -> bool:
+        """첫 상태 확인이 끝날 때까지 기다립니다. 상태를 알게 되면 True, 시간이 지나면 False를 반환합니다."""
+        return self._known.wait(timeout)
+
+    def record_success(self) -> None:
+        """호출 또는 상태 확인 성공을 기록하고 CLOSED로 바꿉니다."""
+        with self._lock:
+            self._state = BreakerState.CLOSED
+            self._failures = 0
+            self._probing = False
+            self._known.set()
+
+    def record_failure(self, probe: bool = False) -> None:
+        """호출 또는 상태 확인 실패를 기록합니다.
+        상태 확인 실패는 바로 OPEN으로, 호출 실패는 연속 failure_threshold번이면 OPEN으로 바꿉니다.
+        """
+        with self._lock:
+            if probe:
+                self._probing = False
+            self._failures += 1
+            if probe or self._failures >= self.failure_threshold:
+                if self._state is not BreakerState.OPEN or probe:
+                    self._opened_at = time.monotonic()
+                self._state = BreakerState.OPEN
+                self._known.set()
@@ -0,0 +1,95 @@
+"""해시 계산 모듈
+파일 하나를 한 번만 읽으면서 여러 알고리즘의 digest를 함께 계산합니다.
+
+- 작은 파일은 스레드별로 미리 할당한 버퍼에 readinto()로 읽어 청크마다 bytes를 새로 만들지 않습니다.
+- mmap_threshold 이상의 큰 파일은 mmap으로 매핑하여 해시합니다.
+- hashlib은 2047바이트보다 큰 데이터를 update()할 때 GIL을 놓으므로
+  여러 스레드에서 동시에 호출하면 병렬로 계산됩니다.
+"""
+import hashlib
+import mmap
+import threading
+from typing import Iterable
+
+from app.environments.env import FILE_MMAP_THRESHOLD, HASH_BUFFER_SIZE
+
+_local = threading.local()
+
+
+def _get_buffer(buffer_size: int) -> memoryview:
+    """현재 스레드에서 재사용하는 읽기 버퍼를 반환합니다."""
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None or len(buffer) != buffer_size:
+        buffer = memoryview(bytearray(buffer_size))
+        _local.buffer = buffer
+    return buffer
+
+
+def _new_hashers(algorithms: Iterable[str]) -> dict:
+    """알고리즘 이름(대소문자 무관)별 hashlib 객체를 생성합니다. 중복된 이름은 한 번만 계산합니다."""
+    hashers = {}
+    for name in algorithms:
+        key = name.lower()
+        if key not in hashers:
+            hashers[key] = hashlib.new(key)
+    if not hashers:
+        raise ValueError("No hash algorithm specified.")
+    return hashers
+
+
+def hash_data(data, algorithms: Iterable[str], chunk_size: int = HASH_BUFFER_SIZE) -> dict[str, str]:
+    """이미 읽어 둔 데이터(bytes, mmap 등 buffer protocol 객체)의 digest를 계산합니다.
+    청크 단위로 모든 알고리즘을 갱신하므로 데이터를 한 번만 훑습니다.
+
+    Args:
+        data: 해시할 데이터.
+        algorithms (Iterable[str]): hashlib 알고리즘 이름 목록 (예: "md5", "sha256").
+        chunk_size (int): 한 번에 해시할 크기 (바이트 단위).
+
+    Returns:
+        dict[str, str]: 소문자 알고리즘 이름을 키로 하는 16진수 digest.
+    """
+    hashers = _new_hashers(algorithms)
+    view = memoryview(data)
+    try:
+        for offset in range(0, len(view), chunk_size):
+            chunk = view[offset:offset + chunk_size]
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    finally:
+        view.release()
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+def hash_file(file_path: str,
+              algorithms: Iterable[str],
+              buffer_size: int = HASH_BUFFER_SIZE,
+              mmap_threshold: int = FILE_MMAP_THRESHOLD) -> dict[str, str]:
+    """파일의 digest를 한 번의 읽기로 계산합니다.
+
+    Args:
+        file_path (str): 해시할 파일 경로.
+        algorithms (Iterable[str]): hashlib 알고리즘 이름 목록 (예: "md5", "sha256").
+        buffer_size (int): readinto()에 사용할 버퍼 크기 (바이트 단위).
+        mmap_threshold (int): 이 크기 이상이면 mmap을 사용합니다.
+
+    Returns:
+        dict[str, str]: 소문자 알고리즘 이름을 키로 하는 16진수 digest.
+
+    Raises:
+        OSError: 파일을 열거나 읽지 못한 경우
+    """
+    hashers = _new_hashers(algorithms)
+    with open(file_path, "rb", buffering=0) as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        if size and size >= mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hash_data(mapped, hashers.keys(), buffer_size)
+
+        buffer = _get_buffer(buffer_size)
+        while n := f.readinto(buffer):
+            chunk = buffer[:n]
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
@@ -0,0 +1,107 @@
+"""설명 생성 부하 조절(load shedding) 모듈
+작업 대기열이 길어지거나 Ollama 응답이 느려지면 LLM 설명 요청을 줄여
+모든 작업이 헤더 주석 설명으로라도 제때 끝나도록 합니다.
+
+- NORMAL: 모든 파일에 LLM 설명을 요청합니다.
+- REDUCED: 헤더 주석이 있는 파일은 헤더 주석을 사용하고, 없는 파일만 LLM에 요청합니다.
+- SHED: LLM에 요청하지 않고 헤더 주석을 사용합니다.
+
+단계는 대기열 길이와 응답 시간 중 높은 쪽으로 올라가며, 두 값이 모두 현재 단계 기준의
+recover_ratio배 아래로 내려가야 낮아집니다. (기준 근처에서 단계가 자주 바뀌지 않도록 함)
+"""
+import threading
+import time
+from enum import IntEnum
+from typing import Callable
+
+from app.environments.env import (SHED_LATENCY_REDUCE, SHED_LATENCY_SHED, SHED_QUEUE_REDUCE,
+                                  SHED_QUEUE_SHED, SHED_RECOVER_RATIO)
+
+
+class DegradationLevel(IntEnum):
+    """설명 생성 단계"""
+    NORMAL = 0
+    REDUCED = 1
+    SHED = 2
+
+
+def _level_for(value: float, reduce_at: float, shed_at: float, scale: float = 1.0) -> DegradationLevel:
+    """value가 기준 이상인 가장 높은 단계를 반환합니다. 기준이 0 이하이면 사용하지 않습니다."""
+    if shed_at > 0 and value >= shed_at * scale:
+        return DegradationLevel.SHED
+    if reduce_at > 0 and value >= reduce_at * scale:
+        return DegradationLevel.REDUCED
+    return DegradationLevel.NORMAL
+
+
+class LoadShedder:
+    """설명 생성 부하 조절기"""
+
+    def __init__(self,
+                 queue_reduce: int, queue_shed: int,
+                 latency_reduce: float, latency_shed: float,
+                 recover_ratio: float = 0.8,
+                 latency_alpha: float = 0.3,
+                 latency_stale_after: float = 60.0) -> None:
+        """
+        초기화
+        Args:
+            queue_reduce: REDUCED로 바꾸는 작업 대기열 길이 (0이면 사용하지 않음)
+            queue_shed: SHED로 바꾸는 작업 대기열 길이 (0이면 사용하지 않음)
+            latency_reduce: REDUCED로 바꾸는 Ollama 응답 시간 (초, 0이면 사용하지 않음)
+            latency_shed: SHED로 바꾸는 Ollama 응답 시간 (초, 0이면 사용하지 않음)
+            recover_ratio: 단계를 낮출 때 기준에 곱하는 비율
+            latency_alpha: 응답 시간 지수 이동 평균의 가중치
+            latency_stale_after: 이 시간(초) 동안 응답이 없으면 응답 시간을 모르는 것으로 봅니다.
+                                 SHED 단계에서는 요청이 없으므로 이 시간이 지나야 다시 요청해 볼 수 있습니다.
+        """
+        self.queue_reduce = queue_reduce
+        self.queue_shed = queue_shed
+        self.latency_reduce = latency_reduce
+        self.latency_shed = latency_shed
+        self.recover_ratio = recover_ratio
+        self.latency_alpha = latency_alpha
+        self.latency_stale_after = latency_stale_after
+        self.queue_depth: Callable[[], int] = lambda: 0
+        self._lock = threading.Lock()
+        self._latency: float | None = None
+        self._latency_at = 0.0
+        self._level = DegradationLevel.NORMAL
+
+    @property
+    def latency(self) -> float:
+        """최근 Ollama 응답 시간의 이동 평균 (초). 오래되었거나 기록이 없으면 0입니다."""
+        if self._latency is None or time.monotonic() - self._latency_at > self.latency_stale_after:
+            return 0.0
+        return self._latency
+
+    def observe_latency(self, seconds: float) -> None:
+        """Ollama 요청 하나의 응답 시간을 기록합니다."""
+        with self._lock:
+            if self._latency is None or time.monotonic() - self._latency_at > self.latency_stale_after:
+                self._latency = seconds
+            else:
+                self._latency += self.latency_alpha * (seconds - self._latency)
+            self._latency_at = time.monotonic()
+
+    def level(self) -> DegradationLevel:
+        """현재 대기열 길이와 응답 시간으로 설명 생성 단계를 정해 반환합니다."""
+        depth = self.queue_depth()
+        latency = self.latency
+        raise_to = max(_level_for(depth, self.queue_reduce, self.queue_shed),
+                       _level_for(latency, self.latency_reduce, self.latency_shed))
+        hold = max(_level_for(depth, self.queue_reduce, self.queue_shed, self.recover_ratio),
+                   _level_for(latency, self.latency_reduce, self.latency_shed, self.recover_ratio))
+        with self._lock:
+            if raise_to > self._level:
+                self._level = raise_to
+                print(f"설명 생성 단계 상향: {self._level.name} (대기열 {depth}, 응답 {latency:.1f}초)")
+            elif hold < self._level:
+                self._level = hold
+                print(f"설명 생성 단계 하향: {self._level.name} (대기열 {depth}, 응답 {latency:.1f}초)")
+            return self._level
+
+
+# 대기열 길이는 작업 실행기(app.job.executor)가 queue_depth에 연결합니다.
+load_shedder = LoadShedder(SHED_QUEUE_REDUCE, SHED_QUEUE_SHED,
+                           SHED_LATENCY_REDUCE, SHED_LATENCY_SHED, SHED_RECOVER_RATIO)
@@ -1,11 +1,73 @@
 import json
 import os
 import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
 import tomli as tomllib
 
+from app.environments.env import JOB_EXECUTOR, JOB_WORKERS, PARSER_EXECUTOR, PARSER_WORKERS
+from app.parser.file_digest import build_file_digest, estimate_tokens
+from app.util.circuit_breaker import CircuitBreaker
+from app.util.ollama_backends import BackendPool, OllamaBackend
+from app.util.load_shedding import load_shedder
+from app.util.ollama_batch import (BatchItem, DescriptionBatcher, build_batch_prompt,
+                                   parse_batch_response, set_future_result)
+
+if TYPE_CHECKING:
+    import requests
+
+# 설명 최대 길이. 넘으면 설명으로 사용하지 않습니다.
+DESCRIPTION_MAX_CHARS = 100
+# 최근 요청의 생성 시간 기록 수 (GET /ollama/metrics)
+GENERATION_METRICS_SIZE = 1000
+
+# 스트리밍 중에는 마침표 뒤에 글자가 더 올 수 있으므로 ('main' '.' 'py') 뒤에 공백이 온 경우만 문장 끝으로 봄
+_SENTENCE_END = re.compile(r"\n|。|[.!?](?=\s)")
+# num_ctx 계산 시 프롬프트와 생성 토큰 수에 더하는 여유 토큰 수 (템플릿, 토큰 추정 오차)
+CONTEXT_MARGIN_TOKENS = 128
+
+
+def context_size(tokens: int, minimum: int, maximum: int) -> int:
+    """tokens개를 담을 수 있는 num_ctx를 반환합니다.
+    minimum부터 두 배씩 늘린 크기 중 가장 작은 값이며, maximum을 넘지 않습니다.
+    """
+    size = max(1, minimum)
+    while size < tokens and size < maximum:
+        size *= 2
+    return min(size, maximum)
+
+
+def request_processes(job_executor: str = JOB_EXECUTOR, job_workers: int = JOB_WORKERS,
+                      parser_executor: str = PARSER_EXECUTOR, parser_workers: int = PARSER_WORKERS) -> int:
+    """Ollama에 동시에 요청할 수 있는 최대 프로세스 수를 반환합니다.
+    요청 수 제한(maxConcurrency)과 서킷 브레이커는 프로세스마다 따로 관리하므로 이 수로 나누어 적용합니다.
+    파일 분석을 프로세스 풀로 하면 동시에 실행되는 작업마다 작업자 프로세스가 요청하고,
+    작업을 프로세스 풀로 실행하면 작업 프로세스마다 요청합니다.
+    """
+    jobs = max(1, job_workers)
+    if parser_executor == "process" and parser_workers > 1:
+        return jobs * parser_workers
+    return jobs if job_executor == "process" else 1
+
+
+def description_cut(text: str) -> int | None:
+    """스트리밍 중인 설명에서 생성을 멈출 위치를 반환합니다. 계속 받아야 하면 None을 반환합니다.
+    앞쪽 공백을 뺀 내용이 있고 줄바꿈이나 문장 끝(뒤에 공백이 온 마침표 등)이 나오면 그 위치를,
+    문장이 끝나기 전에 DESCRIPTION_MAX_CHARS를 넘으면 text의 길이를 반환합니다.
+    """
+    start = len(text) - len(text.lstrip())
+    match = _SENTENCE_END.search(text, start)
+    if match is not None and text[start:match.start()].strip():
+        return match.start() + (1 if text[match.start()] != "\n" else 0)
+    if len(text) - start > DESCRIPTION_MAX_CHARS:
+        return len(text)
+    return None
+
 
 class OllamaFileDescriptor:
     def __init__(self) -> None:
@@ -13,8 +75,57 @@ class OllamaFileDescriptor:
         self.base_url = config.get("apiBase")
         self.model = config.get("model")
         self.api_url = f"{self.base_url}/api/generate"
-        self.is_connectable = self.check_server_connectivity()
         self.size = self._parse_file_size(config.get('fileSize'))
+        self.prompt_tokens = int(config.get("promptTokens", 1024))
+        num_parallel = max(1, int(config.get("numParallel", 1)))
+        self.request_timeout = float(config.get("requestTimeout", 30))
+        self.job_timeout = float(config.get("jobTimeout", 0))
+        self._lock = threading.Lock()
+        self._pid = None
+        self._session: "requests.Session | None" = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._batcher: DescriptionBatcher | None = None
+        # batchFileTokens 이하의 작은 파일은 여러 개를 한 프롬프트로 묶어 요청
+        self.batch_tokens = int(config.get("batchTokens", 2048))
+        self.batch_max_files = int(config.get("batchMaxFiles", 16))
+        self.batch_file_tokens = int(config.get("batchFileTokens", 256))
+        self.batch_linger = float(config.get("batchLinger", 0.05))
+        # 응답은 스트리밍으로 받으며 설명 하나는 numPredict 토큰까지만 생성
+        self.num_predict = int(config.get("numPredict", 48))
+        self.metrics: deque = deque(maxlen=GENERATION_METRICS_SIZE)
+        # 작업을 시작할 때 모델을 미리 올리고, 요청마다 keepAlive 동안 모델을 유지하도록 요청
+        self.warmup_enabled = bool(config.get("warmup", True))
+        self.keep_alive = config.get("keepAlive", "10m")
+        # num_ctx는 프롬프트 크기에 맞춰 numCtxMin부터 두 배씩 늘려 정함 (numCtxMax가 0이면 서버 기본값)
+        self.num_ctx_min = int(config.get("numCtxMin", 2048))
+        self.num_ctx_max = int(config.get("numCtxMax", 8192))
+        # 서버 상태는 처음 사용할 때 확인하고, 이후에는 백엔드별 서킷 브레이커로 관리
+        self.probe_timeout = float(config.get("probeTimeout", 5))
+        self.processes = request_processes()
+        self.backends = BackendPool(self._load_backends(config, num_parallel))
+        # 요청 스레드 수는 모든 백엔드의 동시 요청 수 합
+        self.parallel = self.backends.capacity
+
+    def _load_backends(self, config: dict, num_parallel: int) -> list[OllamaBackend]:
+        """[[ollama.backends]] 설정으로 백엔드 목록을 만듭니다. 없으면 apiBase 하나를 사용합니다.
+        maxConcurrency(생략하면 numParallel)는 서버 전체의 제한이므로 요청하는 프로세스 수로 나누어
+        프로세스별 제한으로 사용합니다. (프로세스마다 최소 1)
+        """
+        entries = config.get("backends") or [{"apiBase": self.base_url}]
+        failure_threshold = int(config.get("failureThreshold", 3))
+        probe_interval = float(config.get("probeInterval", 30))
+        backends = []
+        for entry in entries:
+            base_url = entry["apiBase"].rstrip("/")
+            name = entry.get("name", base_url)
+            max_concurrency = int(entry.get("maxConcurrency", num_parallel))
+            if max_concurrency < self.processes:
+                print(f"Ollama 백엔드 {name}: maxConcurrency({max_concurrency})가 요청 프로세스 수"
+                      f"({self.processes})보다 작아 동시 요청이 최대 {self.processes}개까지 늘어날 수 있습니다.")
+            backends.append(OllamaBackend(name, base_url, float(entry.get("weight", 1)),
+                                          max(1, max_concurrency // self.processes),
+                                          CircuitBreaker(failure_threshold, probe_interval)))
+        return backends
 
     def _parse_file_size(self, s):
         match = re.match(r'(\d+)(\w+)', s)
@@ -55,45 +166,162 @@ class OllamaFileDescriptor:
 
         return ollama_config
 
-    def check_server_connectivity(self) -> bool:
+    def _ensure_pool(self) -> None:
+        """HTTP 연결 풀과 요청 스레드 풀을 만듭니다. fork된 작업자에서는 새로 만듭니다.
+        requests는 앱 시작 시간을 줄이기 위해 처음 요청할 때 import합니다.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(self.backends.backends),
+                                  pool_maxsize=max(b.max_concurrency for b in self.backends.backends))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+            self._executor = ThreadPoolExecutor(max_workers=self.parallel,
+                                                thread_name_prefix="ollama")
+            self._batcher = DescriptionBatcher(self._submit_batch, self.batch_tokens,
+                                               self.batch_max_files, self.batch_linger)
+            self._pid = pid
+
+    @property
+    def session(self) -> "requests.Session":
+        """백엔드별로 maxConcurrency개의 연결을 재사용하는 HTTP 세션"""
+        self._ensure_pool()
+        return self._session
+
+    @property
+    def capacity(self) -> int:
+        """요청 풀이 한 번에 처리할 수 있는 파일 수 (동시 요청 수 x 묶음 파일 수)"""
+        return self.parallel * max(1, self.batch_max_files)
+
+    def job_deadline(self) -> float | None:
+        """jobTimeout 설정에 따른 작업 전체 설명 생성 마감 시각(time.time() 기준). 설정이 없으면 None"""
+        return time.time() + self.job_timeout if self.job_timeout > 0 else None
+
+    def check_server_connectivity(self, backend: OllamaBackend | None = None) -> bool:
+        import requests
+        backend = backend or self.backends.backends[0]
         try:
-            response = requests.get(f"{self.base_url}", timeout=5)
+            response = self.session.get(backend.base_url, timeout=self.probe_timeout)
             return response.status_code == 200
         except (requests.RequestException, AttributeError):
             return False
 
-    def read_file(self, file_path):
-        try:
-            file_size = os.path.getsize(file_path)
-            if file_size > self.size:
-                raise ValueError("")
-
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except UnicodeDecodeError:
-            filename_with_ext = os.path.basename(file_path)
-            filename, ext = os.path.splitext(filename_with_ext)
-
-            creation_time = os.path.getctime(file_path)
-            modification_time = os.path.getmtime(file_path)
-            access_time = os.path.getatime(file_path)
-
-            result = (
-                f"Filename: {filename}\n"
-                f"Extension: {ext}\n"
-                f"Size: {file_size} bytes\n"
-                f"Creation Time: {creation_time}\n"
-                f"Modification Time: {modification_time}\n"
-                f"Access Time: {access_time}"
-            )
-            return str(result)
-
-    def describe_file_with_requests(self, file_path: str) -> str:
+    def _probe(self, backend: OllamaBackend) -> None:
+        if self.check_server_connectivity(backend):
+            backend.breaker.record_success()
+        else:
+            backend.breaker.record_failure(probe=True)
+        self.backends.wake()
+
+    @property
+    def is_connectable(self) -> bool:
+        """Ollama 서버를 사용할 수 있는지 반환합니다. (백엔드 중 하나라도 사용할 수 있으면 True)
+        처음 호출할 때 백엔드 상태를 동시에 확인하고, 이후에는 백엔드별 서킷 브레이커 상태를 따릅니다.
+        다른 스레드가 시작한 첫 상태 확인이 진행 중이면 그 결과를 기다립니다. (UNKNOWN을 사용 불가로 보지 않음)
+        브레이커가 열린 백엔드는 probeInterval마다 백그라운드에서 상태를 다시 확인하여
+        복구되면 다시 사용합니다.
+        """
+        for backend in self.backends.needs_probe():
+            threading.Thread(target=self._probe, args=(backend,), name="ollama-probe", daemon=True).start()
+        for backend in self.backends.backends:
+            # 상태 확인 요청은 probeTimeout 안에 끝나므로 조금 더 기다림
+            backend.breaker.wait_known(self.probe_timeout + 1)
+        return self.backends.allow()
+
+    def warmup(self) -> None:
+        """백그라운드에서 사용할 수 있는 백엔드마다 모델을 미리 올립니다. (작업 시작, 서버 시작 시 호출)
+        빈 프롬프트 요청은 응답을 생성하지 않고 모델만 올리며, 이미 올라가 있으면 keepAlive만 갱신합니다.
+        요청 중이 아닌 백엔드의 num_ctx는 numCtxMin으로 되돌립니다. (이전 작업의 큰 파일 때문에 커진 KV 캐시를 줄임)
+        다른 작업이 요청 중인 백엔드는 그대로 두어 num_ctx가 바뀌며 모델을 다시 올리지 않게 합니다.
+        num_ctx는 프로세스별로 관리하므로 프로세스 실행기에서는 프로세스마다 따로 늘어납니다.
+        """
+        if not self.warmup_enabled or not self.model:
+            return
+        with self._lock:
+            for backend in self.backends.backends:
+                if backend.in_flight == 0:
+                    backend.num_ctx = 0
+        threading.Thread(target=self._warmup, name="ollama-warmup", daemon=True).start()
+
+    def _warmup(self) -> None:
+        import requests
         if not self.is_connectable:
-            return ""
-        file_content = self.read_file(file_path)
+            return
+        for backend in self.backends.backends:
+            if not backend.breaker.allow():
+                continue
+            payload = {"model": self.model, "prompt": "", "stream": False, "keep_alive": self.keep_alive}
+            if self.num_ctx_max > 0:
+                payload["options"] = {"num_ctx": self._context_size(backend, 0)}
+            started = time.monotonic()
+            try:
+                self.session.post(backend.api_url, json=payload, timeout=self.request_timeout).raise_for_status()
+            except requests.RequestException as e:
+                print(f"Ollama 모델 준비 실패 ({backend.name}): {e}")
+                continue
+            print(f"Ollama 모델 준비 완료 ({backend.name}, {time.monotonic() - started:.1f}초)")
 
-        prompt = f"""
+    def _context_size(self, backend: OllamaBackend, tokens: int) -> int:
+        """backend에 보낼 num_ctx를 반환합니다.
+        num_ctx가 바뀌면 Ollama가 모델을 다시 올리므로 작업 중에는 줄이지 않고 필요할 때만 늘립니다.
+        """
+        with self._lock:
+            backend.num_ctx = max(backend.num_ctx, context_size(tokens, self.num_ctx_min, self.num_ctx_max))
+            return backend.num_ctx
+
+    def backend_stats(self) -> list[dict]:
+        """백엔드별 상태와 요청 수 (진단용)"""
+        return [backend.stats() for backend in self.backends.backends]
+
+    def read_file(self, file_path):
+        stat_result = os.stat(file_path)
+        text = None
+        if stat_result.st_size <= self.size:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    text = file.read()
+            except UnicodeDecodeError:
+                pass
+        return self.file_content(file_path, text, stat_result)
+
+    def file_content(self, file_path: str, text: str | None, stat_result: os.stat_result) -> str:
+        """프롬프트에 넣을 파일 내용을 반환합니다.
+        이미 읽어 둔 텍스트를 사용하며, 텍스트가 아니거나(text가 None)
+        fileSize 설정보다 큰 파일은 메타데이터만 반환합니다.
+        promptTokens 설정보다 긴 텍스트는 헤더 주석, import, 선언 위주의 요약으로 줄입니다.
+        """
+        file_size = stat_result.st_size
+        if text is not None and file_size <= self.size:
+            return build_file_digest(text, self.prompt_tokens)
+
+        filename_with_ext = os.path.basename(file_path)
+        filename, ext = os.path.splitext(filename_with_ext)
+
+        creation_time = stat_result.st_ctime
+        modification_time = stat_result.st_mtime
+        access_time = stat_result.st_atime
+
+        result = (
+            f"Filename: {filename}\n"
+            f"Extension: {ext}\n"
+            f"Size: {file_size} bytes\n"
+            f"Creation Time: {creation_time}\n"
+            f"Modification Time: {modification_time}\n"
+            f"Access Time: {access_time}"
+        )
+        return str(result)
+
+    def build_prompt(self, file_content: str) -> str:
+        return f"""
 파일 내용:
 '''
 {file_content}
@@ -102,25 +330,224 @@ class OllamaFileDescriptor:
 이 파일이 어떤 파일인지 한글 15자 이내로 설명만 작성. 개조식 문장으로 작성. 마지막에 "입니다" 빼.
 """
 
+    def _request(self, prompt: str, deadline: float | None = None,
+                 names: list[str] | None = None) -> tuple[str | None, str]:
+        """/api/generate를 호출하여 (응답 문자열, 응답한 백엔드 이름)을 반환합니다.
+        실패하면 응답 문자열은 None입니다.
+        가장 한가한 백엔드에 요청하고, 실패하면 아직 시도하지 않은 다른 백엔드에 다시 요청합니다.
+        서킷 브레이커가 열린 백엔드에는 요청하지 않습니다.
+        요청마다 requestTimeout을 적용하고, deadline(time.time() 기준)이 지났거나
+        남은 시간이 더 짧으면 그에 맞춰 요청을 생략하거나 제한합니다.
+
+        응답은 스트리밍으로 받으며, names(요청에 담긴 파일 이름)가 둘 이상이면 묶음 요청으로 봅니다.
+        파일 하나의 설명은 문장이 끝나거나 DESCRIPTION_MAX_CHARS를 넘으면, 묶음은 JSON 배열이
+        닫히면 연결을 끊어 서버의 생성을 멈춥니다. 요청별 생성 시간은 metrics에 기록합니다.
+        """
+        import requests
+
+        files = max(1, len(names or []))
+        options = {"num_predict": self.num_predict * files + (16 if files > 1 else 0)}
+        if files == 1:
+            options["stop"] = ["\n\n"]
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False
+            "stream": True,
+            "keep_alive": self.keep_alive,
+            "options": options
         }
+        tokens = estimate_tokens(prompt) + options["num_predict"] + CONTEXT_MARGIN_TOKENS
 
-        try:
-            response = requests.post(self.api_url, json=payload, timeout=30)
+        tried: set[str] = set()
+        while True:
+            timeout = self.request_timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.time())
+                if timeout <= 0:
+                    return None, ""
+            backend = self.backends.acquire(timeout, tried)
+            if backend is None:
+                return None, ""
+            tried.add(backend.name)
+            if self.num_ctx_max > 0:
+                options["num_ctx"] = self._context_size(backend, tokens)
+
+            started = time.monotonic()
+            try:
+                result, first_token, stopped = self._read_stream(backend, payload, files, started + timeout)
+            except (requests.RequestException, json.JSONDecodeError, TimeoutError):
+                # 연속으로 실패하거나 제한 시간을 넘기면 브레이커가 열려 그 백엔드에는 요청하지 않음
+                backend.breaker.record_failure()
+                self.backends.release(backend, False)
+                continue
+            finished = time.monotonic()
+            backend.breaker.record_success()
+            self.backends.release(backend, True)
+            load_shedder.observe_latency(finished - started)
+            self.metrics.append({
+                "files": names or [],
+                "backend": backend.name,
+                "ttft": None if first_token is None else round(first_token - started, 3),
+                "total": round(finished - started, 3),
+                "chars": len(result),
+                "stopped": stopped,
+            })
+            return result, backend.name
+
+    def _read_stream(self, backend: OllamaBackend, payload: dict, files: int,
+                     end: float) -> tuple[str, float | None, str]:
+        """스트리밍 응답을 읽어 (응답 문자열, 첫 토큰 시각, 멈춘 이유)를 반환합니다.
+        멈춘 이유는 "done"(서버가 끝냄), "sentence"(문장 끝), "limit"(최대 길이 초과), "json"(배열 완성)입니다.
+        end(time.monotonic() 기준)가 지나면 TimeoutError를 발생시킵니다.
+        """
+        parts: list[str] = []
+        first_token = None
+        max_chars = files * (DESCRIPTION_MAX_CHARS + 8) + 32
+        with self.session.post(backend.api_url, json=payload, stream=True,
+                               timeout=max(0.001, end - time.monotonic())) as response:
             response.raise_for_status()
+            for line in response.iter_lines():
+                if time.monotonic() > end:
+                    raise TimeoutError("응답 제한 시간을 넘었습니다.")
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                token = chunk.get("response", "")
+                if token:
+                    if first_token is None:
+                        first_token = time.monotonic()
+                    parts.append(token)
+                if chunk.get("done"):
+                    return "".join(parts), first_token, "done"
+                if not token:
+                    continue
+                text = "".join(parts)
+                if files == 1:
+                    cut = description_cut(text)
+                    if cut is not None:
+                        # 응답을 닫으면 연결이 끊겨 서버가 생성을 멈추고 자리를 비움
+                        stopped = "limit" if len(text) > DESCRIPTION_MAX_CHARS and cut == len(text) else "sentence"
+                        return text[:cut].strip(), first_token, stopped
+                elif "]" in token and parse_batch_response(text, files) is not None:
+                    return text, first_token, "json"
+                elif len(text) > max_chars:
+                    return text, first_token, "limit"
+        return "".join(parts), first_token, "done"
+
+    def generation_metrics(self) -> dict:
+        """최근 요청의 첫 토큰 시간(ttft)과 전체 생성 시간 (진단용)"""
+        records = list(self.metrics)
+        ttfts = [record["ttft"] for record in records if record["ttft"] is not None]
+        return {
+            "count": len(records),
+            "ttft_avg": round(sum(ttfts) / len(ttfts), 3) if ttfts else None,
+            "total_avg": round(sum(record["total"] for record in records) / len(records), 3) if records else None,
+            "stopped": {reason: sum(1 for record in records if record["stopped"] == reason)
+                        for reason in ("done", "sentence", "limit", "json")},
+            "recent": records[-100:],
+        }
+
+    def _limit(self, response: str | None) -> str:
+        if response is None or len(response) > DESCRIPTION_MAX_CHARS:
+            return ''
+        return response
+
+    def generate(self, prompt: str, deadline: float | None = None) -> str:
+        """/api/generate를 호출하여 설명을 받습니다. 실패하거나 설명이 너무 길면 빈 문자열을 반환합니다."""
+        response, _ = self._request(prompt, deadline)
+        return self._limit(response)
+
+    def _submit_batch(self, items: list[BatchItem]) -> None:
+        self._executor.submit(self._describe_batch, items)
+
+    def _describe_one(self, item: BatchItem) -> None:
+        try:
+            response, backend = self._request(self.build_prompt(item.content), item.deadline, [item.name])
+            set_future_result(item.future, self._limit(response), backend)
+        finally:
+            set_future_result(item.future, "")
+
+    def _describe_batch(self, items: list[BatchItem]) -> None:
+        """묶음 하나를 요청하고 응답을 파일별로 나누어 Future에 설정합니다.
+        응답을 JSON 배열로 해석하지 못하면 파일마다 따로 다시 요청합니다.
+        """
+        if len(items) == 1:
+            self._describe_one(items[0])
+            return
+        retry = False
+        try:
+            deadlines = [item.deadline for item in items if item.deadline is not None]
+            response, backend = self._request(build_batch_prompt(items), min(deadlines) if deadlines else None,
+                                              [item.name for item in items])
+            if response is None:
+                return
+            answers = parse_batch_response(response, len(items))
+            if answers is None:
+                retry = True
+                for item in items:
+                    self._executor.submit(self._describe_one, item)
+                return
+            for item, answer in zip(items, answers):
+                set_future_result(item.future, self._limit(answer), backend)
+        finally:
+            # 실패한 경우 설명 없이 완료 처리 (이미 완료된 Future는 무시됨)
+            if not retry:
+                for item in items:
+                    set_future_result(item.future, "")
+
+    def describe_file_with_requests(self, file_path: str,
+                                    text: str | None = None,
+                                    stat_result: os.stat_result | None = None,
+                                    deadline: float | None = None) -> str:
+        """파일 설명을 생성합니다.
+        stat_result를 지정하면 파일을 다시 읽지 않고 이미 읽어 둔 text를 사용합니다.
+        """
+        return self.submit_description(file_path, text, stat_result, deadline).result()
+
+    def submit_description(self, file_path: str,
+                           text: str | None = None,
+                           stat_result: os.stat_result | None = None,
+                           deadline: float | None = None,
+                           content: str | None = None) -> Future:
+        """파일 설명 생성을 요청 스레드 풀에 제출하고 Future[str]을 반환합니다.
+        응답한 백엔드 이름은 Future의 backend 속성에 기록됩니다.
+        백엔드별 maxConcurrency개의 요청이 연결 풀을 공유하며 동시에 실행되므로
+        호출한 쪽은 결과를 기다리지 않고 다음 파일을 분석할 수 있습니다.
+        batchFileTokens 이하의 작은 파일은 다른 파일과 묶어서 한 번에 요청합니다.
+        프롬프트는 호출한 스레드에서 만들므로 파일 버퍼를 닫은 뒤에도 안전합니다.
+        content를 지정하면 file_content()로 이미 만든 내용을 그대로 사용합니다.
+        """
+        if not self.is_connectable:
+            future: Future = Future()
+            future.set_result("")
+            return future
+        if content is not None:
+            file_content = content
+        elif stat_result is None:
+            file_content = self.read_file(file_path)
+        else:
+            file_content = self.file_content(file_path, text, stat_result)
+
+        self._ensure_pool()
+        if self.batch_max_files > 1 and estimate_tokens(file_content) <= self.batch_file_tokens:
+            return self._batcher.add(os.path.basename(file_path), file_content, deadline)
+        future = Future()
+        self._executor.submit(self._describe_one,
+                              BatchItem(os.path.basename(file_path), file_content, future, deadline))
+        return future
 
-            result = response.json()
-            if len(result.get('response')) > 100:
-                return ''
-            return result.get('response', '응답을 받지 못했습니다.')
 
-        except requests.RequestException:
-            return ""
-        except json.JSONDecodeError:
-            return ""
+_descriptor: OllamaFileDescriptor | None = None
+_descriptor_lock = threading.Lock()
 
 
-descriptor = OllamaFileDescriptor()
+def get_descriptor() -> OllamaFileDescriptor:
+    """파일 설명 생성기를 반환합니다.
+    처음 호출할 때 ollama.toml을 읽어 만들며, 이후에는 같은 생성기를 반환합니다.
+    """
+    global _descriptor
+    if _descriptor is None:
+        with _descriptor_lock:
+            if _descriptor is None:
+                _descriptor = OllamaFileDescriptor()
+    return _descriptor
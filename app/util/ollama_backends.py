@@ -0,0 +1,119 @@
+"""Ollama 백엔드 부하 분산 모듈
+여러 Ollama 서버에 설명 요청을 나누어 보냅니다.
+
+- 요청은 (실행 중인 요청 수 / weight)가 가장 작은 백엔드로 보냅니다.
+- 백엔드마다 maxConcurrency개까지만 동시에 요청합니다. 모두 차 있으면 자리가 날 때까지 기다립니다.
+- 백엔드마다 서킷 브레이커로 상태를 관리하며, 열린 백엔드에는 요청하지 않습니다.
+"""
+import threading
+import time
+
+from app.util.circuit_breaker import CircuitBreaker
+
+
+class OllamaBackend:
+    """Ollama 백엔드 하나"""
+
+    def __init__(self, name: str, base_url: str, weight: float, max_concurrency: int,
+                 breaker: CircuitBreaker) -> None:
+        """
+        초기화
+        Args:
+            name: 진단용 이름 (설명 출처에 기록)
+            base_url: api URL
+            weight: 부하 분산 가중치. 클수록 많은 요청을 받습니다.
+            max_concurrency: 동시에 보낼 최대 요청 수
+            breaker: 백엔드 상태를 관리할 서킷 브레이커
+        """
+        self.name = name
+        self.base_url = base_url
+        self.api_url = f"{base_url}/api/generate"
+        self.weight = weight if weight > 0 else 1.0
+        self.max_concurrency = max(1, max_concurrency)
+        self.breaker = breaker
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        # 마지막으로 요청한 num_ctx (0이면 아직 요청하지 않음)
+        self.num_ctx = 0
+
+    @property
+    def load(self) -> float:
+        return self.in_flight / self.weight
+
+    def stats(self) -> dict:
+        return {"name": self.name, "apiBase": self.base_url, "weight": self.weight,
+                "maxConcurrency": self.max_concurrency, "inFlight": self.in_flight,
+                "completed": self.completed, "failed": self.failed, "numCtx": self.num_ctx,
+                "state": self.breaker.state.value}
+
+
+class BackendPool:
+    """백엔드 선택기"""
+
+    def __init__(self, backends: list[OllamaBackend]) -> None:
+        if not backends:
+            raise ValueError("Ollama 백엔드가 없습니다.")
+        self.backends = backends
+        self._condition = threading.Condition()
+
+    @property
+    def capacity(self) -> int:
+        """모든 백엔드의 동시 요청 수 합"""
+        return sum(backend.max_concurrency for backend in self.backends)
+
+    def _pick(self, exclude: set[str]) -> OllamaBackend | None:
+        candidates = [backend for backend in self.backends
+                      if backend.name not in exclude and backend.breaker.allow()
+                      and backend.in_flight < backend.max_concurrency]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda backend: backend.load)
+
+    def _available(self, exclude: set[str]) -> bool:
+        """exclude를 뺀 백엔드 중 요청할 수 있는(닫힌 브레이커) 백엔드가 있는지 반환합니다."""
+        return any(backend.name not in exclude and backend.breaker.allow() for backend in self.backends)
+
+    def acquire(self, timeout: float | None, exclude: set[str] | None = None) -> OllamaBackend | None:
+        """요청을 보낼 백엔드를 골라 실행 중 요청 수를 늘리고 반환합니다.
+        모든 백엔드가 maxConcurrency만큼 요청 중이면 timeout초까지 기다립니다.
+        사용할 수 있는 백엔드가 없거나 시간이 지나면 None을 반환합니다.
+        반환받은 백엔드는 release()로 돌려주어야 합니다.
+        """
+        exclude = exclude or set()
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                backend = self._pick(exclude)
+                if backend is not None:
+                    backend.in_flight += 1
+                    return backend
+                if not self._available(exclude):
+                    return None
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def release(self, backend: OllamaBackend, success: bool) -> None:
+        """acquire()로 받은 백엔드를 돌려주고 결과를 기록합니다."""
+        with self._condition:
+            backend.in_flight -= 1
+            if success:
+                backend.completed += 1
+            else:
+                backend.failed += 1
+            self._condition.notify_all()
+
+    def wake(self) -> None:
+        """백엔드 상태가 바뀌었을 때 기다리는 요청을 깨웁니다."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def needs_probe(self) -> list[OllamaBackend]:
+        """상태 확인이 필요한 백엔드를 반환합니다. (CircuitBreaker.try_acquire_probe 참고)"""
+        return [backend for backend in self.backends if backend.breaker.try_acquire_probe()]
+
+    def allow(self) -> bool:
+        """요청할 수 있는 백엔드가 하나라도 있는지 반환합니다."""
+        return self._available(set())
@@ -0,0 +1,126 @@
+"""Ollama 설명 요청 묶음 처리 모듈
+작은 파일 여러 개를 하나의 프롬프트로 묶어 JSON 배열로 설명을 받습니다.
+고정 지시문을 파일마다 반복해서 보내지 않으므로 LLM 호출 수가 크게 줄어듭니다.
+
+- 묶음은 토큰 예산(max_tokens)이나 파일 수(max_files)를 넘기 전에 보냅니다.
+- 묶음이 차지 않아도 첫 파일이 들어온 뒤 linger 초가 지나면 보냅니다.
+"""
+import json
+import threading
+from concurrent.futures import Future, InvalidStateError
+from typing import Callable, NamedTuple
+
+from app.parser.file_digest import estimate_tokens
+
+
+def set_future_result(future: Future, result: str, backend: str = "") -> None:
+    """Future에 결과를 설정합니다. 이미 취소되었거나 완료된 경우는 무시합니다.
+    backend를 지정하면 응답한 백엔드 이름을 future.backend에 기록합니다. (진단용)
+    """
+    if future.done():
+        return
+    if backend:
+        future.backend = backend
+    try:
+        future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class BatchItem(NamedTuple):
+    """묶음에 들어가는 파일 하나"""
+    name: str
+    content: str
+    future: Future
+    deadline: float | None
+
+
+def build_batch_prompt(items: list[BatchItem]) -> str:
+    """여러 파일의 설명을 JSON 배열로 요청하는 프롬프트를 만듭니다."""
+    sections = "\n".join(f"### {n}. {item.name}\n'''\n{item.content}\n'''\n"
+                         for n, item in enumerate(items, start=1))
+    return f"""
+{sections}
+위 {len(items)}개 파일 각각이 어떤 파일인지 한글 15자 이내로 설명만 작성. 개조식 문장으로 작성. 마지막에 "입니다" 빼.
+결과는 파일 순서대로 {len(items)}개의 문자열을 담은 JSON 배열로만 출력.
+"""
+
+
+def parse_batch_response(response: str, count: int) -> list[str] | None:
+    """묶음 응답에서 JSON 배열을 찾아 설명 목록을 반환합니다.
+    배열을 찾지 못했거나 개수가 맞지 않으면 None을 반환합니다.
+    """
+    start = response.find("[")
+    end = response.rfind("]")
+    if start == -1 or end < start:
+        return None
+    try:
+        answers = json.loads(response[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(answers, list) or len(answers) != count:
+        return None
+    return [answer.strip() if isinstance(answer, str) else "" for answer in answers]
+
+
+class DescriptionBatcher:
+    """설명 요청 묶음 생성기
+    add()로 들어온 파일을 모아 두었다가 묶음이 차거나 linger 초가 지나면 flush 함수에 넘깁니다.
+    flush 함수는 바로 반환해야 하며(요청 스레드 풀에 제출 등), 모든 Future에 결과를 설정해야 합니다.
+    """
+
+    def __init__(self, flush: Callable[[list[BatchItem]], None],
+                 max_tokens: int, max_files: int, linger: float) -> None:
+        """
+        초기화
+        Args:
+            flush: 묶음을 처리할 함수
+            max_tokens: 묶음 하나의 파일 내용 토큰 예산
+            max_files: 묶음 하나의 최대 파일 수
+            linger: 묶음이 차지 않았을 때 기다리는 시간 (초)
+        """
+        self.flush = flush
+        self.max_tokens = max_tokens
+        self.max_files = max_files
+        self.linger = linger
+        self._lock = threading.Lock()
+        self._items: list[BatchItem] = []
+        self._tokens = 0
+        self._generation = 0
+        self._timer: threading.Timer | None = None
+
+    def add(self, name: str, content: str, deadline: float | None = None) -> Future:
+        """파일을 묶음에 추가하고 설명을 받을 Future[str]을 반환합니다."""
+        future: Future = Future()
+        tokens = estimate_tokens(content)
+        ready = []
+        with self._lock:
+            if self._items and self._tokens + tokens > self.max_tokens:
+                ready.append(self._take())
+            self._items.append(BatchItem(name, content, future, deadline))
+            self._tokens += tokens
+            if len(self._items) >= self.max_files or self._tokens >= self.max_tokens:
+                ready.append(self._take())
+            elif len(self._items) == 1:
+                self._timer = threading.Timer(self.linger, self._on_timer, (self._generation,))
+                self._timer.daemon = True
+                self._timer.start()
+        for items in ready:
+            self.flush(items)
+        return future
+
+    def _take(self) -> list[BatchItem]:
+        items, self._items = self._items, []
+        self._tokens = 0
+        self._generation += 1
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return items
+
+    def _on_timer(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation or not self._items:
+                return
+            items = self._take()
+        self.flush(items)
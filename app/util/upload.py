@@ -0,0 +1,116 @@
+"""업로드 파일 저장 모듈
+multipart 본문은 python-multipart가 먼저 임시 파일(SpooledTemporaryFile)에 받아 두므로,
+save_upload_file()은 그 임시 파일을 청크 단위로 작업 폴더에 복사합니다.
+크기 제한은 UploadSizeLimitMiddleware가 본문을 받는 동안 적용하여 임시 파일이 제한을 넘어 커지지 않게 합니다.
+"""
+import hashlib
+import json
+
+import anyio
+from fastapi import UploadFile
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class UploadTooLargeError(Exception):
+    """업로드 파일이 허용 크기를 초과한 경우 발생하는 예외"""
+
+
+async def save_upload_file(file: UploadFile,
+                           destination: str,
+                           chunk_size: int,
+                           max_size: int,
+                           hash_algorithm: str | None = None) -> tuple[int, str | None]:
+    """업로드 파일 저장 함수
+    python-multipart가 받아 둔 업로드 파일을 고정 크기 청크 단위로 읽어 destination 경로에 기록합니다.
+    파일 전체를 메모리에 올리지 않으며, 필요한 경우 저장하는 동안 해시를 함께 계산합니다.
+    요청 본문의 크기 제한은 UploadSizeLimitMiddleware가 먼저 적용하며, 여기서는 파일 크기를 다시 확인합니다.
+
+    Args:
+        file (UploadFile): 업로드된 파일.
+        destination (str): 저장할 파일 경로.
+        chunk_size (int): 한 번에 읽을 청크 크기 (바이트 단위).
+        max_size (int): 허용하는 최대 파일 크기 (바이트 단위).
+        hash_algorithm (str | None): hashlib 알고리즘 이름. None 또는 빈 문자열이면 계산하지 않습니다.
+
+    Returns:
+        tuple[int, str | None]: (저장된 바이트 수, 16진수 해시 문자열 또는 None)
+
+    Raises:
+        UploadTooLargeError: 저장 중 max_size를 초과한 경우
+    """
+    hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+    written = 0
+
+    async with await anyio.open_file(destination, "wb") as buffer:
+        while chunk := await file.read(chunk_size):
+            written += len(chunk)
+            if written > max_size:
+                raise UploadTooLargeError(
+                    f"업로드 파일이 허용 크기({max_size} bytes)를 초과했습니다.")
+            if hasher is not None:
+                hasher.update(chunk)
+            await buffer.write(chunk)
+
+    return written, hasher.hexdigest() if hasher is not None else None
+
+
+class UploadSizeLimitMiddleware:
+    """업로드 크기 제한 미들웨어
+    Content-Length 헤더가 max_size를 넘는 요청은 본문을 읽기 전에 거절하고,
+    Content-Length가 없는 요청(chunked 전송)은 본문을 받는 동안 크기를 세어 max_size를 넘으면
+    더 받지 않고 413을 반환합니다.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int) -> None:
+        self.app = app
+        self.max_size = max_size
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": f"업로드 크기 제한({self.max_size} bytes)을 초과했습니다."},
+                          ensure_ascii=False).encode()
+        await send({"type": "http.response.start", "status": 413,
+                    "headers": [(b"content-type", b"application/json"),
+                                (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_size:
+            await self._reject(send)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            if exceeded:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    # 본문을 더 받지 않고 연결이 끊긴 것처럼 처리하여 파싱을 멈춤
+                    exceeded = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal started
+            if exceeded:
+                return              # 제한을 넘은 뒤 앱이 보내는 응답 대신 413을 보냄
+            started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not exceeded:
+                raise
+        if exceeded and not started:
+            await self._reject(send)
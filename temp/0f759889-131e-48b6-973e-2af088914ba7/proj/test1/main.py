@@ -0,0 +1,5 @@
+"""module test1"""
+import os
+
+def f():
+    return 1
@@ -0,0 +1,2 @@
+// cfg
+int a=1;
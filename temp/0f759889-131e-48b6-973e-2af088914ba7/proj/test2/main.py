@@ -0,0 +1,5 @@
+"""module test2"""
+import os
+
+def f():
+    return 1
@@ -0,0 +1,5 @@
+"""module test3"""
+import os
+
+def f():
+    return 1
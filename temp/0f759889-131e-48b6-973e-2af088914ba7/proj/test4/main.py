@@ -0,0 +1,5 @@
+"""module test4"""
+import os
+
+def f():
+    return 1
@@ -0,0 +1,78 @@
+"""테스트용 ASGI 요청 함수
+TestClient(httpx 필요) 대신 ASGI 앱을 직접 호출하여 응답을 모읍니다.
+"""
+import json
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import anyio
+
+BOUNDARY = "sps-test-boundary"
+
+
+@dataclass
+class AsgiResponse:
+    """ASGI 응답 (헤더 이름은 소문자)"""
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def multipart(filename: str, data: bytes, field: str = "file") -> tuple[bytes, str]:
+    """파일 하나를 담은 multipart/form-data 본문과 Content-Type을 만듭니다."""
+    body = (f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"{field}\"; filename=\"{filename}\"\r\n"
+            f"Content-Type: application/zip\r\n\r\n").encode() + data + f"\r\n--{BOUNDARY}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def request(app, method: str, path: str, body: bytes | Iterable[bytes] = b"",
+            headers: dict[str, str] | None = None) -> AsgiResponse:
+    """ASGI 앱에 요청을 보내고 응답을 반환합니다.
+    body가 bytes이면 Content-Length를 붙여 한 번에 보내고, bytes 목록이면 Content-Length 없이 나누어 보냅니다.
+    """
+    return anyio.run(request_async, app, method, path, body, headers)
+
+
+async def request_async(app, method: str, path: str, body: bytes | Iterable[bytes] = b"",
+                        headers: dict[str, str] | None = None, received: list | None = None) -> AsgiResponse:
+    """request의 비동기 버전. received를 주면 앱이 받아 간 본문 청크를 기록합니다."""
+    header_list = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+    if isinstance(body, bytes):
+        chunks = [body]
+        header_list.append((b"content-length", str(len(body)).encode()))
+    else:
+        chunks = list(body)
+    messages = [{"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+                for index, chunk in enumerate(chunks)] or [{"type": "http.request", "body": b""}]
+    path, _, query = path.partition("?")
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "method": method, "path": path,
+             "raw_path": path.encode(), "root_path": "", "scheme": "http", "query_string": query.encode(),
+             "http_version": "1.1", "server": ("test", 80), "client": ("test", 1), "headers": header_list}
+
+    status_code, response_headers, content = 0, {}, bytearray()
+    response_done = anyio.Event()
+    if received is None:
+        received = []
+
+    async def receive() -> dict:
+        if len(received) < len(messages):
+            received.append(messages[len(received)])
+            return received[-1]
+        await response_done.wait()      # 응답을 다 보낸 뒤에 연결 종료를 알림
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            response_headers.update((key.decode().lower(), value.decode()) for key, value in message["headers"])
+        elif message["type"] == "http.response.body":
+            content.extend(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(scope, receive, send)
+    return AsgiResponse(status_code, response_headers, bytes(content))
@@ -0,0 +1,75 @@
+"""파일 분석 결과 캐시 테스트"""
+import sqlite3
+import tempfile
+import time
+
+from ..app.parser.analysis_cache import AnalysisCache
+
+
+def test_analysis_cache():
+    """AnalysisCache의 저장/조회, LRU 삭제, 적중 횟수를 테스트합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AnalysisCache(directory, max_entries=2)
+
+        assert cache.get('a') is None
+        cache.put('a', '10', '설명 A')
+        cache.put('b', '20', '설명 B')
+        assert cache.get('a') == ('10', '설명 A')
+
+        # 'b'가 가장 오래 사용하지 않은 항목이므로 삭제되어야 함
+        cache.put('c', '30', '설명 C')
+        assert cache.get('b') is None
+        assert cache.get('a') == ('10', '설명 A')
+        assert cache.get('c') == ('30', '설명 C')
+
+        stats = cache.stats()
+        print(stats)
+        assert stats == {'hits': 3, 'misses': 2, 'entries': 2}
+
+        # 다른 인스턴스(다른 작업자)에서도 같은 결과를 공유
+        other = AnalysisCache(directory)
+        assert other.get('c') == ('30', '설명 C')
+        other.close()
+        cache.close()
+
+    # 조회는 다른 연결이 쓰기 잠금을 잡고 있어도 기다리지 않음
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AnalysisCache(directory)
+        cache.put('a', '10', '설명 A')
+        writer = sqlite3.connect(cache.path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        started = time.monotonic()
+        assert cache.get('a') == ('10', '설명 A')
+        assert time.monotonic() - started < 1
+        writer.rollback()
+        writer.close()
+        cache.close()
+
+    # 디렉토리를 지정하지 않으면 캐시를 사용하지 않음
+    disabled = AnalysisCache('')
+    disabled.put('a', '1', 'x')
+    assert disabled.get('a') is None
+
+
+def test_analysis_cache_eviction():
+    """항목 수가 max_entries를 넘을 때만 여유분까지 한 번에 삭제하는지 테스트합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = AnalysisCache(directory, max_entries=200)
+        for index in range(200):
+            cache.put(f'k{index}', '1', '설명')
+        cache.put('k0', '2', '설명')             # 같은 키를 다시 저장해도 항목 수는 그대로
+        assert cache.stats()['entries'] == 200
+
+        # 200개를 넘으면 가장 오래된 항목부터 1%(2개)를 더 삭제
+        cache.put('new', '1', '설명')
+        stats = cache.stats()
+        print(stats)
+        assert stats['entries'] == 198
+        assert cache.get('k1') is None and cache.get('k3') is None
+        assert cache.get('k0') == ('2', '설명') and cache.get('new') == ('1', '설명')
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_analysis_cache()
+    test_analysis_cache_eviction()
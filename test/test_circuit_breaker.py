@@ -0,0 +1,44 @@
+"""서킷 브레이커 테스트"""
+import time
+
+from ..app.util.circuit_breaker import BreakerState, CircuitBreaker
+
+
+def test_circuit_breaker():
+    """연속 실패 시 열리고, 상태 확인이 성공하면 다시 닫히는지 테스트합니다."""
+    breaker = CircuitBreaker(failure_threshold=2, probe_interval=0.05)
+
+    # 처음에는 상태 확인이 필요하며 동시에 하나만 허용
+    assert breaker.state is BreakerState.UNKNOWN
+    assert not breaker.allow()
+    assert breaker.try_acquire_probe()
+    assert not breaker.try_acquire_probe()
+    assert not breaker.wait_known(0.01)         # 첫 상태 확인이 끝나지 않음
+    breaker.record_success()
+    assert breaker.wait_known(0)
+    assert breaker.allow()
+
+    # 연속 실패가 failure_threshold번이 되면 열림
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow()
+
+    # probe_interval이 지나기 전에는 상태 확인을 하지 않음
+    assert not breaker.try_acquire_probe()
+    time.sleep(0.06)
+    assert breaker.try_acquire_probe()
+    breaker.record_failure(probe=True)
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.try_acquire_probe()
+
+    time.sleep(0.06)
+    assert breaker.try_acquire_probe()
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow()
+
+
+if __name__ == "__main__":
+    test_circuit_breaker()
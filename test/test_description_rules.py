@@ -0,0 +1,61 @@
+"""규칙 기반 파일 설명 테스트"""
+from ..app.parser.description_rules import RuleContext, describe_by_rules, is_binary
+from ..app.schema.filedata import FileType
+
+
+def _context(filename: str, filetype: FileType = FileType.UNKNOWN, lines=None,
+             binary: bool = False, header_comment: str = "", size: int = 100) -> RuleContext:
+    extension = "." + filename.rsplit(".", 1)[1].lower() if "." in filename else ""
+    return RuleContext(filename, extension, filetype, size, lines, binary, header_comment)
+
+
+def test_describe_by_rules():
+    """파일 이름, 확장자, 파일 종류, 헤더 주석 규칙을 테스트합니다."""
+    cases = [
+        (_context("project.yaml", FileType.CONF, ["device: A\n"]), "SPS 프로젝트 정의 파일"),
+        (_context("package-lock.json", FileType.CONF, ["{}\n"]), "npm 의존성 잠금 파일"),
+        (_context("jquery.min.js", FileType.SOURCE, ["!function(){}\n"]), "압축된 JavaScript 라이브러리"),
+        (_context("Main.csproj", FileType.PROJECT, ["<Project/>\n"]), "C# 프로젝트 파일"),
+        (_context("native.dll", FileType.EXECUTION, binary=True), "동적 링크 라이브러리"),
+        (_context("logo.png", FileType.IMAGE, binary=True), "PNG 이미지"),
+        (_context("table.xyz", binary=True), "XYZ 바이너리 데이터"),
+        (_context("empty.py", FileType.SOURCE, [], size=0), "빈 파일"),
+        (_context("uart.c", FileType.SOURCE, ["/**\n"],
+                  header_comment="@file uart.c\n@brief UART 드라이버\n@author kim"), "UART 드라이버"),
+        (_context("main.py", FileType.SOURCE, ['"""\n'],
+                  header_comment="-*- coding: utf-8 -*-\n설정 파일 로더"), "설정 파일 로더"),
+        (_context("main.py", FileType.SOURCE, ["#\n"],
+                  header_comment="Copyright (c) 2020 ACME\nLicensed under the Apache License"), None),
+        (_context("main.py", FileType.SOURCE, ['"""\n'], header_comment="x" * 100), None),
+        # 전처리기 지시문, 작성자 줄, 코드처럼 보이는 줄은 설명으로 쓰지 않음
+        (_context("main.c", FileType.SOURCE, ["#include <stdio.h>\n"],
+                  header_comment="include <stdio.h>\ninclude <stdlib.h>"), None),
+        (_context("uart.h", FileType.SOURCE, ["#pragma once\n"], header_comment="pragma once"), None),
+        (_context("uart.h", FileType.SOURCE, ["#ifndef X_H\n"], header_comment="ifndef X_H\ndefine X_H"), None),
+        (_context("conf.h", FileType.SOURCE, ["#define FOO 1\n"], header_comment="define FOO 1"), None),
+        (_context("run.py", FileType.SOURCE, ["#!/usr/bin/env python\n"],
+                  header_comment="!/usr/bin/env python\nCreated by kim"), None),
+        (_context("main.c", FileType.SOURCE, ["// main.c\n"], header_comment="main.c"), None),
+        (_context("gpio.c", FileType.SOURCE, ["/**\n"],
+                  header_comment="Copyright (c) 2020 ACME\n@brief GPIO 제어"), "GPIO 제어"),
+        # CP949 등 UTF-8이 아닌 텍스트(lines None)는 바이너리로 보지 않음
+        (_context("legacy.c", FileType.SOURCE), None),
+    ]
+    for context, expected in cases:
+        result = describe_by_rules(context)
+        print(context.filename, result)
+        assert result == expected, (context.filename, result)
+
+    # 규칙 목록을 직접 지정할 수 있음
+    assert describe_by_rules(_context("logo.png", FileType.IMAGE), [lambda c: "사용자 규칙"]) == "사용자 규칙"
+
+
+def test_is_binary():
+    """NUL 바이트로 바이너리 파일을 판단하는지 테스트합니다."""
+    assert is_binary(b"\x89PNG\r\n\x1a\n\x00\x00")
+    assert not is_binary("한글 소스".encode("cp949"))
+
+
+if __name__ == "__main__":
+    test_describe_by_rules()
+    test_is_binary()
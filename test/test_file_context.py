@@ -0,0 +1,84 @@
+"""파일 분석 컨텍스트 테스트"""
+import hashlib
+import os
+import tempfile
+
+from ..app.parser.file_context import FileContext
+
+
+def test_file_context():
+    """FileContext가 텍스트 모드 readlines()와 같은 결과를 주는지 테스트합니다."""
+    test_cases = [
+        ('LF', b'int a;\nint b;\n'),
+        ('CRLF', b'int a;\r\nint b;\r\n'),
+        ('CR', b'int a;\rint b;'),
+        ('No trailing newline', b'int a;\nint b;'),
+        ('Empty file', b''),
+        ('Korean UTF-8', '# 한글 주석\nx = 1\n'.encode('utf-8')),
+    ]
+
+    for name, content in test_cases:
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+        try:
+            with open(temp_path, 'r', encoding='utf-8') as f:
+                expected_lines = f.readlines()
+
+            # 작은 파일(bytes)과 큰 파일(mmap) 경로를 모두 확인
+            for threshold in (1 << 30, 1):
+                with FileContext(temp_path, mmap_threshold=threshold) as ctx:
+                    print(f"{name} (mmap_threshold={threshold})")
+                    assert ctx.lines == expected_lines
+                    assert hashlib.sha256(ctx.data).hexdigest() == hashlib.sha256(content).hexdigest()
+        finally:
+            os.unlink(temp_path)
+
+    # UTF-8이 아닌 파일은 text/lines가 None
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+        f.write('# 한글'.encode('cp949'))
+        temp_path = f.name
+    try:
+        with FileContext(temp_path) as ctx:
+            assert ctx.text is None
+            assert ctx.lines is None
+            assert ctx.data == '# 한글'.encode('cp949')
+    finally:
+        os.unlink(temp_path)
+
+
+def test_head_lines():
+    """큰 파일은 앞부분만 디코딩하고, 잘린 마지막 줄과 멀티바이트 문자를 포함하지 않는지 테스트합니다."""
+    content = ('/* 센서 모듈 */\r\n' + '// 한글 주석 줄\n' * 2000).encode('utf-8')
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+        f.write(content)
+        temp_path = f.name
+    try:
+        with FileContext(temp_path, head_size=100) as ctx:
+            head = ctx.head_lines
+            print(head)
+            assert head[0] == '/* 센서 모듈 */\n'
+            assert all(line == '// 한글 주석 줄\n' for line in head[1:])
+            assert ctx._text is None                # 파일 전체는 디코딩하지 않음
+            assert ctx.lines[:len(head)] == head
+
+        # 작은 파일은 lines와 같음
+        with FileContext(temp_path, head_size=len(content)) as ctx:
+            assert ctx.head_lines == ctx.lines
+    finally:
+        os.unlink(temp_path)
+
+    # 앞부분이 UTF-8이 아니면 None
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+        f.write('# 한글\n'.encode('cp949') * 100)
+        temp_path = f.name
+    try:
+        with FileContext(temp_path, head_size=16) as ctx:
+            assert ctx.head_lines is None
+    finally:
+        os.unlink(temp_path)
+
+
+if __name__ == "__main__":
+    test_file_context()
+    test_head_lines()
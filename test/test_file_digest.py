@@ -0,0 +1,37 @@
+"""파일 요약 테스트"""
+from ..app.parser.file_digest import build_file_digest, estimate_tokens
+
+
+def test_build_file_digest():
+    """토큰 예산을 넘는 파일을 헤더 주석, import, 선언 위주로 요약하는지 테스트합니다."""
+    small = '"""설정 로더"""\nimport os\n'
+    assert build_file_digest(small, 1024) == small
+    assert build_file_digest(small * 1000, 0) == small * 1000
+
+    body = '\n'.join(f'    value_{n} = compute({n})' for n in range(2000))
+    source = (
+        '"""센서 데이터 수집 모듈"""\n'
+        'import os\n'
+        'from typing import List\n'
+        + '\n' * 20 +
+        'class SensorReader:\n'
+        '    def read(self, channel: int) -> List[int]:\n'
+        + body + '\n'
+        '        if channel < 0:\n'
+        '            raise ValueError("bad channel")\n'
+        'def main():\n'
+    )
+    digest = build_file_digest(source, 256)
+    print(digest)
+
+    assert estimate_tokens(digest) <= 256 + 8
+    assert '센서 데이터 수집 모듈' in digest
+    assert 'from typing import List' in digest
+    assert 'class SensorReader:' in digest
+    assert 'def main():' in digest
+    assert 'raise ValueError' not in digest
+    assert 'value_1999' not in digest
+
+
+if __name__ == "__main__":
+    test_build_file_digest()
@@ -0,0 +1,35 @@
+"""해시 계산 테스트"""
+import hashlib
+import os
+import tempfile
+
+from ..app.util.hashing import hash_data, hash_file
+
+
+def test_hash_file():
+    """hash_file/hash_data가 hashlib과 같은 digest를 한 번에 계산하는지 테스트합니다."""
+    test_cases = [
+        ('Empty file', b''),
+        ('Small file', b'int main() { return 0; }\n'),
+        ('Multi chunk', os.urandom(10000)),
+    ]
+
+    for name, content in test_cases:
+        expected = {'md5': hashlib.md5(content).hexdigest(),
+                    'sha256': hashlib.sha256(content).hexdigest()}
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+        try:
+            # readinto 버퍼 경로와 mmap 경로를 모두 확인
+            for threshold in (1 << 30, 1):
+                print(f"{name} (mmap_threshold={threshold})")
+                assert hash_file(temp_path, ['MD5', 'sha256'], 4096, threshold) == expected
+            assert hash_data(content, ['md5', 'SHA256'], 4096) == expected
+            assert hash_file(temp_path, ['md5', 'MD5']) == {'md5': expected['md5']}
+        finally:
+            os.unlink(temp_path)
+
+
+if __name__ == "__main__":
+    test_hash_file()
@@ -0,0 +1,113 @@
+"""이미지 헤더 해상도 테스트"""
+import io
+import os
+import struct
+import tempfile
+import zlib
+
+from PIL import Image
+
+from ..app.parser.image_details import _MODE_TO_BPP, get_image_details, probe_image
+
+
+def _encode(mode: str, size: tuple[int, int], fmt: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def _png(depth: int, color_type: int, size: tuple[int, int] = (3, 2)) -> bytes:
+    """Pillow로 저장할 수 없는 PNG(16비트 RGB 등)를 직접 만듭니다."""
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    channels = {0: 1, 2: 3, 4: 2, 6: 4}[color_type]
+    row = 1 + (size[0] * channels * depth + 7) // 8
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", *size, depth, color_type, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(b"\x00" * row * size[1])) + chunk(b"IEND", b""))
+
+
+def _bmp_bitfields(masks: tuple[int, int, int, int], size: tuple[int, int] = (3, 2)) -> bytes:
+    """BITMAPV4HEADER를 사용하는 32비트 BITFIELDS BMP를 만듭니다."""
+    pixels = b"\x00" * size[0] * size[1] * 4
+    header = struct.pack("<IiiHHIIiiII4I", 108, *size, 1, 32, 3, len(pixels), 0, 0, 0, 0, *masks) + b"\x00" * 52
+    return b"BM" + struct.pack("<IHHI", 14 + len(header) + len(pixels), 0, 0, 14 + len(header)) + header + pixels
+
+
+def test_probe_image():
+    """헤더에서 읽은 해상도와 색상 비트가 Pillow와 같은지 테스트합니다."""
+    cases = [
+        ("RGB", "PNG", {}), ("RGBA", "PNG", {}), ("P", "PNG", {}), ("L", "PNG", {}), ("1", "PNG", {}),
+        ("RGB", "JPEG", {}), ("L", "JPEG", {}), ("CMYK", "JPEG", {}),
+        ("RGB", "JPEG", {"progressive": True, "exif": b"Exif\x00\x00" + b"\x00" * 2000}),
+        ("P", "GIF", {}), ("RGB", "BMP", {}), ("P", "BMP", {}), ("1", "BMP", {}),
+        ("RGB", "WEBP", {}), ("RGBA", "WEBP", {"lossless": True}), ("RGB", "WEBP", {"lossless": True}),
+        ("RGBA", "ICO", {"sizes": [(16, 16), (48, 48)]}),
+        ("RGB", "TIFF", {}), ("L", "TIFF", {}), ("RGBA", "TIFF", {"compression": "tiff_lzw"}),
+    ]
+    samples = []
+    for mode, fmt, params in cases:
+        size = (48, 48) if fmt == "ICO" else (123, 45)
+        samples.append(((mode, fmt), _encode(mode, size, fmt, **params)))
+    # Pillow 모드와 채널 비트가 다른 경우 (16비트 채널, LA, 32비트 BMP)
+    samples += [
+        (("I;16", "PNG"), _encode("I;16", (123, 45), "PNG")), (("LA", "PNG"), _encode("LA", (123, 45), "PNG")),
+        (("RGB;16", "PNG"), _png(16, 2)), (("LA;16", "PNG"), _png(16, 4)), (("RGBA;16", "PNG"), _png(16, 6)),
+        (("RGBA", "BMP"), _encode("RGBA", (123, 45), "BMP")),
+        (("BGRA", "BMP"), _bmp_bitfields((0xFF0000, 0xFF00, 0xFF, 0xFF000000))),
+        (("BGRX", "BMP"), _bmp_bitfields((0xFF0000, 0xFF00, 0xFF, 0))),
+    ]
+    for case, data in samples:
+        with Image.open(io.BytesIO(data)) as img:
+            expected = img.size, _MODE_TO_BPP.get(img.mode, 0)
+        print(case, probe_image(data), expected)
+        assert probe_image(data) == expected, case
+
+    # 잘린 파일, 이미지가 아닌 파일은 예외 없이 None
+    assert probe_image(_encode("RGB", (10, 10), "PNG")[:20]) is None
+    assert probe_image(_encode("RGB", (10, 10), "JPEG")[:30]) is None
+    assert probe_image(b"") is None
+    assert probe_image(b"not an image") is None
+
+
+def test_probe_svg():
+    """SVG 루트 요소의 width, height 속성과 viewBox를 읽는지 테스트합니다."""
+    cases = [
+        (b'<svg xmlns="http://www.w3.org/2000/svg" width="120" height="80"/>', ((120, 80), 0)),
+        (b'<?xml version="1.0"?>\n<!-- <svg width="1"> -->\n<svg width="2in" height="96pt">', ((192, 128), 0)),
+        (b"<svg width='100%' height='100%' viewBox='0 0 640, 480'>", ((640, 480), 0)),
+        (b'<svg:svg xmlns:svg="http://www.w3.org/2000/svg" viewBox="0 0 24 24">', ((24, 24), 0)),
+        (b'<svg width="100%">', None),
+    ]
+    for data, expected in cases:
+        print(data, probe_image(data))
+        assert probe_image(data) == expected, data
+
+
+def test_get_image_details():
+    """파일 경로로 읽기, Pillow 대체, 읽을 수 없는 파일을 테스트합니다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        png = os.path.join(tmp, "a.png")
+        with open(png, "wb") as f:
+            f.write(_encode("RGBA", (7, 9), "PNG"))
+        assert get_image_details(png) == ((7, 9), 32)
+
+        # 헤더로 읽지 않는 형식은 Pillow로 읽음
+        ppm = os.path.join(tmp, "a.ppm")
+        with open(ppm, "wb") as f:
+            f.write(_encode("RGB", (5, 6), "PPM"))
+        assert get_image_details(ppm) == ((5, 6), 24)
+
+        broken = os.path.join(tmp, "broken.psd")
+        with open(broken, "wb") as f:
+            f.write(b"8BPS")
+        empty = os.path.join(tmp, "empty.raw")
+        open(empty, "wb").close()
+        assert get_image_details(broken) is None
+        assert get_image_details(empty) is None
+
+
+if __name__ == "__main__":
+    test_probe_image()
+    test_probe_svg()
+    test_get_image_details()
@@ -0,0 +1,52 @@
+"""앱 import 시간 테스트
+python -X importtime으로 app.app을 import하여 무거운 모듈을 미리 불러오지 않는지,
+import 시간이 예산 안에 있는지 확인합니다.
+"""
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 처음 사용할 때 import해야 하는 모듈 (최상위 패키지 이름)
+LAZY_MODULES = {"PIL", "yaml", "requests", "urllib3"}
+# app 패키지 모듈 자체의 import 시간 합 (마이크로초, 외부 패키지 제외)
+APP_SELF_BUDGET_US = 150_000
+# app.app 전체 import 시간 (마이크로초, FastAPI 등 외부 패키지 포함)
+TOTAL_BUDGET_US = 3_000_000
+
+
+def _import_app() -> tuple[dict[str, tuple[int, int]], str]:
+    """새 인터프리터에서 app.app을 import하고 ({모듈: (자체 시간, 누적 시간)}, 표준 출력)을 반환합니다."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import app.app, app.util.ollama as o; print(o._descriptor is None)"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules, result.stdout.strip()
+
+
+def test_import_time():
+    """무거운 모듈과 싱글톤을 import 시점에 만들지 않고, import 시간이 예산 안인지 테스트합니다."""
+    modules, descriptor_not_created = _import_app()
+
+    loaded = sorted({name.split(".")[0] for name in modules} & LAZY_MODULES)
+    print("미리 불러온 모듈:", loaded)
+    assert not loaded, loaded
+    # Ollama 설명 생성기(설정 파일 읽기, 서버 연결)는 처음 사용할 때 생성
+    assert descriptor_not_created == "True"
+
+    app_self = sum(self_us for name, (self_us, _) in modules.items() if name == "app" or name.startswith("app."))
+    total = modules["app.app"][1]
+    print(f"app 모듈 {app_self / 1000:.1f}ms, 전체 {total / 1000:.1f}ms")
+    assert app_self <= APP_SELF_BUDGET_US, app_self
+    assert total <= TOTAL_BUDGET_US, total
+
+
+if __name__ == "__main__":
+    test_import_time()
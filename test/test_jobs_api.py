@@ -0,0 +1,129 @@
+"""비동기 작업 API(/jobs) 테스트"""
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from ..app import app as app_module
+from .asgi_client import multipart, request
+
+# app 코드가 실제로 사용하는 모듈 (app 코드는 app 패키지를 절대 경로로 import)
+ollama_module = sys.modules[app_module.get_descriptor.__module__]
+status_module = sys.modules[app_module.cleanup_expired_jobs.__module__]
+JobStage, JobStatus = status_module.JobStage, status_module.JobStatus
+
+PROJECT_YAML = """project:
+  device: HDEV-001
+  version: 1.0.0
+  partnumber: Q2350911516
+  checksum_type: MD5
+  csu:
+    - csu: Test1 (D-AAA-SFR-001)
+      dir: test1
+"""
+
+
+def _project_zip() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("project.yaml", PROJECT_YAML)
+        archive.writestr("test1/main.py", '"""진입점"""\nprint("hello")\n')
+        archive.writestr("test1/sub/x.c", "/* 센서 드라이버 */\nint x;\n")
+    return buffer.getvalue()
+
+
+def _write_status(target: str, stage: JobStage, updated_at: float, finished_at: float | None = None) -> None:
+    os.makedirs(target)
+    status = JobStatus(job_id=os.path.basename(target), stage=stage, created_at=updated_at,
+                       updated_at=updated_at, finished_at=finished_at)
+    with open(os.path.join(target, status_module.STATUS_FILENAME), "w", encoding="utf-8") as f:
+        f.write(status.model_dump_json())
+
+
+def test_jobs_api():
+    """작업 제출, 상태 조회, 결과 다운로드, 완료 작업 정리를 테스트합니다."""
+    saved_temp_dir, saved_descriptor = app_module.DEFAULT_TEMP_DIR, ollama_module._descriptor
+    saved_max_entries = app_module.analysis_cache.max_entries
+    # Ollama를 사용할 수 없는 상태로 실행 (설명은 헤더 주석 사용)
+    descriptor = ollama_module.OllamaFileDescriptor()
+    breaker = ollama_module.CircuitBreaker(failure_threshold=1, probe_interval=60)
+    descriptor.backends = ollama_module.BackendPool(
+        [ollama_module.OllamaBackend("closed", "http://127.0.0.1:1", 1, 1, breaker)])
+    ollama_module._descriptor = descriptor
+    app_module.analysis_cache.max_entries = 0
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            app_module.DEFAULT_TEMP_DIR = directory
+            api = app_module.api
+
+            body, content_type = multipart("proj.zip", _project_zip())
+            response = request(api, "POST", "/jobs", body, {"Content-Type": content_type})
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+
+            deadline = time.monotonic() + 30
+            while True:
+                status = request(api, "GET", f"/jobs/{job_id}").json()
+                if status["stage"] in ("done", "failed") or time.monotonic() > deadline:
+                    break
+                time.sleep(0.05)
+            print(status)
+            assert status["stage"] == "done" and status["result"] == "proj.hwpx"
+            assert status["total_files"] == status["processed_files"] == 2
+            assert status["finished_at"] is not None
+
+            response = request(api, "GET", f"/jobs/{job_id}/result")
+            assert response.status_code == 200
+            assert zipfile.ZipFile(io.BytesIO(response.content)).read("Contents/section0.xml")
+            assert request(api, "GET", f"/jobs/{job_id}/result?draft=true").status_code == 409
+
+            assert request(api, "GET", "/jobs/not-a-job").status_code == 404
+            assert request(api, "GET", "/jobs/00000000-0000-0000-0000-000000000000").status_code == 404
+
+            # 보관 시간이 지난 완료 작업은 삭제
+            assert app_module.cleanup_expired_jobs(directory, 3600) == []
+            assert app_module.cleanup_expired_jobs(directory, 0) == [os.path.join(directory, job_id)]
+            assert request(api, "GET", f"/jobs/{job_id}").status_code == 404
+    finally:
+        app_module.DEFAULT_TEMP_DIR, ollama_module._descriptor = saved_temp_dir, saved_descriptor
+        app_module.analysis_cache.max_entries = saved_max_entries
+
+
+def test_stale_jobs():
+    """끝나지 않고 상태가 갱신되지 않는 작업과 작업자가 죽은 작업을 실패로 기록하는지 테스트합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        now = time.time()
+        stale = os.path.join(directory, "stale")
+        running = os.path.join(directory, "running")
+        _write_status(stale, JobStage.ANALYZING, now - 120)
+        _write_status(running, JobStage.ANALYZING, now)
+
+        # 상태가 stale_timeout 동안 갱신되지 않은 작업만 실패로 기록하고, 이후 ttl이 지나면 삭제
+        assert app_module.cleanup_expired_jobs(directory, 3600, stale_timeout=60) == []
+        status = app_module.read_job_status(stale)
+        print(status)
+        assert status.stage is JobStage.FAILED and status.finished_at is not None and status.error
+        assert app_module.read_job_status(running).finished_at is None
+        assert app_module.cleanup_expired_jobs(directory, 0, stale_timeout=60) == [stale]
+
+        # 작업자 프로세스가 죽어 작업이 직접 기록하지 못한 경우
+        future: Future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        app_module._record_job_crash(running, future)
+        status = app_module.read_job_status(running)
+        assert status.stage is JobStage.FAILED and "worker died" in status.error
+
+        # 이미 끝난 작업은 그대로 둠
+        done = os.path.join(directory, "done")
+        _write_status(done, JobStage.DONE, now, finished_at=now)
+        app_module._record_job_crash(done, future)
+        assert app_module.read_job_status(done).stage is JobStage.DONE
+
+
+if __name__ == "__main__":
+    test_jobs_api()
+    test_stale_jobs()
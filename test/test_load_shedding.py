@@ -0,0 +1,41 @@
+"""설명 생성 부하 조절 테스트"""
+import time
+
+from ..app.util.load_shedding import DegradationLevel, LoadShedder
+
+
+def test_load_shedder():
+    """대기열 길이와 응답 시간에 따라 단계가 오르내리는지 테스트합니다."""
+    depth = 0
+    shedder = LoadShedder(queue_reduce=4, queue_shed=8, latency_reduce=10, latency_shed=20,
+                          recover_ratio=0.5, latency_alpha=1.0, latency_stale_after=0.05)
+    shedder.queue_depth = lambda: depth
+
+    assert shedder.level() is DegradationLevel.NORMAL
+
+    # 대기열 길이로 상향, 기준의 recover_ratio배 아래로 내려가야 하향
+    depth = 8
+    assert shedder.level() is DegradationLevel.SHED
+    depth = 5
+    assert shedder.level() is DegradationLevel.SHED
+    depth = 3
+    assert shedder.level() is DegradationLevel.REDUCED
+    depth = 1
+    assert shedder.level() is DegradationLevel.NORMAL
+
+    # 응답 시간으로 상향, 오래된 응답 시간은 무시
+    shedder.observe_latency(12)
+    assert shedder.level() is DegradationLevel.REDUCED
+    time.sleep(0.06)
+    assert shedder.latency == 0.0
+    assert shedder.level() is DegradationLevel.NORMAL
+
+    # 기준이 0이면 사용하지 않음
+    disabled = LoadShedder(0, 0, 0, 0)
+    disabled.queue_depth = lambda: 100
+    disabled.observe_latency(100)
+    assert disabled.level() is DegradationLevel.NORMAL
+
+
+if __name__ == "__main__":
+    test_load_shedder()
@@ -1,7 +1,13 @@
 """간단한 LOC 측정 테스트 러너"""
+import io
+import random
 import tempfile
+import time
 import os
-from ..app.parser.code_counter import count_code_lines
+from ..app.parser.code_counter import count_code_lines, count_code_lines_in_bytes, count_code_lines_in_lines
+
+# 바이트 LOC 측정 처리량 목표 (MB/s). 개발 환경에서 약 33MB/s (줄 목록 측정은 디코딩 제외 약 21MB/s)
+LOC_THROUGHPUT_TARGET_MBPS = 10
 
 
 def create_test_file(content):
@@ -146,5 +152,55 @@ int main() {
         return 1
 
 
+def _count_text(text: str) -> int:
+    """텍스트 모드로 읽은 것과 같이 줄을 나누어 count_code_lines_in_lines()로 셉니다."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return count_code_lines_in_lines(io.StringIO(text).readlines())
+
+
+def test_bytes_same_as_lines():
+    """UTF-8 입력에서 바이트 측정 결과가 줄 목록 측정 결과와 같은지 테스트합니다."""
+    pieces = ["/*", "*/", '"""', "'''", "//", "#", "int a;", "x", " ", "\t", "\n", "\n", "\r\n", "\r",
+              "\u3000", "\xa0", "\x85", "\x1c", "한글", "\ufeff", "=", "/", "*"]
+    rng = random.Random(1)
+    for _ in range(20000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+        assert count_code_lines_in_bytes(text.encode("utf-8")) == _count_text(text), repr(text)
+        assert count_code_lines_in_bytes(memoryview(text.encode("utf-8"))) == _count_text(text), repr(text)
+
+
+def test_bytes_cp949():
+    """CP949 소스도 UTF-8 소스와 같은 LOC를 세는지 테스트합니다."""
+    text = "/* 한글 주석\n   두 번째 줄 */\nint 값 = 0; // 설명\n\n# 전처리\nprintf(\"안녕\");\n"
+    print(count_code_lines_in_bytes(text.encode("cp949")))
+    assert count_code_lines_in_bytes(text.encode("cp949")) == _count_text(text) == 2
+    # CP949에서 C2 A0은 공백이 아닌 한글 한 글자
+    assert count_code_lines_in_bytes(b"\xc2\xa0\n" + "한글".encode("cp949")) == 2
+    assert count_code_lines_in_bytes("\xa0\n한글".encode("utf-8")) == 1
+
+
+def test_bytes_throughput():
+    """바이트 LOC 측정 처리량이 목표 이상인지 테스트합니다. (이 저장소의 app 소스를 4MB 정도로 반복하여 측정)"""
+    app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+    source = b""
+    for root, _, files in os.walk(app_dir):
+        for name in sorted(files):
+            if name.endswith(".py"):
+                with open(os.path.join(root, name), "rb") as f:
+                    source += f.read()
+    source *= max(1, 4 * 1024 * 1024 // len(source))
+
+    started = time.perf_counter()
+    count = count_code_lines_in_bytes(source)
+    elapsed = time.perf_counter() - started
+    throughput = len(source) / 1024 / 1024 / elapsed
+    print(f"{len(source) / 1024 / 1024:.1f}MB, {count}줄, {throughput:.1f}MB/s")
+    assert count == _count_text(source.decode("utf-8"))
+    assert throughput >= LOC_THROUGHPUT_TARGET_MBPS, throughput
+
+
 if __name__ == "__main__":
-    test_main()
\ No newline at end of file
+    test_main()
+    test_bytes_same_as_lines()
+    test_bytes_cp949()
+    test_bytes_throughput()
\ No newline at end of file
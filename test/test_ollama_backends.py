@@ -0,0 +1,137 @@
+"""Ollama 백엔드 부하 분산 테스트"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..app.util.circuit_breaker import CircuitBreaker
+from ..app.util.ollama import OllamaFileDescriptor, request_processes
+from ..app.util.ollama_backends import BackendPool, OllamaBackend
+
+
+def _backend(name: str, weight: float, max_concurrency: int, base_url: str = "http://127.0.0.1:1") -> OllamaBackend:
+    breaker = CircuitBreaker(failure_threshold=1, probe_interval=60)
+    breaker.record_success()
+    return OllamaBackend(name, base_url, weight, max_concurrency, breaker)
+
+
+def test_backend_pool():
+    """가중치 기준으로 한가한 백엔드를 고르고, 동시 요청 수 제한과 열린 브레이커를 지키는지 테스트합니다."""
+    big, small = _backend("big", 2, 2), _backend("small", 1, 1)
+    pool = BackendPool([big, small])
+    assert pool.capacity == 3
+
+    picked = [pool.acquire(0) for _ in range(3)]
+    print([backend.name for backend in picked])
+    assert [backend.name for backend in picked] == ["big", "small", "big"]
+    assert pool.acquire(0.01) is None           # 모두 maxConcurrency만큼 요청 중
+
+    pool.release(picked[1], True)
+    assert pool.acquire(0, exclude={"small"}) is None
+    assert pool.acquire(0).name == "small"
+
+    # 열린 브레이커의 백엔드는 고르지 않으며, 쓸 수 있는 백엔드가 없으면 기다리지 않음
+    for backend in picked:
+        pool.release(backend, False)
+    small.breaker.record_failure()
+    assert pool.acquire(0).name == "big"
+    big.breaker.record_failure()
+    assert not pool.allow()
+    assert pool.acquire(None) is None
+
+
+def test_process_concurrency():
+    """프로세스 풀로 요청할 때 maxConcurrency를 요청 프로세스 수로 나누는지 테스트합니다."""
+    assert request_processes("thread", 2, "thread", 4) == 1
+    assert request_processes("process", 2, "thread", 4) == 2
+    assert request_processes("thread", 2, "process", 4) == 8
+    assert request_processes("process", 2, "process", 1) == 2
+
+    descriptor = OllamaFileDescriptor()
+    descriptor.processes = 4
+    config = {"backends": [{"name": "big", "apiBase": "http://big:11434", "maxConcurrency": 8},
+                           {"name": "small", "apiBase": "http://small:11434", "maxConcurrency": 2},
+                           {"name": "default", "apiBase": "http://default:11434"}]}
+    backends = descriptor._load_backends(config, num_parallel=4)
+    print([(backend.name, backend.max_concurrency) for backend in backends])
+    assert [backend.max_concurrency for backend in backends] == [2, 1, 1]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    status = 200
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"response": f"{self.server.server_port} 응답"}).encode()
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _FailingHandler(_StubHandler):
+    status = 500
+
+
+def test_failover():
+    """요청이 실패한 백엔드 대신 다른 백엔드가 응답하고, 응답한 백엔드가 기록되는지 테스트합니다."""
+    servers = [ThreadingHTTPServer(("127.0.0.1", 0), handler) for handler in (_FailingHandler, _StubHandler)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        failing, healthy = [_backend(name, weight, 1, f"http://127.0.0.1:{server.server_port}")
+                            for name, weight, server in zip(("failing", "healthy"), (10, 1), servers)]
+        descriptor = OllamaFileDescriptor()
+        descriptor.backends = BackendPool([failing, healthy])
+
+        response, backend = descriptor._request("프롬프트")
+        print(response, backend)
+        assert backend == "healthy"
+        assert response == f"{servers[1].server_port} 응답"
+        assert failing.failed == 1 and not failing.breaker.allow()
+        assert healthy.completed == 1
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+class _SlowProbeHandler(_StubHandler):
+    def do_GET(self):
+        time.sleep(0.2)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def test_first_probe_wait():
+    """첫 상태 확인이 진행 중일 때 다른 호출자도 결과를 기다려 True를 받는지 테스트합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowProbeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=60)
+        backend = OllamaBackend("slow", f"http://127.0.0.1:{server.server_port}", 1, 1, breaker)
+        descriptor = OllamaFileDescriptor()
+        descriptor.backends = BackendPool([backend])
+
+        # 작업 시작 시 준비(warmup)와 파일 분석이 동시에 처음 확인하는 경우
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(descriptor.is_connectable)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(results)
+        assert results == [True] * 4
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_backend_pool()
+    test_process_concurrency()
+    test_failover()
+    test_first_probe_wait()
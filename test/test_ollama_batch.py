@@ -0,0 +1,50 @@
+"""Ollama 설명 요청 묶음 처리 테스트"""
+from concurrent.futures import Future
+
+from ..app.util.ollama_batch import (BatchItem, DescriptionBatcher, build_batch_prompt,
+                                     parse_batch_response)
+
+
+def test_parse_batch_response():
+    """묶음 응답에서 JSON 배열을 찾아 파일 수와 맞는지 확인하는지 테스트합니다."""
+    items = [BatchItem(name, '{}', Future(), None) for name in ('a.json', 'b.py')]
+    prompt = build_batch_prompt(items)
+    assert '### 1. a.json' in prompt and '### 2. b.py' in prompt
+
+    assert parse_batch_response('["설정 파일", " 메인 모듈 "]', 2) == ['설정 파일', '메인 모듈']
+    assert parse_batch_response('결과:\n```json\n["a", "b"]\n```', 2) == ['a', 'b']
+    assert parse_batch_response('["a"]', 2) is None
+    assert parse_batch_response('설명할 수 없습니다', 1) is None
+    assert parse_batch_response('[a, b]', 2) is None
+
+
+def test_description_batcher():
+    """DescriptionBatcher가 토큰 예산, 파일 수, 대기 시간에 따라 묶음을 나누는지 테스트합니다."""
+    batches = []
+
+    def flush(items):
+        batches.append([item.name for item in items])
+        for item in items:
+            item.future.set_result(item.name)
+
+    batcher = DescriptionBatcher(flush, max_tokens=100, max_files=3, linger=0.05)
+
+    # 파일 수가 max_files가 되면 바로 보냄
+    futures = [batcher.add(f'f{n}', 'x' * 4) for n in range(3)]
+    assert batches == [['f0', 'f1', 'f2']]
+    assert [future.result(0) for future in futures] == ['f0', 'f1', 'f2']
+
+    # 토큰 예산을 넘기 전에 보냄
+    batcher.add('big1', 'x' * 240)
+    batcher.add('big2', 'x' * 240)
+    assert batches[-1] == ['big1']
+
+    # 묶음이 차지 않아도 linger 후 보냄
+    future = batcher.add('small', 'x')
+    assert future.result(1) == 'small'
+    assert batches[-1] == ['big2', 'small']
+
+
+if __name__ == "__main__":
+    test_parse_batch_response()
+    test_description_batcher()
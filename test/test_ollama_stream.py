@@ -0,0 +1,174 @@
+"""Ollama 스트리밍 응답 조기 종료 테스트"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..app.util.circuit_breaker import CircuitBreaker
+from ..app.util.ollama import OllamaFileDescriptor, context_size, description_cut
+from ..app.util.ollama_backends import BackendPool, OllamaBackend
+
+
+def test_description_cut():
+    """문장 끝이나 최대 길이에서 응답을 자르는지 테스트합니다."""
+    cases = [
+        ("  ", None),
+        ("\n설정", None),                     # 앞쪽 빈 줄은 무시
+        ("\n설정 파일\n추가", 6),
+        ("UART 드라이버. 이 파일은", 10),
+        ("app.py 설정", None),                # 파일 이름의 마침표는 문장 끝이 아님
+        ("설명입니다!", None),               # 다음 글자를 받기 전에는 문장 끝인지 알 수 없음
+        ("설명입니다! ", 6),
+        ("main.", None),
+        ("x" * 101, 101),
+    ]
+    for text, expected in cases:
+        print(repr(text), description_cut(text))
+        assert description_cut(text) == expected, text
+
+
+def test_context_size():
+    """num_ctx를 최솟값부터 두 배씩 늘리고 최댓값을 넘지 않는지 테스트합니다."""
+    assert context_size(0, 2048, 8192) == 2048
+    assert context_size(2048, 2048, 8192) == 2048
+    assert context_size(2049, 2048, 8192) == 4096
+    assert context_size(100000, 2048, 8192) == 8192
+
+
+def test_description_cut_tokens():
+    """토큰을 하나씩 받을 때 파일 이름 중간의 마침표에서 자르지 않는지 테스트합니다."""
+    text = ""
+    for token in ["main", ".", "py", " 진입점", "입니다", ".", " 이", " 파일은"]:
+        text += token
+        cut = description_cut(text)
+        if cut is not None:
+            break
+    print(repr(text), cut)
+    assert text[:cut] == "main.py 진입점입니다."
+
+
+class _StreamHandler(BaseHTTPRequestHandler):
+    tokens = ["설정", " 파일", "을 읽는", " 모듈입니다.", " 이 파일은", " 계속"] + [" 계속"] * 50
+    requests: list[dict] = []
+    sent: list[int] = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        _StreamHandler.requests.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        sent = 0
+        try:
+            for token in self.tokens:
+                self.wfile.write(json.dumps({"response": token, "done": False}).encode() + b"\n")
+                self.wfile.flush()
+                sent += 1
+            self.wfile.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+        except OSError:
+            pass
+        _StreamHandler.sent.append(sent)
+
+
+def test_stream_early_stop():
+    """문장이 끝나면 스트리밍을 멈추고, 옵션과 생성 시간이 기록되는지 테스트합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=60)
+        breaker.record_success()
+        backend = OllamaBackend("stub", f"http://127.0.0.1:{server.server_port}", 1, 1, breaker)
+        descriptor = OllamaFileDescriptor()
+        descriptor.backends = BackendPool([backend])
+        descriptor.metrics.clear()
+
+        response, name = descriptor._request("프롬프트", names=["config.py"])
+        print(response, name, descriptor.generation_metrics())
+        assert (response, name) == ("설정 파일을 읽는 모듈입니다.", "stub")
+        assert backend.in_flight == 0 and backend.completed == 1
+
+        payload = _StreamHandler.requests[-1]
+        assert payload["stream"] is True
+        assert payload["options"]["num_predict"] == descriptor.num_predict
+
+        metrics = descriptor.generation_metrics()
+        assert metrics["count"] == 1 and metrics["stopped"]["sentence"] == 1
+        record = metrics["recent"][0]
+        assert record["files"] == ["config.py"] and record["ttft"] <= record["total"]
+    finally:
+        server.shutdown()
+
+
+class _FileNameStreamHandler(_StreamHandler):
+    tokens = ["main", ".", "py", " 진입점."]
+
+
+def test_stream_file_name():
+    """파일 이름의 마침표에서 멈추지 않고, 마지막 마침표는 스트림이 끝날 때 포함되는지 테스트합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FileNameStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=60)
+        breaker.record_success()
+        backend = OllamaBackend("stub", f"http://127.0.0.1:{server.server_port}", 1, 1, breaker)
+        descriptor = OllamaFileDescriptor()
+        descriptor.backends = BackendPool([backend])
+        descriptor.metrics.clear()
+
+        response, _ = descriptor._request("프롬프트", names=["main.py"])
+        print(response, descriptor.generation_metrics()["stopped"])
+        assert response == "main.py 진입점."
+        assert descriptor.generation_metrics()["stopped"]["done"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_warmup_and_context():
+    """모델 준비 요청과 요청별 num_ctx, keep_alive를 테스트합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=60)
+        breaker.record_success()
+        backend = OllamaBackend("stub", f"http://127.0.0.1:{server.server_port}", 1, 1, breaker)
+        descriptor = OllamaFileDescriptor()
+        descriptor.backends = BackendPool([backend])
+        descriptor.num_ctx_min, descriptor.num_ctx_max = 2048, 8192
+        backend.num_ctx = 8192                  # 이전 작업에서 커진 num_ctx
+
+        descriptor.warmup_enabled = False
+        descriptor.warmup()
+        assert backend.num_ctx == 8192
+        descriptor.warmup_enabled = True
+        descriptor._warmup = lambda: None       # 백그라운드 준비 요청은 아래에서 직접 실행
+        backend.in_flight = 1                   # 다른 작업이 요청 중이면 num_ctx를 줄이지 않음
+        descriptor.warmup()
+        assert backend.num_ctx == 8192
+        backend.in_flight = 0
+        descriptor.warmup()
+        assert backend.num_ctx == 0
+        del descriptor._warmup
+        descriptor._warmup()
+        payload = _StreamHandler.requests[-1]
+        print(payload)
+        assert payload["prompt"] == "" and payload["keep_alive"] == descriptor.keep_alive
+        assert payload["options"]["num_ctx"] == 2048
+
+        # 큰 프롬프트는 num_ctx를 늘리고, 작업 중에는 줄이지 않음
+        descriptor._request("가" * 3000, names=["big.c"])
+        assert _StreamHandler.requests[-1]["options"]["num_ctx"] == 4096
+        descriptor._request("작은 파일", names=["small.c"])
+        assert _StreamHandler.requests[-1]["options"]["num_ctx"] == 4096
+        assert _StreamHandler.requests[-1]["keep_alive"] == descriptor.keep_alive
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_description_cut()
+    test_description_cut_tokens()
+    test_context_size()
+    test_stream_early_stop()
+    test_stream_file_name()
+    test_warmup_and_context()
@@ -0,0 +1,31 @@
+"""병렬 파일 분석 batch 분할 테스트"""
+from ..app.parser.parser import _make_size_balanced_batches
+
+
+def test_make_size_balanced_batches():
+    """_make_size_balanced_batches 함수를 테스트합니다."""
+    jobs = [(f"job{k}",) for k in range(10)]
+    sizes = [100, 1, 1, 1, 1, 50, 50, 1, 1, 1]
+
+    batches = _make_size_balanced_batches(jobs, sizes, 3)
+    totals = [sum(sizes[order] for order, _ in batch) for batch in batches]
+    print(f"batch 크기 합: {totals}")
+
+    # 모든 작업이 한 번씩만 배정되어야 함
+    orders = sorted(order for batch in batches for order, _ in batch)
+    assert orders == list(range(10))
+
+    # 각 batch 안에서는 원래 순서가 유지되어야 함
+    for batch in batches:
+        assert [order for order, _ in batch] == sorted(order for order, _ in batch)
+        assert all(jobs[order] == args for order, args in batch)
+
+    # 가장 큰 파일(100)은 단독 batch, 나머지는 두 batch에 고르게 나뉘어야 함
+    assert sorted(totals) == [53, 54, 100]
+
+    # 작업보다 batch 수가 많으면 빈 batch 없이 작업 수만큼만 생성
+    assert len(_make_size_balanced_batches(jobs[:2], sizes[:2], 8)) == 2
+
+
+if __name__ == "__main__":
+    test_make_size_balanced_batches()
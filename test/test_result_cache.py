@@ -0,0 +1,117 @@
+"""SPS 결과 캐시 테스트"""
+import io
+import os
+import sys
+import tempfile
+import zipfile
+
+from ..app import app as app_module
+from ..app.job.result_cache import ResultCache
+from .asgi_client import multipart, request
+
+# app 코드가 실제로 사용하는 모듈 (app 코드는 app 패키지를 절대 경로로 import)
+ollama_module = sys.modules[app_module.get_descriptor.__module__]
+
+PROJECT_YAML = """project:
+  device: HDEV-001
+  version: 1.0.0
+  partnumber: Q2350911516
+  checksum_type: MD5
+  csu:
+    - csu: Test1 (D-AAA-SFR-001)
+      dir: test1
+"""
+
+
+def _write(path: str, content: bytes) -> str:
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+
+def test_result_cache():
+    """ResultCache의 저장/조회와 크기 기준 LRU 삭제를 테스트합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache(os.path.join(directory, 'results'), max_size=250)
+        assert cache.get('a') is None
+
+        path_a = cache.put('a', _write(os.path.join(directory, 'a.hwpx'), b'a' * 100))
+        path_b = cache.put('b', _write(os.path.join(directory, 'b.hwpx'), b'b' * 100))
+        os.utime(path_a, (1000, 1000))
+        os.utime(path_b, (2000, 2000))
+
+        # 'a'를 사용하면 'b'가 가장 오래 사용하지 않은 항목이 됨
+        with open(cache.get('a'), 'rb') as f:
+            assert f.read() == b'a' * 100
+
+        cache.put('c', _write(os.path.join(directory, 'c.hwpx'), b'c' * 100))
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+
+        # max_size보다 큰 파일은 저장하지 않음
+        assert cache.put('d', _write(os.path.join(directory, 'd.hwpx'), b'd' * 300)) is None
+
+
+
+def test_upload_etag():
+    """캐시에 저장하지 않은 결과(헤더 주석으로 대신한 설명)에는 결과 키 ETag를 붙이지 않고 304도 반환하지 않으며,
+    캐시에 있는 결과만 ETag와 304를 사용하는지 테스트합니다."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as f:
+        f.writestr("project.yaml", PROJECT_YAML)
+        # 헤더 주석이 길어 LLM에 설명을 요청하는 파일
+        f.writestr("test1/alpha.py", '"""alpha 모듈은 센서 값을 읽어 보정한 뒤 상위 계층으로 전달하는 역할을 담당합니다"""\n'
+                                     "def alpha(value):\n    return value * 2\n")
+    body, content_type = multipart("proj.zip", archive.getvalue())
+
+    saved = app_module.DEFAULT_TEMP_DIR, app_module.result_cache, ollama_module._descriptor
+    saved_max_entries = app_module.analysis_cache.max_entries
+    # Ollama를 사용할 수 없는 상태로 실행 (설명은 헤더 주석 사용)
+    descriptor = ollama_module.OllamaFileDescriptor()
+    breaker = ollama_module.CircuitBreaker(failure_threshold=1, probe_interval=60)
+    descriptor.backends = ollama_module.BackendPool(
+        [ollama_module.OllamaBackend("closed", "http://127.0.0.1:1", 1, 1, breaker)])
+    ollama_module._descriptor = descriptor
+    app_module.analysis_cache.max_entries = 0
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            app_module.DEFAULT_TEMP_DIR = os.path.join(directory, "temp")
+            cache = type(saved[1])(os.path.join(directory, "results"), max_size=1 << 20)
+            app_module.result_cache = cache
+
+            def upload(if_none_match: str | None = None):
+                headers = {"Content-Type": content_type}
+                if if_none_match is not None:
+                    headers["If-None-Match"] = if_none_match
+                return request(app_module.api, "POST", "/uploadfile", body, headers)
+
+            # 대체 설명을 사용한 결과는 캐시에 넣지 않으므로 결과 키를 ETag로 붙이지 않음
+            # (FileResponse가 파일 기준으로 붙이는 ETag는 그대로 둠)
+            response = upload("*")
+            print(response.status_code, response.headers)
+            zip_path = os.path.join(directory, "proj.zip")
+            with open(zip_path, "wb") as f:
+                f.write(archive.getvalue())
+            key = app_module._get_result_key(zip_path, response.headers["x-archive-digest"])
+            assert response.status_code == 200 and response.headers.get("etag") != f'"{key}"'
+            assert cache.get(key) is None
+
+            # 클라이언트가 키를 알고 있어도 캐시에 없으면 304를 반환하지 않음
+            response = upload(f'"{key}"')
+            assert response.status_code == 200 and response.headers.get("etag") != f'"{key}"'
+
+            # 캐시에 있는 결과만 ETag를 붙이고 재검증하면 304
+            cache.put(key, _write(os.path.join(directory, "cached.hwpx"), b"cached"))
+            response = upload()
+            assert response.status_code == 200 and response.content == b"cached"
+            assert response.headers["etag"] == f'"{key}"'
+            assert upload(f'W/"{key}"').status_code == 304
+    finally:
+        app_module.DEFAULT_TEMP_DIR, app_module.result_cache, ollama_module._descriptor = saved
+        app_module.analysis_cache.max_entries = saved_max_entries
+
+
+if __name__ == "__main__":
+    test_result_cache()
+    test_upload_etag()
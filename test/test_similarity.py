@@ -0,0 +1,54 @@
+"""유사 파일 색인 테스트"""
+from concurrent.futures import Future
+
+from ..app.parser.file_digest import build_file_digest
+from ..app.parser.similarity import DescriptionIndex, simhash
+
+
+def test_simhash():
+    """내용이 조금 다른 파일은 지문이 가깝고, 다른 파일은 먼지 테스트합니다."""
+    base = "\n".join(f"int value_{n} = read_sensor({n});" for n in range(200))
+    edited = base.replace("value_7 ", "value_seven ")
+    other = "\n".join(f"def handler_{n}(request): return response_{n}" for n in range(200))
+
+    assert simhash(base) == simhash(base)
+    assert (simhash(base) ^ simhash(edited)).bit_count() <= 3
+    assert (simhash(base) ^ simhash(other)).bit_count() > 3
+    print(simhash(base), simhash(edited), simhash(other))
+
+
+def test_simhash_digest():
+    """큰 파일은 LLM에 보낼 요약으로 지문을 계산하며, 비슷한 큰 파일의 요약 지문도 가까운지 테스트합니다."""
+    header = "/* 센서 값을 읽어 보정하는 모듈 */\n#include <stdio.h>\n#include \"sensor.h\"\n"
+    body = "\n".join(f"int value_{n} = read_sensor({n}) * {n % 7};" for n in range(5000))
+    big = header + body
+    edited = header + body.replace("value_4000 ", "value_four_thousand ")
+
+    digest = build_file_digest(big, 1024)
+    print(len(big), len(digest))
+    assert len(digest) < len(big) // 10
+    assert (simhash(digest) ^ simhash(build_file_digest(edited, 1024))).bit_count() <= 3
+
+
+def test_description_index():
+    """같은 파일, 비슷한 파일, 다른 확장자 파일의 설명 요청 재사용을 테스트합니다."""
+    index = DescriptionIndex(max_distance=3)
+    first: Future = Future()
+    index.add("checksum-a", ".c", 0b1011, first)
+
+    assert index.find("checksum-a", ".h", None) == (first, "exact")
+    assert index.find("checksum-b", ".c", 0b1011 ^ (1 << 40) ^ (1 << 3)) == (first, "near")
+    assert index.find("checksum-b", ".c", 0b1011 ^ 0b1111 << 20) is None
+    assert index.find("checksum-b", ".h", 0b1011) is None
+
+    # 음수이면 같은 파일만 찾음
+    exact_only = DescriptionIndex(max_distance=-1)
+    exact_only.add("checksum-a", ".c", 0b1011, first)
+    assert exact_only.find("checksum-a", ".c", None) == (first, "exact")
+    assert exact_only.find("checksum-b", ".c", 0b1011) is None
+
+
+if __name__ == "__main__":
+    test_simhash()
+    test_simhash_digest()
+    test_description_index()
@@ -0,0 +1,176 @@
+"""두 단계(초안, 설명 보강) SPS 생성 테스트"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..app.job import pipeline
+from ..app.job.status import JobProgress
+from ..app.schema.enums import JobStage
+from ..app.schema.web_api import JobStatus
+
+# 파이프라인이 실제로 사용하는 모듈 (app 코드는 app 패키지를 절대 경로로 import)
+parser = pipeline.parser
+ollama_module = sys.modules[parser.get_descriptor.__module__]
+
+PROJECT_YAML = """project:
+  device: HDEV-001
+  version: 1.0.0
+  partnumber: Q2350911516
+  checksum_type: MD5
+  csu:
+    - csu: Test1 (D-AAA-SFR-001)
+      dir: test1
+"""
+
+# 헤더 주석이 길어 규칙으로 정하지 않고 LLM에 요청하는 파일 (초안은 헤더 주석을 설명으로 사용)
+SOURCES = {
+    "alpha.py": '"""alpha 모듈은 센서 값을 읽어 보정한 뒤 상위 계층으로 전달하는 역할을 담당합니다"""\n'
+                "import os\n\n\ndef alpha(value):\n    return value * 2\n",
+    "beta.c": "/* beta 파일은 UART 수신 버퍼를 관리하고 프레임 단위로 잘라 상위 계층에 넘깁니다 */\n"
+              "static int beta_count = 0;\nint beta(void) { return beta_count++; }\n",
+    "gamma.py": '"""gamma 모듈은 설정 파일을 읽어 장치별 기본값과 합친 결과를 캐시에 저장합니다"""\n'
+                "import json\n\nCONFIG = {}\n\n\ndef gamma(path):\n    return json.load(open(path))\n",
+}
+
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    """파일 내용의 첫 단어로 설명을 만드는 Ollama 서버. fail이 True이면 설명 요청을 실패시킴"""
+    fail = False
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not payload.get("stream"):            # 모델 준비 요청
+            body = json.dumps({"response": "", "done": True}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if _OllamaHandler.fail:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        name = next(name for name in ("alpha", "beta", "gamma") if name in payload["prompt"])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for token in (name, " 처리", " 모듈"):
+            self.wfile.write(json.dumps({"response": token, "done": False}).encode() + b"\n")
+        self.wfile.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+
+
+class _RecordingProgress(JobProgress):
+    """초안이 완료된 시점의 체크섬/LOC 계산 횟수를 기록하고, 지정하면 그때부터 Ollama를 실패시킴"""
+
+    def __init__(self, target: str, status: JobStatus, calls: dict, fail_after_draft: bool) -> None:
+        super().__init__(target, status)
+        self.calls = calls
+        self.fail_after_draft = fail_after_draft
+        self.calls_at_draft: dict | None = None
+
+    def draft_done(self, draft_result: str) -> None:
+        self.calls_at_draft = dict(self.calls)
+        if self.fail_after_draft:
+            _OllamaHandler.fail = True
+        super().draft_done(draft_result)
+
+
+def _section0(path: str) -> str:
+    with zipfile.ZipFile(path) as archive:
+        return archive.read("Contents/section0.xml").decode("utf-8")
+
+
+def _run(directory: str, calls: dict, fail_after_draft: bool):
+    target = os.path.join(directory, "job" + ("-fail" if fail_after_draft else ""))
+    os.makedirs(target)
+    file_location = os.path.join(target, "proj.zip")
+    with zipfile.ZipFile(file_location, "w") as archive:
+        archive.writestr("project.yaml", PROJECT_YAML)
+        for name, text in SOURCES.items():
+            archive.writestr(f"test1/{name}", text)
+
+    now = time.time()
+    status = JobStatus(job_id="job", stage=JobStage.QUEUED, created_at=now, updated_at=now)
+    progress = _RecordingProgress(target, status, calls, fail_after_draft)
+    result = pipeline.run_sps_pipeline(file_location, target, "proj.zip", progress, draft=True)
+    return target, progress, result
+
+
+def test_two_phase():
+    """초안과 최종 hwpx가 설명만 다르고, 보강 단계는 체크섬과 LOC를 다시 계산하지 않으며,
+    보강이 실패하면 초안 설명을 그대로 사용하는지 테스트합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    calls = {"hash": 0, "loc": 0}
+    hash_data, count_lines = parser.hash_data, parser.count_code_lines_in_bytes
+
+    def counting_hash(*args, **kwargs):
+        calls["hash"] += 1
+        return hash_data(*args, **kwargs)
+
+    def counting_lines(*args, **kwargs):
+        calls["loc"] += 1
+        return count_lines(*args, **kwargs)
+
+    analysis_cache = parser.analysis_cache
+    saved_descriptor, saved_max_entries = ollama_module._descriptor, analysis_cache.max_entries
+    descriptor = ollama_module.OllamaFileDescriptor()
+    breaker = ollama_module.CircuitBreaker(failure_threshold=1, probe_interval=60)
+    descriptor.backends = ollama_module.BackendPool(
+        [ollama_module.OllamaBackend("stub", f"http://127.0.0.1:{server.server_port}", 1, 2, breaker)])
+    descriptor.parallel = descriptor.backends.capacity
+    descriptor.batch_max_files = 1
+    ollama_module._descriptor = descriptor
+    analysis_cache.max_entries = 0                  # 이전 실행의 캐시를 사용하지 않음
+    parser.hash_data, parser.count_code_lines_in_bytes = counting_hash, counting_lines
+    _OllamaHandler.fail = False
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            # 1. 보강 성공: 최종 hwpx는 헤더 주석 대신 LLM 설명만 다름
+            target, progress, result = _run(directory, calls, fail_after_draft=False)
+            draft = _section0(os.path.join(target, progress.status.draft_result))
+            final = _section0(result.output_path)
+            print(progress.status.model_dump(), result)
+            assert progress.calls_at_draft == calls == {"hash": 3, "loc": 3}
+            assert progress.status.enriched_descriptions == 3
+            assert result.fallback_descriptions == 0
+            assert draft != final
+            for name, text in SOURCES.items():
+                stem = name.split(".")[0]
+                header = text.split("\n")[0].strip('"/* ')
+                assert header in draft and f"{stem} 처리 모듈" in final
+                final = final.replace(f"{stem} 처리 모듈", header)
+            assert final == draft
+
+            # 2. 초안 이후 Ollama가 실패: 최종 hwpx는 초안과 같고, 결과 캐시에 넣지 않도록 대체 설명 수를 반환
+            calls.update(hash=0, loc=0)
+            target, progress, result = _run(directory, calls, fail_after_draft=True)
+            print(progress.status.model_dump(), result)
+            assert progress.calls_at_draft == calls == {"hash": 3, "loc": 3}
+            assert progress.status.enriched_descriptions == 0
+            assert result.fallback_descriptions == 3
+            assert _section0(result.output_path) == _section0(os.path.join(target, progress.status.draft_result))
+    finally:
+        parser.hash_data, parser.count_code_lines_in_bytes = hash_data, count_lines
+        ollama_module._descriptor, analysis_cache.max_entries = saved_descriptor, saved_max_entries
+        _OllamaHandler.fail = False
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_two_phase()
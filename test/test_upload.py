@@ -0,0 +1,65 @@
+"""업로드 크기 제한 테스트"""
+import os
+import tempfile
+
+import anyio
+from fastapi import FastAPI, File, UploadFile
+
+from ..app.util.upload import UploadSizeLimitMiddleware, save_upload_file
+from .asgi_client import multipart, request, request_async
+
+
+def _app(max_size: int, directory: str) -> FastAPI:
+    api = FastAPI()
+    api.add_middleware(UploadSizeLimitMiddleware, max_size=max_size)
+
+    @api.post("/upload")
+    async def upload(file: UploadFile = File(...)) -> dict:
+        written, digest = await save_upload_file(file, os.path.join(directory, "upload.bin"),
+                                                 1024, max_size, "sha256")
+        return {"written": written, "digest": digest}
+
+    return api
+
+
+def test_upload_size_limit():
+    """Content-Length가 있거나 없는(chunked) 요청 모두 본문을 받는 동안 크기 제한을 적용하는지 테스트합니다."""
+    with tempfile.TemporaryDirectory() as directory:
+        app = _app(4096, directory)
+
+        body, content_type = multipart("a.zip", b"x" * 1000)
+        response = request(app, "POST", "/upload", body, {"Content-Type": content_type})
+        print(response.json())
+        assert response.status_code == 200 and response.json()["written"] == 1000
+
+        # Content-Length 헤더로 바로 거절
+        body, content_type = multipart("a.zip", b"x" * 5000)
+        response = request(app, "POST", "/upload", body, {"Content-Type": content_type})
+        assert response.status_code == 413
+
+        # Content-Length 없이 나누어 보내면(chunked) 받는 동안 세어 거절
+        body, content_type = multipart("a.zip", b"x" * 20000)
+        chunks = [body[offset:offset + 1024] for offset in range(0, len(body), 1024)]
+        response = request(app, "POST", "/upload", chunks, {"Content-Type": content_type})
+        print(response.status_code, response.json())
+        assert response.status_code == 413
+
+
+def test_upload_size_limit_stops_reading():
+    """제한을 넘은 뒤에는 본문을 더 받지 않는지 테스트합니다."""
+    body, content_type = multipart("a.zip", b"x" * 20000)
+    chunks = [body[offset:offset + 1024] for offset in range(0, len(body), 1024)]
+    received = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        response = anyio.run(request_async, _app(4096, directory), "POST", "/upload", chunks,
+                             {"Content-Type": content_type}, received)
+
+    print(len(received), len(chunks), response.status_code)
+    assert response.status_code == 413
+    assert len(received) == 5           # 4096바이트를 넘은 다섯 번째 청크에서 멈춤
+
+
+if __name__ == "__main__":
+    test_upload_size_limit()
+    test_upload_size_limit_stops_reading()
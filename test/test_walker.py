@@ -0,0 +1,32 @@
+"""디렉토리 탐색 테스트"""
+import os
+import tempfile
+from pathlib import Path
+
+from ..app.parser.walker import walk_files
+
+
+def test_walk_files():
+    """walk_files가 rglob('*') + is_file()과 같은 파일을 같은 순서로 반환하는지 테스트합니다."""
+    with tempfile.TemporaryDirectory() as root:
+        for rel in ('a.py', 'b/c.c', 'b/d/e.h', 'b/f.txt', 'g/h/i.json', 'z.md'):
+            path = os.path.join(root, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(rel)
+        os.makedirs(os.path.join(root, 'empty'))
+
+        expected = [str(p) for p in Path(root).rglob('*') if p.is_file()]
+        entries = list(walk_files(root))
+        print([entry.path for entry in entries])
+
+        assert [entry.path for entry in entries] == expected
+        for entry in entries:
+            assert entry.stat().st_size == os.path.getsize(entry.path)
+
+    # 존재하지 않는 디렉토리는 빈 결과
+    assert not list(walk_files(os.path.join(root, 'missing')))
+
+
+if __name__ == "__main__":
+    test_walk_files()